@@ -0,0 +1,30 @@
+from ui_design_coordinator.tools.auto_fixers import compute_auto_fixes
+from ui_design_coordinator.tools.batch_pipeline import process_file
+
+COMPONENT = """<template>
+
+  <div>
+    <img src="logo.png">
+    <img src="divider.png" alt="">
+    <input required>
+  </div>
+</template>
+"""
+
+
+def test_missing_alt_is_reported_for_review_not_fixed():
+    result = compute_auto_fixes(COMPONENT)
+
+    assert '<img src="logo.png">' in result["modifications"]["template"]
+    assert "img_alt" not in result["applied"]
+    assert [(item["rule"], item["line"]) for item in result["review_required"]] == [("wcag.1.1.1.img-alt", 4)]
+
+
+def test_review_items_keep_the_file_flagged(tmp_path):
+    path = tmp_path / "Card.vue"
+    path.write_text(COMPONENT, encoding="utf-8")
+
+    record = process_file(str(path), ("evaluation", "fix"), dry_run=True)
+
+    assert record["fix"]["review_required"]
+    assert record["needs_review"] is True
@@ -0,0 +1,61 @@
+from types import SimpleNamespace
+
+from ui_design_coordinator.agents.design_agent import tools as design_tools
+from ui_design_coordinator.agents.evaluation_agent import agent as evaluation_agent
+
+COMPONENT = """<template>
+  <form>
+    <img src="a.png">
+    <input type="text">
+  </form>
+</template>
+"""
+
+
+def _must_not_evaluate(*args):
+    raise AssertionError("cached evaluation must be reused")
+
+
+def test_comprehensive_evaluation_shares_the_session_analysis_cache(monkeypatch):
+    tool_context = SimpleNamespace(state={})
+
+    first = evaluation_agent.comprehensive_evaluation(
+        COMPONENT, "src/components/Card.vue", detail="issues", tool_context=tool_context
+    )
+    entry = tool_context.state["_vue_artifact_analyses"]["user:vue/src/components/Card.vue"]
+    # プロセス内のストアを指すフィールドはセッションに保存しない
+    assert "evaluation_id" not in entry["results"]["evaluation"]
+    assert entry["results"]["evaluation"]["issues"] == first["issues"]
+
+    monkeypatch.setattr(evaluation_agent, "_evaluate", _must_not_evaluate)
+    summary = evaluation_agent.comprehensive_evaluation(
+        COMPONENT, "src/components/Card.vue", max_issues=1, tool_context=tool_context
+    )
+    assert summary["issues"] == first["issues"][:1]
+
+    # 全評価結果がプロセスから消えた後は evaluation_id / more を返さない
+    monkeypatch.setattr(evaluation_agent, "_evaluation_store", {})
+    summary = evaluation_agent.comprehensive_evaluation(
+        COMPONENT, "src/components/Card.vue", max_issues=1, tool_context=tool_context
+    )
+    assert "evaluation_id" not in summary and "more" not in summary
+
+
+def test_component_analysis_results_are_reused_by_comprehensive_evaluation(monkeypatch):
+    tool_context = SimpleNamespace(state={})
+    result = design_tools._analyze_evaluation(COMPONENT, "src/components/Card.vue")
+    assert "evaluation_id" not in result
+    design_tools.save_session_analysis(tool_context, "src/components/Card.vue", COMPONENT, "evaluation", result)
+
+    monkeypatch.setattr(evaluation_agent, "_evaluate", _must_not_evaluate)
+    issues = evaluation_agent.comprehensive_evaluation(
+        COMPONENT, "src/components/Card.vue", detail="issues", tool_context=tool_context
+    )
+    assert issues["issues"] == result["issues"]
+
+    # 内容が変わった場合は再計算する
+    monkeypatch.undo()
+    changed = evaluation_agent.comprehensive_evaluation(
+        COMPONENT.replace("<img", "<img alt=''"), "src/components/Card.vue", detail="issues", tool_context=tool_context
+    )
+    assert "wcag.1.1.1.img-alt" not in [issue["rule"] for issue in changed["issues"]]
@@ -0,0 +1,33 @@
+from ui_design_coordinator.tools.component_graph import ComponentGraph
+from ui_design_coordinator.tools.project_index import ProjectIndex
+
+
+def test_global_tags_resolve_lowercase_and_kebab_filenames(tmp_path):
+    components = tmp_path / "src" / "components"
+    components.mkdir(parents=True)
+    (components / "card.vue").write_text("<template><div>card</div></template>\n")
+    (components / "user-card.vue").write_text("<template><card /></template>\n")
+    (tmp_path / "src" / "App.vue").write_text("<template><UserCard /></template>\n")
+
+    graph = ComponentGraph(ProjectIndex(tmp_path), cache_path=tmp_path / "component_graph.json")
+
+    assert graph.dependencies_of("src/App.vue") == ["src/components/user-card.vue"]
+    assert graph.affected_by("src/components/card.vue") == [
+        "src/App.vue",
+        "src/components/card.vue",
+        "src/components/user-card.vue",
+    ]
+
+
+def test_native_tags_do_not_resolve_to_same_named_components(tmp_path):
+    components = tmp_path / "src" / "components"
+    components.mkdir(parents=True)
+    for name in ("Button", "Form", "Table", "Header", "Transition"):
+        (components / f"{name}.vue").write_text("<template><div /></template>\n")
+    (tmp_path / "src" / "App.vue").write_text(
+        "<template><header /><form><table /><button /></form><transition /><Button /></template>\n"
+    )
+
+    graph = ComponentGraph(ProjectIndex(tmp_path), cache_path=tmp_path / "component_graph.json")
+
+    assert graph.dependencies_of("src/App.vue") == ["src/components/Button.vue"]
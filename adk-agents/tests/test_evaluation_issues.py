@@ -0,0 +1,28 @@
+from ui_design_coordinator.agents.evaluation_agent.agent import comprehensive_evaluation
+
+COMPONENT = """<template>
+  <div class="error-box">
+    <p>inputs below</p>
+    <form>
+      <img src="a.png">
+      <input type="text">
+    </form>
+  </div>
+</template>
+<style>
+.b { font-size: 12px; }
+</style>
+"""
+
+
+def test_issue_lines_point_at_the_offending_element_or_are_omitted():
+    lines = {issue["rule"]: issue["line"] for issue in comprehensive_evaluation(COMPONENT, detail="issues")["issues"]}
+
+    assert lines["wcag.1.1.1.img-alt"] == 5
+    assert lines["wcag.3.3.2.labels"] == 6
+    assert lines["wcag.1.4.4.font-size"] == 11
+    assert lines["nielsen.error_prevention"] == 4
+    # コンポーネント全体に対する問題は、最初に "error" / "input" を含む行などを推測しない
+    assert lines["wcag.3.3.1.error-identification"] is None
+    assert lines["wcag.2.4.7.focus-visible"] is None
+    assert lines["wcag.2.1.1.keyboard"] is None
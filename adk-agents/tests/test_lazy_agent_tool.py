@@ -0,0 +1,58 @@
+import asyncio
+from typing import AsyncGenerator
+
+from google.adk import Agent
+from google.adk.models import BaseLlm, LlmRequest, LlmResponse
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+
+from ui_design_coordinator.lazy_agent_tool import LazyAgentTool
+
+
+class CallerLlm(BaseLlm):
+    """サブエージェントを1回呼んで、その結果を返すモデル"""
+
+    model: str = "caller"
+
+    async def generate_content_async(self, llm_request: LlmRequest, stream: bool = False) -> AsyncGenerator[LlmResponse, None]:
+        responses = [p.function_response for c in llm_request.contents for p in c.parts or [] if p.function_response]
+        if not responses:
+            call = types.FunctionCall(name="helper", args={"request": "hello"})
+            yield LlmResponse(content=types.Content(role="model", parts=[types.Part(function_call=call)]))
+        else:
+            yield LlmResponse(content=types.Content(role="model", parts=[types.Part(text=str(responses[0].response["result"]))]))
+
+
+class EchoLlm(BaseLlm):
+    model: str = "echo"
+
+    async def generate_content_async(self, llm_request: LlmRequest, stream: bool = False) -> AsyncGenerator[LlmResponse, None]:
+        text = llm_request.contents[-1].parts[0].text
+        yield LlmResponse(content=types.Content(role="model", parts=[types.Part(text=f"echo: {text}")]))
+
+
+async def _run(tool: LazyAgentTool) -> list:
+    agent = Agent(name="root", model=CallerLlm(), instruction="delegate", tools=[tool])
+    runner = InMemoryRunner(agent=agent, app_name="lazy_test")
+    session = await runner.session_service.create_session(app_name="lazy_test", user_id="u")
+    texts = []
+    async for event in runner.run_async(
+        user_id="u", session_id=session.id, new_message=types.Content(role="user", parts=[types.Part(text="go")])
+    ):
+        if event.author == "root":
+            texts.extend(p.text for p in (event.content.parts if event.content else []) if p.text)
+    return texts
+
+
+def test_agent_is_built_on_first_use_and_runs_as_an_agent_tool():
+    built = []
+
+    def factory():
+        built.append(True)
+        return Agent(name="helper", model=EchoLlm(), instruction="echo")
+
+    tool = LazyAgentTool(factory=factory, name="helper", description="echo helper")
+    assert not tool.is_built and built == []
+
+    assert asyncio.run(_run(tool)) == ["echo: hello"]
+    assert tool.is_built and built == [True]
@@ -0,0 +1,63 @@
+import asyncio
+import time
+from typing import AsyncGenerator
+
+from google.adk import Agent
+from google.adk.models import BaseLlm, LlmRequest, LlmResponse
+from google.adk.runners import InMemoryRunner
+from google.genai import types
+
+from ui_design_coordinator.llm_cache import RecordReplayLlm
+from ui_design_coordinator.tools.tool_cache import make_function_tool
+
+
+class ScriptedLlm(BaseLlm):
+    """measure_component を2回呼んでからテキストを返すモデル"""
+
+    model: str = "scripted"
+    calls: int = 0
+
+    async def generate_content_async(self, llm_request: LlmRequest, stream: bool = False) -> AsyncGenerator[LlmResponse, None]:
+        self.calls += 1
+        responses = sum(1 for c in llm_request.contents for p in c.parts or [] if p.function_response)
+        if responses < 2:
+            call = types.FunctionCall(name="measure_component", args={"component": "Login"})
+            yield LlmResponse(content=types.Content(role="model", parts=[types.Part(function_call=call)]))
+        else:
+            yield LlmResponse(content=types.Content(role="model", parts=[types.Part(text="done")]))
+
+
+class OfflineLlm(BaseLlm):
+    model: str = "scripted"
+
+    async def generate_content_async(self, llm_request: LlmRequest, stream: bool = False) -> AsyncGenerator[LlmResponse, None]:
+        raise AssertionError("replay must not call the model")
+        yield
+
+
+def measure_component(component: str) -> dict:
+    """処理時間を含む結果を返すツール"""
+    started = time.perf_counter()
+    return {"status": "success", "component": component, "elapsed_seconds": time.perf_counter() - started + time.time()}
+
+
+async def _run(model: BaseLlm) -> list:
+    agent = Agent(name="replay_agent", model=model, instruction="measure", tools=[make_function_tool(measure_component, memoize=True)])
+    runner = InMemoryRunner(agent=agent, app_name="replay_test")
+    session = await runner.session_service.create_session(app_name="replay_test", user_id="u")
+    texts = []
+    async for event in runner.run_async(
+        user_id="u", session_id=session.id, new_message=types.Content(role="user", parts=[types.Part(text="go")])
+    ):
+        texts.extend(p.text for p in (event.content.parts if event.content else []) if p.text)
+    return texts
+
+
+def test_replay_ignores_timing_and_tool_cache_metadata(tmp_path):
+    recorder = ScriptedLlm()
+    assert asyncio.run(_run(RecordReplayLlm(model="scripted", mode="record", store_dir=str(tmp_path), inner=recorder))) == ["done"]
+    assert recorder.calls == 3
+
+    # 2回目はツール結果がキャッシュから返り（_cache 付き）、elapsed_seconds も異なる
+    replayer = RecordReplayLlm(model="scripted", mode="replay", store_dir=str(tmp_path), inner=OfflineLlm())
+    assert asyncio.run(_run(replayer)) == ["done"]
@@ -0,0 +1,75 @@
+import asyncio
+from types import SimpleNamespace
+
+from ui_design_coordinator.agents.code_agent.agent import create_code_agent
+from ui_design_coordinator.agents.improvement_agent.agent import create_improvement_agent
+from ui_design_coordinator.tools.batch_pipeline import evaluate_components
+from ui_design_coordinator.tools.overlay_fs import get_active_overlay, overlay_scope
+from ui_design_coordinator.tools.ui_analysis_tools import analyze_vue_component
+from ui_design_coordinator.tools.vue_integration_tools import (
+    begin_virtual_edits,
+    commit_virtual_edits,
+    discard_virtual_edits,
+    modify_existing_component,
+)
+
+ORIGINAL = "<template>\n  <div>original</div>\n</template>\n"
+
+
+def _session(session_id):
+    return SimpleNamespace(session=SimpleNamespace(id=session_id))
+
+
+def test_virtual_edits_are_isolated_per_session(tmp_path):
+    path = tmp_path / "Card.vue"
+    path.write_text(ORIGINAL, encoding="utf-8")
+    first, second = _session("first"), _session("second")
+
+    begin_virtual_edits(tool_context=first)
+    begin_virtual_edits(tool_context=second)
+    try:
+        result = modify_existing_component(str(path), {"template": "<img src='a.png'>"}, tool_context=first)
+        assert result["staged"] is True
+        assert path.read_text(encoding="utf-8") == ORIGINAL
+
+        # 他のセッションの破棄・確定は影響しない
+        assert discard_virtual_edits(tool_context=second)["files_discarded"] == []
+        assert get_active_overlay("first").pending()
+        assert get_active_overlay() is None
+
+        assert commit_virtual_edits(tool_context=first)["files_written"] == [str(path)]
+        assert "a.png" in path.read_text(encoding="utf-8")
+    finally:
+        discard_virtual_edits(tool_context=first)
+        discard_virtual_edits(tool_context=second)
+
+
+def test_analysis_reads_staged_content(tmp_path):
+    path = tmp_path / "Card.vue"
+    path.write_text(ORIGINAL, encoding="utf-8")
+    session = _session("analysis")
+
+    begin_virtual_edits(tool_context=session)
+    try:
+        modify_existing_component(
+            str(path), {"template": "<div><img src='a.png'><span>x</span></div>"}, tool_context=session
+        )
+
+        # セッション外（プロセス共通のスコープ）はディスクの内容を読む
+        assert analyze_vue_component(str(path))["template_analysis"]["element_count"] == 1
+        with overlay_scope(session):
+            assert analyze_vue_component(str(path))["template_analysis"]["element_count"] == 3
+
+        result = asyncio.run(evaluate_components([str(path)], tool_context=session))
+        assert result["status"] == "success"
+        top_rules = [issue["rule"] for issue in result["components"][0]["top_issues"]]
+        assert "wcag.1.1.1.img-alt" in top_rules
+        assert path.read_text(encoding="utf-8") == ORIGINAL
+    finally:
+        discard_virtual_edits(tool_context=session)
+
+
+def test_write_agents_register_the_virtual_edit_tools():
+    for agent in (create_code_agent(), create_improvement_agent()):
+        names = {tool.name for tool in agent.tools}
+        assert {"begin_virtual_edits", "modify_existing_component", "commit_virtual_edits", "discard_virtual_edits"} <= names
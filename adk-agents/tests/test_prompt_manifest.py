@@ -0,0 +1,23 @@
+from google.adk.tools import FunctionTool
+
+from ui_design_coordinator.prompt_manifest import build_instruction, get_prompt_stats
+
+
+def lookup_component(name: str) -> dict:
+    """コンポーネントを探す"""
+    return {"name": name}
+
+
+def test_bare_references_to_known_tools_and_agents_are_checked():
+    body = (
+        "`lookup_component` で探してから `test_reviewer_agent` に渡し、`validate_vuetify_usage` で確認する。"
+        "`needs_review` と `test_caller_agent` は参照ではない。"
+    )
+    build_instruction("test_caller_agent", body, [FunctionTool(func=lookup_component)])
+    build_instruction("test_reviewer_agent", "review", [])
+
+    # 未登録の共通ツールと、呼び出せないエージェントだけが未登録の参照になる
+    assert get_prompt_stats("test_caller_agent")["unknown_tool_references"] == [
+        "test_reviewer_agent",
+        "validate_vuetify_usage",
+    ]
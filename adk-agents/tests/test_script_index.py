@@ -0,0 +1,83 @@
+from ui_design_coordinator.agents.evaluation_agent.agent import analyze_performance_indicators
+from ui_design_coordinator.tools.script_index import build_sfc_script_index
+from ui_design_coordinator.tools.ui_analysis_tools import analyze_script, extract_script_section
+
+OPTIONS_API_SFC = """<template>
+  <form @submit.prevent="save">
+    <input v-model="name" @keyup.enter="save" />
+    <button @click="reset">reset</button>
+  </form>
+</template>
+
+<script>
+export default {
+  props: { value: String },
+  emits: ['saved'],
+  data() {
+    return { name: '' }
+  },
+  computed: {
+    fullName() { return this.name },
+    upper() { return this.name.toUpperCase() }
+  },
+  watch: {
+    name(value) { this.$emit('saved', value) }
+  },
+  methods: {
+    save() {},
+    reset() {}
+  }
+}
+</script>
+"""
+
+
+def test_options_api_members_are_indexed():
+    index = build_sfc_script_index(OPTIONS_API_SFC)
+    assert index.options["computed"] == ["fullName", "upper"]
+    assert index.options["watch"] == ["name"]
+    assert index.options["methods"] == ["save", "reset"]
+    assert index.props == ["value"]
+    assert index.emits == ["saved"]
+    assert index.calls_of(("computed", "watch")) == []
+
+
+def test_options_api_counts_in_analysis():
+    script = analyze_script(extract_script_section(OPTIONS_API_SFC))
+    assert script["computed_properties"] == 2
+    assert script["watchers"] == 1
+
+    indicators = analyze_performance_indicators(OPTIONS_API_SFC)
+    assert indicators["computed_properties"] == 2
+    assert indicators["watchers"] == 1
+    # 修飾子付き（@submit.prevent / @keyup.enter）も数える
+    assert indicators["event_listeners"] == 3
+
+
+def test_composition_api_calls_are_still_recorded():
+    index = build_sfc_script_index(
+        "<script setup>\nimport { computed, watch } from 'vue'\n"
+        "const total = computed(() => 1)\nwatch(total, () => {}, { deep: true })\n</script>"
+    )
+    assert [call["name"] for call in index.calls] == ["computed", "watch"]
+    assert index.calls[0]["assigned_to"] == "total"
+    assert index.calls[1]["options"] == {"deep": True}
+
+
+def test_vue_import_aliases_are_resolved():
+    index = build_sfc_script_index(
+        "<script setup>\nimport { computed as c, ref as r } from 'vue'\nimport { computed as other } from './store'\n"
+        "const count = r(0)\nconst double = c(() => count.value * 2)\nconst third = other(() => 3)\n</script>"
+    )
+    assert [(call["name"], call["assigned_to"]) for call in index.calls] == [("ref", "count"), ("computed", "double")]
+    assert index.imports[0]["aliases"] == {"c": "computed", "r": "ref"}
+
+
+def test_every_declarator_is_recorded():
+    index = build_sfc_script_index(
+        "<script setup>\nimport { ref, reactive } from 'vue'\n"
+        "const a = ref(0), b = reactive({}), { c, d } = useThing()\n"
+        "let e = 1\nwatchSomething(e)\nconst f = x as const, g = 2\n</script>"
+    )
+    assert [d["name"] for d in index.declarations] == ["a", "b", "c", "d", "e", "f", "g"]
+    assert [(call["name"], call["assigned_to"]) for call in index.calls] == [("ref", "a"), ("reactive", "b")]
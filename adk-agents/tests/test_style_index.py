@@ -0,0 +1,21 @@
+from ui_design_coordinator.tools.style_index import build_style_index, parse_lengths
+from ui_design_coordinator.tools.ui_analysis_tools import count_css_rules
+
+
+def test_parse_lengths_units():
+    assert [(value, unit) for _, value, unit in parse_lengths("50% 10px 1.5rem calc(100% - 4px) 0")] == [
+        (50.0, "%"), (10.0, "px"), (1.5, "rem"), (100.0, "%"), (4.0, "px"), (0.0, ""),
+    ]
+
+
+def test_empty_and_nested_rules_are_counted():
+    assert count_css_rules(".a{}") == 1
+    assert count_css_rules(".a { .b {} }\n@media (min-width: 600px) { .c { color: red } }") == 3
+
+
+def test_declarations_inside_nested_media_keep_the_parent_selector():
+    index = build_style_index(".a {\n  color: red;\n  @media (min-width: 1px) { color: blue }\n}\n", "scss")
+    assert [(rule["selectors"], rule["media"], rule["line"]) for rule in index.rules] == [
+        ([".a"], [], 1),
+        ([".a"], ["@media (min-width: 1px)"], 3),
+    ]
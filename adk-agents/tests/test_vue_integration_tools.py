@@ -0,0 +1,24 @@
+import os
+import stat
+
+from ui_design_coordinator.tools.vue_integration_tools import write_files_atomically
+
+
+def _mode(path):
+    return stat.S_IMODE(os.stat(path).st_mode)
+
+
+def test_new_files_follow_the_umask_and_existing_files_keep_their_mode(tmp_path):
+    existing = tmp_path / "Existing.vue"
+    existing.write_text("<template />\n", encoding="utf-8")
+    os.chmod(existing, 0o640)
+    created = tmp_path / "Created.vue"
+
+    umask = os.umask(0o022)
+    try:
+        write_files_atomically({str(existing): "<template><div /></template>\n", str(created): "<template />\n"})
+    finally:
+        os.umask(umask)
+
+    assert _mode(existing) == 0o640
+    assert _mode(created) == 0o644
@@ -0,0 +1,50 @@
+import pytest
+
+from ui_design_coordinator.tools.vuetify_catalog import get_vuetify_catalog, validate_vuetify_usage
+
+pytestmark = pytest.mark.skipif(not get_vuetify_catalog().available, reason="node_modules/vuetify がありません")
+
+
+def _issues(code):
+    return [(issue["line"], issue["rule"], issue["tag"], issue["suggestions"][:1]) for issue in validate_vuetify_usage(code)["issues"]]
+
+
+def test_slot_templates_are_checked_against_the_parent_component():
+    code = """<template>
+  <VCard>
+    <template #bogus>x</template>
+    <template v-slot:title>ok</template>
+    <div><template #nope>not a slot of v-card</template></div>
+  </VCard>
+  <v-data-table :items="items">
+    <template #item.name="{ item }">{{ item }}</template>
+    <template #itme>x</template>
+  </v-data-table>
+</template>"""
+    assert _issues(code) == [
+        (3, "vuetify.unknown-slot", "v-card", []),
+        (9, "vuetify.unknown-slot", "v-data-table", ["item"]),
+    ]
+
+
+def test_unknown_directives_are_reported_as_low():
+    result = validate_vuetify_usage('<v-btn v-if="x" v-ripple v-riple v-my-dir />')
+    assert [(i["rule"], i["severity"], i["attribute"], i["suggestions"][:1]) for i in result["issues"]] == [
+        ("vuetify.unknown-directive", "low", "v-riple", ["v-ripple"]),
+        ("vuetify.unknown-directive", "low", "v-my-dir", []),
+    ]
+
+
+def test_object_spread_bindings_are_builtin():
+    code = """<template>
+  <v-menu>
+    <template v-slot:activator="{ props }">
+      <v-btn v-bind="props" v-on="handlers">open</v-btn>
+    </template>
+  </v-menu>
+</template>"""
+    assert _issues(code) == []
+
+
+def test_prop_typos_are_suggested():
+    assert _issues('<v-btn\n  colr="primary" />') == [(2, "vuetify.unknown-prop", "v-btn", ["color"])]
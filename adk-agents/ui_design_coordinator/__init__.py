@@ -1,6 +1,13 @@
 # ADK UI Design & Evaluation Agent Module
 # This package contains specialized agents for UI design and evaluation
 
+from .startup_profiler import get_startup_profiler
+
+# UI_STARTUP_PROFILE が有効な場合は以降の import を計測する
+_startup_profiler = get_startup_profiler()
+
 from .agent import root_agent
 
+_startup_profiler.mark_ready()
+
 __version__ = "1.0.0" 
\ No newline at end of file
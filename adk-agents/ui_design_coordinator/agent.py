@@ -3,19 +3,24 @@ UI Design Coordinator – Root Agent
 Orchestrates the specialist agents (requirement, design, evaluation, improvement) as described in the README.
 """
 
-from dotenv import load_dotenv
-
 from google.adk import Agent
-from google.adk.tools.agent_tool import AgentTool
 from google.adk.tools import FunctionTool
 
+from .config import load_config
+from .lazy_agent_tool import LazyAgentTool
+from .llm_cache import resolve_model
+from .prompt_manifest import build_instruction
 from .root_agent_prompt import PROMPT
+from .startup_profiler import get_startup_profiler
+from .tracing import instrument_agent
 
-# Specialist agent factories
-from ui_design_coordinator.agents.requirement_agent import create_requirement_agent
-from ui_design_coordinator.agents.design_agent import create_design_agent
-from ui_design_coordinator.agents.evaluation_agent import create_evaluation_agent
-from ui_design_coordinator.agents.improvement_agent import create_improvement_agent
+# Specialist agent metadata (factories are imported lazily on first use)
+from ui_design_coordinator.agents import (
+    requirement_agent as requirement_agent_pkg,
+    design_agent as design_agent_pkg,
+    evaluation_agent as evaluation_agent_pkg,
+    improvement_agent as improvement_agent_pkg,
+)
 
 # Direct import of Design-Agent-specific tools (Vue component helpers)
 from ui_design_coordinator.agents.design_agent.tools import (
@@ -24,24 +29,29 @@ from ui_design_coordinator.agents.design_agent.tools import (
     save_all_vue_files_to_artifacts,
 )
 
-load_dotenv()
+# Deterministic multi-component evaluation (no sub-agent round trips)
+from ui_design_coordinator.tools.batch_pipeline import evaluate_components
+from ui_design_coordinator.tools.component_graph import find_affected_components
+
+load_config()
+
 
-requirement_agent = create_requirement_agent()
-design_agent = create_design_agent()
-evaluation_agent = create_evaluation_agent()
-improvement_agent = create_improvement_agent()
+def _lazy_agent_tool(agent_pkg, factory_name: str) -> LazyAgentTool:
+    """サブエージェントを初回使用時に構築する AgentTool を作成"""
+    return LazyAgentTool(
+        factory=lambda: getattr(agent_pkg, factory_name)(),
+        name=agent_pkg.AGENT_NAME,
+        description=agent_pkg.AGENT_DESCRIPTION,
+    )
 
-requirement_tool = AgentTool(agent=requirement_agent)
-design_tool = AgentTool(agent=design_agent)
-evaluation_tool = AgentTool(agent=evaluation_agent)
-improvement_tool = AgentTool(agent=improvement_agent)
 
-root_agent = Agent(
-    name="ui_design_coordinator",
-    model="gemini-1.5-flash-8b",
-    description="UI/UX設計と評価を行う専門エージェントチームのコーディネーター",
-    instruction=PROMPT,
-    tools=[
+requirement_tool = _lazy_agent_tool(requirement_agent_pkg, "create_requirement_agent")
+design_tool = _lazy_agent_tool(design_agent_pkg, "create_design_agent")
+evaluation_tool = _lazy_agent_tool(evaluation_agent_pkg, "create_evaluation_agent")
+improvement_tool = _lazy_agent_tool(improvement_agent_pkg, "create_improvement_agent")
+
+with get_startup_profiler().measure("root_agent"):
+    root_tools = [
         requirement_tool,
         design_tool,
         evaluation_tool,
@@ -49,8 +59,20 @@ root_agent = Agent(
         FunctionTool(func=save_all_vue_files_to_artifacts),
         FunctionTool(func=list_vue_components_in_artifacts),
         FunctionTool(func=get_vue_component_from_artifacts),
-    ],
-)
+        FunctionTool(func=evaluate_components),
+        FunctionTool(func=find_affected_components),
+    ]
+    root_agent = Agent(
+        name="ui_design_coordinator",
+        model=resolve_model("gemini-1.5-flash-8b"),
+        description="UI/UX設計と評価を行う専門エージェントチームのコーディネーター",
+        # instruction には登録済みツールの一覧を付け加える（LazyAgentTool のサブエージェントは構築しない）
+        instruction=build_instruction("ui_design_coordinator", PROMPT, root_tools),
+        tools=root_tools,
+    )
+
+# UI_TRACE が有効な場合はトレース用のコールバックを追加
+instrument_agent(root_agent)
 
 # Public re-export
 __all__ = ["root_agent"]
\ No newline at end of file
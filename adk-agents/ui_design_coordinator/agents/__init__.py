@@ -1,14 +1,25 @@
 # Specialized agents for UI design and evaluation
 # Each agent focuses on a specific aspect of the UI/UX workflow
+# Factories are imported on first access so that importing this package
+# does not load every agent's tool modules.
+
+from ._lazy import lazy_getattr
+
+_FACTORIES = {
+    'create_requirement_agent': '.requirement_agent',
+    'create_design_agent': '.design_agent',
+    'create_evaluation_agent': '.evaluation_agent',
+    'create_improvement_agent': '.improvement_agent',
+    'create_code_agent': '.code_agent'
+}
+
+__getattr__ = lazy_getattr(__name__, _FACTORIES)
 
-from .requirement_agent import create_requirement_agent
-from .design_agent import create_design_agent
-from .evaluation_agent import create_evaluation_agent
-from .improvement_agent import create_improvement_agent
 
 __all__ = [
     'create_requirement_agent',
     'create_design_agent',
     'create_evaluation_agent',
-    'create_improvement_agent'
-] 
\ No newline at end of file
+    'create_improvement_agent',
+    'create_code_agent'
+] 
@@ -0,0 +1,20 @@
+"""
+factory の遅延 import
+
+各エージェントのパッケージは `__getattr__ = lazy_getattr(__name__, {...})` で
+factory を公開し、初回参照時に agent モジュール（とそのツールモジュール）を読み込む。
+"""
+
+import importlib
+from typing import Any, Callable, Dict
+
+
+def lazy_getattr(package: str, attributes: Dict[str, str]) -> Callable[[str], Any]:
+    """属性名 -> 相対モジュール名 の対応から、モジュールの __getattr__ を作成"""
+
+    def __getattr__(name: str) -> Any:
+        if name in attributes:
+            return getattr(importlib.import_module(attributes[name], package), name)
+        raise AttributeError(f"module {package!r} has no attribute {name!r}")
+
+    return __getattr__
@@ -1,3 +1,9 @@
-from .agent import create_code_agent
+from .._lazy import lazy_getattr
+
+AGENT_NAME = "code_agent"
+AGENT_DESCRIPTION = "Vue.jsコードの実装と修正を行う専門エージェント"
+
+# factory は初回参照時に import する（ツールモジュールの読み込みを遅延）
+__getattr__ = lazy_getattr(__name__, {"create_code_agent": ".agent"})
 
 __all__ = ["create_code_agent"] 
\ No newline at end of file
@@ -1,10 +1,24 @@
-from dotenv import load_dotenv
 from google.adk import Agent
 from google.adk.tools import FunctionTool
 from .prompt import CODE_AGENT_INSTRUCTION
+from ...config import load_config
+from ...llm_cache import resolve_model
+from ...prompt_manifest import build_instruction
+from ...tracing import instrument_agent
+from ...tools.vue_integration_tools import (
+    begin_virtual_edits,
+    commit_virtual_edits,
+    discard_virtual_edits,
+    generate_vue_component,
+    list_component_backups,
+    modify_existing_component,
+    restore_component_backup,
+    update_app_vue_imports,
+)
+from . import AGENT_NAME, AGENT_DESCRIPTION
 
 # 環境変数を読み込み
-load_dotenv()
+load_config()
 
 def generate_vue_component_code(component_spec: dict) -> dict:
     """コンポーネント仕様からVue.jsコードを生成する"""
@@ -122,14 +136,26 @@ def create_code_agent():
     # ツールを作成
     generate_tool = FunctionTool(func=generate_vue_component_code)
     modify_tool = FunctionTool(func=modify_existing_vue_file)
+    # ファイルを書き込むツール（ToolContext のセッションごとに仮想編集セッションを持つ）
+    write_tools = [
+        FunctionTool(func=generate_vue_component),
+        FunctionTool(func=modify_existing_component),
+        FunctionTool(func=update_app_vue_imports),
+        FunctionTool(func=list_component_backups),
+        FunctionTool(func=restore_component_backup),
+        FunctionTool(func=begin_virtual_edits),
+        FunctionTool(func=commit_virtual_edits),
+        FunctionTool(func=discard_virtual_edits),
+    ]
+    tools = [generate_tool, modify_tool, *write_tools]
     
     # エージェントを作成
     agent = Agent(
-        name="code_agent",
-        model="gemini-1.5-flash-8b",
-        description="Vue.jsコードの実装と修正を行う専門エージェント",
-        instruction=CODE_AGENT_INSTRUCTION,
-        tools=[generate_tool, modify_tool]
+        name=AGENT_NAME,
+        model=resolve_model("gemini-1.5-flash-8b"),
+        description=AGENT_DESCRIPTION,
+        instruction=build_instruction(AGENT_NAME, CODE_AGENT_INSTRUCTION, tools),
+        tools=tools
     )
     
-    return agent 
\ No newline at end of file
+    return instrument_agent(agent) 
\ No newline at end of file
@@ -1,3 +1,9 @@
-from .agent import create_design_agent
+from .._lazy import lazy_getattr
+
+AGENT_NAME = "design_agent"
+AGENT_DESCRIPTION = "最新のMaterial Design 3とVuetify 3情報を検索し、既存コンポーネントを参照して、Vue.jsコンポーネントを生成します"
+
+# factory は初回参照時に import する（ツールモジュールの読み込みを遅延）
+__getattr__ = lazy_getattr(__name__, {"create_design_agent": ".agent"})
 
 __all__ = ["create_design_agent"] 
\ No newline at end of file
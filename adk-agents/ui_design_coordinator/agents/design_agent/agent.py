@@ -1,25 +1,33 @@
-from dotenv import load_dotenv
 from google.adk import Agent
 from google.adk.tools import FunctionTool, google_search, ToolContext
 from .prompt import create_design_agent_instruction
+from ...config import load_config
+from ...llm_cache import resolve_model
+from ...prompt_manifest import build_instruction
+from ...tracing import instrument_agent
+from . import AGENT_NAME, AGENT_DESCRIPTION
 from .tools import (
     # 新しいToolContext対応ツール
     get_vue_component_from_artifacts,
     list_vue_components_in_artifacts,
+    get_component_analysis,
     # 新しいVueファイル管理ツール
     save_vue_file_to_artifact,
     save_all_vue_files_to_artifacts,
+    _sync_vue_artifacts,
     # 既存のツール
     create_ui_design, 
     get_project_info
 )
+from ...tools.tool_cache import make_function_tool
+from ...tools.vuetify_catalog import validate_vuetify_usage
 
 # CallbackContext type for hints (optional)
 from typing import Optional
 from google.adk.agents.callback_context import CallbackContext
 
 # 環境変数を読み込み
-load_dotenv()
+load_config()
 
 
 # ---------------------------------------------
@@ -27,10 +35,12 @@ load_dotenv()
 # ---------------------------------------------
 
 async def _preload_vue(callback_context: CallbackContext) -> Optional[None]:
-    """Save all project Vue files to Artifact once per session.
+    """Sync project Vue files to Artifact once per session.
 
     Runs *before* design_agent executes. Uses the session state flag
-    `_vue_artifacts_loaded` to ensure the batch save runs only once per session.
+    `_vue_artifacts_loaded` to ensure the sync runs only once per session.
+    Files already uploaded for the current `src/` snapshot (recorded in
+    user-scoped state) are not uploaded again.
     """
 
     if callback_context.state.get("_vue_artifacts_loaded"):
@@ -42,12 +52,16 @@ async def _preload_vue(callback_context: CallbackContext) -> Optional[None]:
         event_actions=callback_context._event_actions,  # type: ignore[attr-defined]
     )
 
-    await save_all_vue_files_to_artifacts(tool_ctx)
+    await _sync_vue_artifacts(tool_ctx)
     callback_context.state["_vue_artifacts_loaded"] = True
     return None
 
-def create_design_agent():
-    """Design Agentを作成"""
+def create_design_agent(memoize: Optional[bool] = None):
+    """Design Agentを作成
+
+    Args:
+        memoize: ToolContext を使わないツールの結果をキャッシュするか（None の場合は環境変数 UI_TOOL_CACHE に従う）
+    """
     
     # ツールを作成
     tools = [
@@ -57,26 +71,28 @@ def create_design_agent():
         # 新しいToolContext対応のArtifactツール
         FunctionTool(func=get_vue_component_from_artifacts),
         FunctionTool(func=list_vue_components_in_artifacts),
+        FunctionTool(func=get_component_analysis),
         
         # 新しいVueファイル管理ツール
         FunctionTool(func=save_vue_file_to_artifact),
         FunctionTool(func=save_all_vue_files_to_artifacts),
         
         # 基本的なUI設計ツール
-        FunctionTool(func=create_ui_design),
+        make_function_tool(create_ui_design, memoize),
+        make_function_tool(validate_vuetify_usage, memoize),
         
         # 基本情報取得ツール
-        FunctionTool(func=get_project_info),
+        make_function_tool(get_project_info, memoize),
     ]
     
     # エージェントを作成
     agent = Agent(
-        name="design_agent",
-        model="gemini-1.5-flash-8b",
-        description="最新のMaterial Design 3とVuetify 3情報を検索し、既存コンポーネントを参照して、Vue.jsコンポーネントを生成します",
-        instruction=create_design_agent_instruction(),
+        name=AGENT_NAME,
+        model=resolve_model("gemini-1.5-flash-8b"),
+        description=AGENT_DESCRIPTION,
+        instruction=build_instruction(AGENT_NAME, create_design_agent_instruction(), tools),
         tools=tools,
         before_agent_callback=_preload_vue,
     )
     
-    return agent 
\ No newline at end of file
+    return instrument_agent(agent) 
\ No newline at end of file
@@ -25,68 +25,45 @@ def create_design_agent_instruction() -> str:
 ---
 ## 🎨 既存コンポーネントの活用（Artifact 方式）
 
-既存の Vue コンポーネントは **Artifact Service** に登録可能です。以下のツールを使用してください：
-
-### 利用可能なツール
-1. **`load_existing_vue_components_to_artifacts()`**: 既存のVueコンポーネントをArtifactに登録
-2. **`list_vue_components_in_artifacts()`**: 登録済みコンポーネントの一覧を取得
-3. **`get_vue_component_from_artifacts(component_name)`**: 指定コンポーネントの詳細を取得
-
-### 新しいVueファイル管理ツール（推奨）
-4. **`save_vue_file_to_artifact(vue_file_path, output_filename=None)`**: 単一のVueファイルをArtifactに保存
-5. **`save_all_vue_files_to_artifacts()`**: 全てのVueファイルをArtifactに一括保存
-6. **`get_vue_files_list()`**: プロジェクト内のVueファイル一覧を取得
+プロジェクトの既存 Vue コンポーネントは **Artifact Service** に保存して参照します
+（セッション開始時に変更のあったファイルだけ自動で保存されます）。
 
 ### 使用手順
-1. **初回使用時**: `get_vue_files_list()` でプロジェクト内のVueファイルを確認
-2. **一括保存**: `save_all_vue_files_to_artifacts()` で全てのVueファイルを保存
-3. **個別保存**: `save_vue_file_to_artifact(vue_file_path="components/Login.vue")` で特定のファイルを保存
-4. **一覧確認**: `list_vue_components_in_artifacts()` で登録済みコンポーネントを確認
-5. **詳細取得**: `get_vue_component_from_artifacts("vue/App.vue")` で特定コンポーネントの内容を取得
-6. **統一ルール**: 既存コードのレイアウト / 色 / コーディングスタイルを踏襲してください
+1. **一括保存**: `save_all_vue_files_to_artifacts()` で全ての Vue ファイルを保存（通常は自動保存済み）
+2. **個別保存**: `save_vue_file_to_artifact(vue_file_path="src/components/Login.vue")` で特定のファイルを保存
+3. **一覧確認**: `list_vue_components_in_artifacts()` で保存済みコンポーネントを確認（prefix / pattern / query で絞り込み可能）
+4. **詳細取得**: `get_vue_component_from_artifacts(component_name="src/components/Login")` で特定コンポーネントの内容を取得
+   （ブロック構成・構造指標・評価の問題一覧は `get_component_analysis(component_name="src/components/Login")` で取得。セッション内で共有されます）
+5. **統一ルール**: 既存コードのレイアウト / 色 / コーディングスタイルを踏襲してください
 
 ---
 ## 🛠 実装プロセス
 1. **最新情報検索**: `google_search` でガイドライン確認
 2. **既存コンポーネント確認**: `list_vue_components_in_artifacts()` → 必要に応じて `get_vue_component_from_artifacts()`
-3. **要件分析**: `requirement_agent` の JSON 出力を解析
+3. **要件分析**: requirement_agent の JSON 出力を解析
 4. **設計**: Material Design 3 + Vuetify 3 に準拠した UI 設計を行う
 5. **コード生成**: 生成する新コンポーネントは **完全な Vue 3 + Composition API** 形式
+   （生成後に `validate_vuetify_usage(component_code)` で Vuetify のコンポーネント名・props を確認）
 6. **根拠明記**: 検索ソースや既存コードのどの部分を参考にしたかをコメントで示す
 
 ## 🔧 ユーザーリクエストの処理方法
 
 ### 「既存のVueコンポーネントをArtifactに登録してください」のリクエスト
-このリクエストを受けた場合、必ず以下の手順で対応してください：
-
-1. **`get_vue_files_list()`** を実行してプロジェクト内のVueファイルを確認
-2. **`save_all_vue_files_to_artifacts()`** を実行して全てのVueファイルを保存
-3. **`list_vue_components_in_artifacts()`** を実行して登録されたコンポーネント一覧を表示
-
-### 「保存されているVueコンポーネントの一覧を教えてください」のリクエスト
-このリクエストを受けた場合：
+1. **`save_all_vue_files_to_artifacts()`** を実行して全てのVueファイルを保存
+2. **`list_vue_components_in_artifacts()`** を実行して登録されたコンポーネント一覧を表示
 
+### 「保存されているVueコンポーネントの一覧を教えてください」「プロジェクト内のVueファイルを確認してください」のリクエスト
 1. **`list_vue_components_in_artifacts()`** を実行
 2. 一覧を整理して表示
 
 ### 「特定のVueファイルを保存してください」のリクエスト
-このリクエストを受けた場合：
-
 1. **`save_vue_file_to_artifact(vue_file_path="指定されたパス")`** を実行
 2. 保存結果を報告
 
-### 「プロジェクト内のVueファイルを確認してください」のリクエスト
-このリクエストを受けた場合：
-
-1. **`get_vue_files_list()`** を実行
-2. ファイル一覧を表示
-
 ### コンポーネント作成・修正のリクエスト
-1. **`get_vue_files_list()`** でプロジェクト内のVueファイルを確認
-2. **`save_all_vue_files_to_artifacts()`** で既存コンポーネントをArtifactに保存
-3. **`list_vue_components_in_artifacts()`** で登録済みコンポーネントを確認
-4. 必要に応じて **`get_vue_component_from_artifacts()`** で詳細を取得
-5. 既存パターンを参考に新コンポーネントを作成
+1. **`list_vue_components_in_artifacts()`** で保存済みコンポーネントを確認
+2. 必要に応じて **`get_vue_component_from_artifacts()`** で詳細を取得
+3. 既存パターンを参考に新コンポーネントを作成
 
 ## 🎯 重要な注意事項
 
@@ -5,35 +5,164 @@ Design Agent のツール関数（ToolContext対応版）
 import os
 import glob
 import asyncio
+import fnmatch
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
 from google.adk.tools import ToolContext
 from google.genai.types import Part
 
+from ...tools.component_graph import get_component_graph
+from ...tools.script_index import build_sfc_script_index
+from ...tools.style_index import build_sfc_style_index
+from ...tools.ui_analysis_tools import (
+    analyze_script,
+    analyze_style,
+    analyze_template,
+    calculate_ui_metrics,
+    detect_vuetify_components,
+    extract_script_section,
+    extract_style_section,
+    extract_template_section,
+    parse_sfc_blocks,
+)
+
 logger = logging.getLogger(__name__)
 
 # ------------------------------
 # Artifact Lazy-Load Helper
 # ------------------------------
 _vue_artifacts_loaded_key = "_vue_artifacts_loaded"  # Session state flag
+# User-scoped state (persists across sessions) recording which snapshot of
+# `src/` has already been uploaded under the `user:vue/` artifact namespace.
+_vue_snapshot_state_key = "user:_vue_artifacts_snapshot"
+_vue_index_state_key = "_vue_artifact_index"  # Session-cached artifact key index
+# Session state holding analysis results per artifact:
+# {artifact_key: {"version": ..., "digest": ..., "results": {analysis: result}}}
+_analysis_state_key = "_vue_artifact_analyses"
+# Result fields that point into process-local stores and must not be shared via state
+_PROCESS_LOCAL_FIELDS = ("evaluation_id", "more")
+
+ANALYSES = ("outline", "metrics", "evaluation")
+
+# Process-wide digest cache: rel_path -> (mtime_ns, size, sha256)
+_vue_digest_cache: Dict[str, Tuple[int, int, str]] = {}
+
+
+def _project_root() -> Path:
+    """Return the repository root (the directory that contains `src/`)."""
+    return Path(__file__).resolve().parents[4]
+
+
+def _vue_artifact_name(rel_path: str) -> str:
+    """Artifact key used for a project-relative Vue file path."""
+    return f"user:vue/{rel_path}".replace("\\", "/")
+
+
+def compute_vue_snapshot() -> Dict[str, Any]:
+    """Hash the Vue files under `src/` into a snapshot manifest.
+
+    File digests are cached per process and only recomputed when a file's
+    mtime or size changes, so repeated calls on an unchanged checkout only
+    cost one directory walk.
+
+    Returns:
+        {"tree_hash": str, "files": {rel_path: sha256}}
+    """
+    project_root = _project_root()
+    vue_dir = project_root / "src"
+    files: Dict[str, str] = {}
+
+    if vue_dir.exists():
+        for vue_file in vue_dir.rglob("*.vue"):
+            rel_path = vue_file.relative_to(project_root).as_posix()
+            stat = vue_file.stat()
+            cached = _vue_digest_cache.get(rel_path)
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                files[rel_path] = cached[2]
+                continue
+            digest = hashlib.sha256(vue_file.read_bytes()).hexdigest()
+            _vue_digest_cache[rel_path] = (stat.st_mtime_ns, stat.st_size, digest)
+            files[rel_path] = digest
+
+    tree = hashlib.sha256()
+    for rel_path in sorted(files):
+        tree.update(f"{rel_path}\0{files[rel_path]}\n".encode("utf-8"))
+
+    return {"tree_hash": tree.hexdigest(), "files": files}
+
+
+async def _sync_vue_artifacts(tool_context: ToolContext) -> Dict[str, Any]:
+    """Bring the `user:vue/` artifacts in line with the current `src/` snapshot.
+
+    Only files whose digest differs from the recorded snapshot (or whose
+    artifact is missing from the service) are uploaded. When the tree hash is
+    unchanged and every artifact is present, nothing is uploaded.
+
+    The returned `affected` list is the uploaded files plus every SFC that
+    imports or renders them (from the component graph), i.e. the components
+    whose analyses need to be refreshed.
+
+    Returns:
+        {"tree_hash": str, "uploaded": [rel_path, ...], "affected": [rel_path, ...], "results": [str, ...]}
+    """
+    snapshot = compute_vue_snapshot()
+    recorded = tool_context.state.get(_vue_snapshot_state_key) or {}
+    recorded_files = recorded.get("files", {})
+
+    # `list_artifacts` may return user-scoped keys with or without the prefix
+    existing = {
+        key if key.startswith("user:") else f"user:{key}"
+        for key in await tool_context.list_artifacts()
+    }
+
+    uploaded = [
+        rel_path
+        for rel_path, digest in snapshot["files"].items()
+        if recorded_files.get(rel_path) != digest
+        or _vue_artifact_name(rel_path) not in existing
+    ]
+
+    results = await asyncio.gather(
+        *(save_vue_file_to_artifact(tool_context, rel_path) for rel_path in uploaded)
+    )
+
+    # Record only files that were saved successfully, so failures are retried
+    synced_files = dict(snapshot["files"])
+    for rel_path, result in zip(uploaded, results):
+        if not result.startswith("✅"):
+            synced_files.pop(rel_path, None)
+
+    tool_context.state[_vue_snapshot_state_key] = {
+        "tree_hash": snapshot["tree_hash"] if synced_files == snapshot["files"] else "",
+        "files": synced_files,
+    }
+
+    if uploaded:
+        logger.info(
+            "Synced %d/%d Vue artifacts for snapshot %s",
+            len(uploaded), len(snapshot["files"]), snapshot["tree_hash"][:12],
+        )
+
+    affected = get_component_graph().affected_by(uploaded) if uploaded else []
+    return {"tree_hash": snapshot["tree_hash"], "uploaded": uploaded, "affected": affected, "results": list(results)}
 
 
 async def _ensure_vue_artifacts(tool_context: ToolContext) -> None:
     """Ensure Vue files are present in Artifact service for current session.
 
-    If no artifact exists yet, this helper runs `save_all_vue_files_to_artifacts` once
-    per session. Subsequent calls are skipped using a flag stored in session state.
+    The first call in a session compares the current `src/` snapshot with the
+    one recorded in user-scoped state and uploads only the files that changed,
+    so a new session on an identical checkout uploads nothing. Subsequent calls
+    in the same session are skipped using a flag stored in session state.
     """
     try:
         # Skip when already loaded in this session
         if tool_context.state.get(_vue_artifacts_loaded_key):
             return
 
-        # Check existing artifacts; run batch save only if empty
-        existing = await tool_context.list_artifacts()
-        if not existing:
-            await save_all_vue_files_to_artifacts(tool_context)
+        await _sync_vue_artifacts(tool_context)
 
         # Mark as loaded to avoid duplicate work
         tool_context.state[_vue_artifacts_loaded_key] = True
@@ -64,9 +193,7 @@ async def save_vue_file_to_artifact(
 
         # 相対パスの場合はプロジェクトルートからの相対として扱う
         if not file_path.is_absolute():
-            current_dir = Path(__file__).resolve()
-            project_root = current_dir.parents[4]
-            file_path = (project_root / file_path).resolve()
+            file_path = (_project_root() / file_path).resolve()
 
         if not file_path.exists():
             return f"❌ File not found: {file_path}"
@@ -77,15 +204,21 @@ async def save_vue_file_to_artifact(
         # 出力ファイル名を決定
         if output_filename is None:
             # プロジェクトルートからの相対パスをそのままArtifact名にする
-            current_dir = Path(__file__).resolve()
-            project_root = current_dir.parents[4]
-            rel_path = file_path.relative_to(project_root)
+            rel_path = file_path.relative_to(_project_root())
             # `user:` 名前空間を付けることで、親エージェントからも閲覧可能にする
-            output_filename = f"user:vue/{rel_path}".replace("\\", "/")
+            output_filename = _vue_artifact_name(str(rel_path))
 
         # Artifactに保存
         artifact = Part(text=vue_content)
         await tool_context.save_artifact(filename=output_filename, artifact=artifact)
+        # キー一覧のキャッシュと、この Artifact の分析結果を無効化
+        if tool_context.state.get(_vue_index_state_key) is not None:
+            tool_context.state[_vue_index_state_key] = None
+        analyses = tool_context.state.get(_analysis_state_key) or {}
+        if output_filename in analyses:
+            tool_context.state[_analysis_state_key] = {
+                key: entry for key, entry in analyses.items() if key != output_filename
+            }
 
         logger.info("✅ Saved %s to artifact", output_filename)
         return f"✅ Successfully saved {file_path} to artifact as {output_filename}"
@@ -106,8 +239,7 @@ async def save_all_vue_files_to_artifacts(tool_context: ToolContext) -> str:
     """
     try:
         # プロジェクトのルートディレクトリを特定
-        current_dir = Path(__file__).resolve()
-        project_root = current_dir.parents[4]  # 4つ上のディレクトリがプロジェクトルート
+        project_root = _project_root()
         vue_dir = project_root / "src"
         
         if not vue_dir.exists():
@@ -142,6 +274,11 @@ async def save_all_vue_files_to_artifacts(tool_context: ToolContext) -> str:
         """
         
         logger.info("Batch save completed: %d success, %d failure", success_count, failure_count)
+
+        # 全件成功した場合はスナップショットを記録し、以降のセッションでの再アップロードを省く
+        if failure_count == 0:
+            tool_context.state[_vue_snapshot_state_key] = compute_vue_snapshot()
+
         return report
         
     except Exception as e:
@@ -149,6 +286,18 @@ async def save_all_vue_files_to_artifacts(tool_context: ToolContext) -> str:
         logger.error(error_msg)
         return error_msg
 
+def _vue_artifact_candidates(component_name: str) -> List[str]:
+    """Artifact keys that may hold `component_name` (which ends with `.vue`)."""
+    return [
+        f"user:vue/{component_name}",
+        f"user:vue/components/{component_name}",
+        f"user:vue/views/{component_name}",
+        f"user:vue/pages/{component_name}",
+        # 後方互換（名前空間なし）
+        f"vue/{component_name}",
+        f"vue/components/{component_name}"
+    ]
+
 async def get_vue_component_from_artifacts(tool_context: ToolContext, component_name: str) -> str:
     """
     ArtifactからVueコンポーネントの内容を取得する
@@ -158,18 +307,7 @@ async def get_vue_component_from_artifacts(tool_context: ToolContext, component_
         if not component_name.endswith('.vue'):
             component_name += '.vue'
         
-        # 可能性のあるパスを試す
-        possible_paths = [
-            f"user:vue/{component_name}",
-            f"user:vue/components/{component_name}",
-            f"user:vue/views/{component_name}",
-            f"user:vue/pages/{component_name}",
-            # 後方互換（名前空間なし）
-            f"vue/{component_name}",
-            f"vue/components/{component_name}"
-        ]
-        
-        for filename in possible_paths:
+        for filename in _vue_artifact_candidates(component_name):
             try:
                 artifact = await tool_context.load_artifact(filename)
                 if artifact and hasattr(artifact, 'text'):
@@ -182,28 +320,291 @@ async def get_vue_component_from_artifacts(tool_context: ToolContext, component_
     except Exception as e:
         return f"❌ Error retrieving component: {str(e)}"
 
-async def list_vue_components_in_artifacts(tool_context: ToolContext) -> str:
+async def _vue_artifact_index(tool_context: ToolContext) -> List[Dict[str, Any]]:
+    """Return the cached index of `user:vue/*.vue` artifact keys for this session.
+
+    The index is built once from `list_artifacts()` (running the lazy preload
+    first) and stored in session state; it is dropped whenever a Vue artifact
+    is saved. Size and mtime come from the matching file under the project
+    root, or are None for artifacts without a local counterpart.
+    """
+    cached = tool_context.state.get(_vue_index_state_key)
+    if cached is not None:
+        return cached
+
+    await _ensure_vue_artifacts(tool_context)
+    project_root = _project_root()
+
+    entries = []
+    for key in await tool_context.list_artifacts():
+        if not key.startswith("user:"):
+            key = f"user:{key}"
+        if not (key.startswith("user:vue/") and key.endswith(".vue")):
+            continue
+        local_file = project_root / key.removeprefix("user:vue/")
+        try:
+            stat = local_file.stat()
+            size, mtime = stat.st_size, stat.st_mtime
+        except OSError:
+            size, mtime = None, None
+        entries.append({"key": key, "name": key.removeprefix("user:"), "size": size, "mtime": mtime})
+
+    entries.sort(key=lambda e: e["name"])
+    tool_context.state[_vue_index_state_key] = entries
+    return entries
+
+
+async def list_vue_components_in_artifacts(
+    tool_context: ToolContext,
+    prefix: str = "",
+    pattern: str = "",
+    query: str = "",
+    sort_by: str = "name",
+    cursor: str = "",
+    page_size: int = 50,
+) -> str:
     """Artifact 内の Vue コンポーネント一覧を返す。
 
-    初回呼び出し時に未登録であれば自動で一括登録を行う。
+    初回呼び出し時に未登録であれば自動で一括登録を行う。キー一覧はセッション内で
+    キャッシュされ、フィルタとページングはそのインデックスに対して行う。
+
+    Args:
+        tool_context: ToolContext
+        prefix: 前方一致フィルタ（例: "vue/src/components/"）
+        pattern: glob フィルタ（例: "*Form*.vue"）
+        query: 部分一致フィルタ（大文字小文字を区別しない）
+        sort_by: "name" | "size" | "mtime"（size / mtime は降順）
+        cursor: 前回の結果で返された次ページ用カーソル
+        page_size: 1ページあたりの件数（1〜200）
+
+    Returns:
+        コンポーネント一覧（Markdown）
     """
     try:
-        # Artifactサービスからキー一覧を取得し、vue/* を抽出
-        await _ensure_vue_artifacts(tool_context)
-        keys = await tool_context.list_artifacts()
-        vue_keys = [k for k in keys if k.startswith("user:vue/") and k.endswith(".vue")]
-
-        if vue_keys:
-            component_list = "\n".join(f"- {k.removeprefix('user:')}" for k in vue_keys)
-            return (
-                "## 登録済みVueコンポーネント\n\n"
-                f"{component_list}\n\n"
-                "💡 `get_vue_component_from_artifacts(component_name)` で内容を確認できます。"
-            )
-        return "❌ No Vue components found in artifacts."
+        if sort_by not in ("name", "size", "mtime"):
+            return f"❌ Invalid sort_by '{sort_by}'. Use one of: name, size, mtime."
+
+        entries = await _vue_artifact_index(tool_context)
+
+        query = query.lower()
+        matched = [
+            e for e in entries
+            if e["name"].startswith(prefix)
+            and (not pattern or fnmatch.fnmatchcase(e["name"], pattern))
+            and query in e["name"].lower()
+        ]
+        if not matched:
+            return "❌ No Vue components found in artifacts."
+
+        if sort_by != "name":
+            # 値のないエントリは末尾へ
+            matched.sort(key=lambda e: (e[sort_by] is None, -(e[sort_by] or 0)))
+
+        page_size = max(1, min(int(page_size), 200))
+        offset = int(cursor) if cursor.isdigit() else 0
+        if offset >= len(matched):
+            return f"❌ Cursor {offset} is past the end of the list ({len(matched)} components)."
+        page = matched[offset:offset + page_size]
+        next_offset = offset + len(page)
+
+        component_list = "\n".join(
+            f"- {e['name']}" + (f" ({e['size']} bytes)" if e["size"] is not None else "")
+            for e in page
+        )
+        footer = (
+            f"➡️ 続きは `cursor=\"{next_offset}\"` を指定してください。"
+            if next_offset < len(matched)
+            else "💡 `get_vue_component_from_artifacts(component_name)` で内容を確認できます。"
+        )
+        return (
+            f"## 登録済みVueコンポーネント ({offset + 1}-{next_offset} / {len(matched)})\n\n"
+            f"{component_list}\n\n"
+            f"{footer}"
+        )
     except Exception as e:
         return f"❌ Error listing components: {str(e)}"
 
+def _line_of(content: str, offset: int) -> int:
+    return content.count("\n", 0, offset) + 1
+
+
+def _analyze_outline(content: str, name: str) -> Dict[str, Any]:
+    blocks = parse_sfc_blocks(content)
+    return {
+        "total_lines": content.count("\n") + 1,
+        "blocks": [
+            {
+                "type": block["type"],
+                "attrs": block["attrs"],
+                "start_line": _line_of(content, block["start"]),
+                "end_line": _line_of(content, block["end"]),
+            }
+            for block in blocks
+        ],
+    }
+
+
+def _analyze_metrics(content: str, name: str) -> Dict[str, Any]:
+    template = extract_template_section(content)
+    script = extract_script_section(content)
+    style = extract_style_section(content)
+    return {
+        "template": analyze_template(template),
+        "script": analyze_script(script, build_sfc_script_index(content)),
+        "style": analyze_style(style, build_sfc_style_index(content)),
+        "ui_metrics": calculate_ui_metrics(template, style),
+        "vuetify_usage": detect_vuetify_components(template),
+    }
+
+
+def _analyze_evaluation(content: str, name: str) -> Dict[str, Any]:
+    # 評価ツールは評価エージェントのモジュールにあるため、使用時に import する
+    from ..evaluation_agent.agent import comprehensive_evaluation
+
+    result = comprehensive_evaluation(content, name, detail="issues")
+    return {key: value for key, value in result.items() if key not in _PROCESS_LOCAL_FIELDS}
+
+
+def _content_digest(content: str) -> str:
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()[:16]
+
+
+def _analysis_key(file_path: str) -> str:
+    """ファイルパス（プロジェクト相対 / 絶対）または Artifact キーを分析結果のキーに変換"""
+    if file_path.startswith(("user:vue/", "vue/")):
+        return file_path
+    path = Path(file_path)
+    if path.is_absolute():
+        try:
+            file_path = path.resolve().relative_to(_project_root()).as_posix()
+        except ValueError:
+            pass
+    return _vue_artifact_name(file_path)
+
+
+def load_session_analysis(tool_context: ToolContext, file_path: str, content: str, analysis: str) -> Optional[Dict[str, Any]]:
+    """セッションに保存された分析結果（content が同じ場合のみ）"""
+    entry = (tool_context.state.get(_analysis_state_key) or {}).get(_analysis_key(file_path))
+    if not entry or entry.get("digest") != _content_digest(content):
+        return None
+    return entry["results"].get(analysis)
+
+
+def save_session_analysis(
+    tool_context: ToolContext, file_path: str, content: str, analysis: str, result: Dict[str, Any]
+) -> None:
+    """分析結果をセッションに保存（get_component_analysis と共有）"""
+    key, digest = _analysis_key(file_path), _content_digest(content)
+    stored = tool_context.state.get(_analysis_state_key) or {}
+    entry = stored.get(key)
+    if not entry or entry.get("digest") != digest:
+        entry = {"version": None, "digest": digest, "results": {}}
+    result = {name: value for name, value in result.items() if name not in _PROCESS_LOCAL_FIELDS}
+    tool_context.state[_analysis_state_key] = {
+        **stored,
+        key: {**entry, "results": {**entry["results"], analysis: result}},
+    }
+
+
+_ANALYZERS = {
+    "outline": _analyze_outline,
+    "metrics": _analyze_metrics,
+    "evaluation": _analyze_evaluation,
+}
+
+
+async def _resolve_vue_artifact(tool_context: ToolContext, component_name: str) -> Tuple[str, Any, Part]:
+    """Return (artifact key, version, part) of the latest version of a Vue artifact.
+
+    The version is the artifact service's version number, or a content digest
+    when the service does not report versions.
+    """
+    if not component_name.endswith(".vue"):
+        component_name += ".vue"
+    for filename in _vue_artifact_candidates(component_name):
+        try:
+            info = await tool_context.get_artifact_version(filename)
+            version = info.version if info else None
+            artifact = await tool_context.load_artifact(filename, version=version)
+        except Exception:
+            continue
+        if artifact is None or artifact.text is None:
+            continue
+        if version is None:
+            version = hashlib.sha256(artifact.text.encode("utf-8")).hexdigest()[:16]
+        return filename, version, artifact
+    raise FileNotFoundError(component_name)
+
+
+async def get_component_analysis(
+    tool_context: ToolContext,
+    component_name: str,
+    analyses: Optional[List[str]] = None
+) -> Dict[str, Any]:
+    """Artifact に保存された Vue コンポーネントの分析結果を返す（セッション内で共有）
+
+    結果は Artifact の内容をキーにセッション状態へ保存され、同じセッションの
+    他のエージェント（comprehensive_evaluation を含む）は再計算せずに再利用する。
+    Artifact が更新されると自動で再計算される。
+
+    Args:
+        tool_context: ToolContext
+        component_name: コンポーネント名（例: "src/components/Login"）
+        analyses: 取得する分析（outline: ブロック構成 / metrics: 構造指標 / evaluation: 評価の問題一覧）。省略時はすべて
+
+    Returns:
+        {"status", "artifact", "version", "results": {分析名: 結果}, "reused": [...], "computed": [...]}
+    """
+    try:
+        analyses = list(dict.fromkeys(analyses or ANALYSES))
+        unknown = [name for name in analyses if name not in _ANALYZERS]
+        if unknown:
+            return {"status": "error", "message": f"analyses は {' / '.join(ANALYSES)} から指定してください: {unknown}"}
+
+        await _ensure_vue_artifacts(tool_context)
+        try:
+            key, version, artifact = await _resolve_vue_artifact(tool_context, component_name)
+        except FileNotFoundError:
+            return {
+                "status": "error",
+                "message": f"Component '{component_name}' not found in artifacts. Available components can be listed with list_vue_components_in_artifacts."
+            }
+
+        stored = tool_context.state.get(_analysis_state_key) or {}
+        entry = stored.get(key)
+        # 内容が変わった Artifact の結果は破棄する
+        digest = _content_digest(artifact.text)
+        cached = entry["results"] if entry and entry.get("digest") == digest else {}
+
+        results, reused, computed = {}, [], []
+        name = key.removeprefix("user:vue/")
+        for analysis in analyses:
+            if analysis in cached:
+                results[analysis] = cached[analysis]
+                reused.append(analysis)
+            else:
+                results[analysis] = _ANALYZERS[analysis](artifact.text, name)
+                computed.append(analysis)
+
+        if computed:
+            tool_context.state[_analysis_state_key] = {
+                **stored,
+                key: {"version": version, "digest": digest, "results": {**cached, **results}},
+            }
+
+        return {
+            "status": "success",
+            "artifact": key,
+            "version": version,
+            "results": results,
+            "reused": reused,
+            "computed": computed,
+        }
+    except Exception as e:
+        logger.error("get_component_analysis failed: %s", e)
+        return {"status": "error", "message": f"Error analyzing component: {str(e)}"}
+
+
 def create_ui_design(design_requirements: str) -> str:
     """
     UI設計の基本的なガイダンスを提供
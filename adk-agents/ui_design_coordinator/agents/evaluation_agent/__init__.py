@@ -1,3 +1,9 @@
-from .agent import create_evaluation_agent
+from .._lazy import lazy_getattr
+
+AGENT_NAME = "evaluation_agent"
+AGENT_DESCRIPTION = "Vue.jsコンポーネントの包括的な評価を行い、WCAG 2.1準拠性とユーザビリティを詳細に分析する専門エージェント"
+
+# factory は初回参照時に import する（ツールモジュールの読み込みを遅延）
+__getattr__ = lazy_getattr(__name__, {"create_evaluation_agent": ".agent"})
 
 __all__ = ["create_evaluation_agent"] 
\ No newline at end of file
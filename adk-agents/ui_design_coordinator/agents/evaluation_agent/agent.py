@@ -1,14 +1,26 @@
-from dotenv import load_dotenv
 from google.adk import Agent
-from google.adk.tools import FunctionTool
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional, Tuple
+from collections import OrderedDict
+import hashlib
 import json
 import re
 from .prompt import create_evaluation_instruction
-from ...tools.ui_analysis_tools import analyze_vue_component
+from ...config import load_config
+from ...llm_cache import resolve_model
+from ...prompt_manifest import build_instruction
+from ...tracing import instrument_agent
+from . import AGENT_NAME, AGENT_DESCRIPTION
+from ...tools.auto_fixers import _attr_names
+from ...tools.ui_analysis_tools import analyze_vue_component, extract_template_section
+from ...tools.script_index import COMPUTED_APIS, REACTIVE_APIS, WATCH_APIS, build_sfc_script_index
+from ...tools.tool_cache import make_function_tool
+from ...tools.vue_integration_tools import _TAG_TOKEN
+from ...tools.vuetify_catalog import get_vuetify_catalog, validate_vuetify_usage
+from google.adk.tools import FunctionTool, ToolContext
+from ..design_agent.tools import get_component_analysis, load_session_analysis, save_session_analysis
 
 # 環境変数を読み込み
-load_dotenv()
+load_config()
 
 def vue_component_analysis(component_code: str, file_path: str = "component.vue") -> Dict[str, Any]:
     """Vue.jsコンポーネントの詳細分析"""
@@ -278,9 +290,156 @@ def material_design_review(component_code: str) -> Dict[str, Any]:
     
     return review_result
 
-def comprehensive_evaluation(component_code: str, file_path: str = "component.vue") -> Dict[str, Any]:
-    """総合評価とレポート生成"""
+def _element_line(component_code: str, tag: str, without: tuple = ()) -> Optional[int]:
+    """tag 要素（without の属性をどれも持たないもの）のうち最初のものの行番号"""
+    for token in _TAG_TOKEN.finditer(component_code):
+        if token.group(2) is None or token.group(1) or token.group(2).lower() != tag:
+            continue
+        if not set(without) & _attr_names(token.group(3)).keys():
+            return component_code.count("\n", 0, token.start()) + 1
+    return None
+
+def _small_font_line(component_code: str) -> Optional[int]:
+    for match in re.finditer(r'font-size:\s*(\d+)px', component_code):
+        if int(match.group(1)) < 16:
+            return component_code.count("\n", 0, match.start()) + 1
+    return None
+
+# WCAGの問題メッセージ -> (ルールID, 重要度, 該当箇所の行番号を返す関数)
+# コンポーネント全体に対する問題（コントラスト・フォーカス表示など）は行番号を持たない
+WCAG_ISSUE_RULES = [
+    ("画像に代替テキスト", "wcag.1.1.1.img-alt", "high", lambda code: _element_line(code, "img", ("alt",))),
+    ("色彩のコントラスト比", "wcag.1.4.3.contrast", "low", None),
+    ("16px未満の小さなフォント", "wcag.1.4.4.font-size", "medium", _small_font_line),
+    ("適切なタブインデックス", "wcag.2.1.1.keyboard", "medium", None),
+    ("フォーカス状態のスタイル", "wcag.2.4.7.focus-visible", "medium", None),
+    ("入力フィールドにラベル", "wcag.3.3.2.labels", "medium", lambda code: _element_line(code, "input")),
+    ("エラーメッセージが適切に", "wcag.3.3.1.error-identification", "low", None),
+    ("HTMLタグの開閉", "wcag.4.1.1.parsing", "high", None),
+]
+
+# ヒューリスティック -> 問題の原因となる要素
+HEURISTIC_ELEMENTS = {
+    "consistency_and_standards": "button",
+    "error_prevention": "form",
+}
+
+_SEVERITY_ORDER = {"high": 0, "medium": 1, "low": 2}
+
+# 評価結果の保存（get_evaluation_result で ID から取得）
+_EVALUATION_STORE_SIZE = 64
+_evaluation_store: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+def collect_evaluation_issues(component_code: str, wcag_compliance: Dict, heuristic_eval: Dict, material_review: Dict) -> List[Dict[str, Any]]:
+    """各評価の問題をルールID・重要度・該当行付きの一覧にまとめる（重要度順）"""
+    issues = []
+    
+    for category, data in wcag_compliance["categories"].items():
+        for issue in map(normalize_wcag_issue, data["issues"]):
+            message = issue["description"]
+            rule = next((r for r in WCAG_ISSUE_RULES if message.startswith(r[0])), None)
+            issues.append({
+                "rule": rule[1] if rule else f"wcag.{category}",
+                "severity": rule[2] if rule else issue.get("severity", "medium"),
+                "line": rule[3](component_code) if rule and rule[3] else None,
+                "message": message
+            })
+    
+    for heuristic_key, data in heuristic_eval["heuristics"].items():
+        for message in data["issues"]:
+            issues.append({
+                "rule": f"nielsen.{heuristic_key}",
+                "severity": "medium" if data["score"] < 3 else "low",
+                "line": _element_line(component_code, HEURISTIC_ELEMENTS[heuristic_key]) if heuristic_key in HEURISTIC_ELEMENTS else None,
+                "message": message
+            })
+    
+    for category, data in material_review["categories"].items():
+        for issue in data["issues"]:
+            issues.append({
+                "rule": f"md3.{category}",
+                "severity": issue["severity"],
+                "line": None,
+                "message": issue["description"]
+            })
+    
+    # Vuetify のコンポーネント・props の誤用（node_modules にカタログがある場合のみ）
+    catalog = get_vuetify_catalog()
+    if catalog.available:
+        for issue in catalog.validate_sfc(component_code)["issues"]:
+            issues.append({
+                "rule": issue["rule"],
+                "severity": issue["severity"],
+                "line": issue["line"],
+                "message": issue["message"]
+            })
     
+    issues.sort(key=lambda i: _SEVERITY_ORDER.get(i["severity"], len(_SEVERITY_ORDER)))
+    return issues
+
+def _estimate_tokens(value: Any) -> int:
+    """JSONにした場合のトークン数の概算（日本語を含むため2文字≒1トークンとする）"""
+    return len(json.dumps(value, ensure_ascii=False)) // 2 + 1
+
+def comprehensive_evaluation(
+    component_code: str,
+    file_path: str = "component.vue",
+    detail: str = "summary",
+    max_issues: int = 10,
+    token_budget: int = 600,
+    tool_context: Optional[ToolContext] = None
+) -> Dict[str, Any]:
+    """総合評価とレポート生成
+
+    Args:
+        component_code: Vue.jsコンポーネントのコード
+        file_path: コンポーネントのファイルパス
+        detail: "summary"（スコアと上位の問題のみ、token_budget 以内）/ "issues"（全問題の一覧）/ "full"（全評価結果）
+        max_issues: summary に含める問題の最大件数
+        token_budget: summary の概算トークン数の上限
+
+    全評価結果はサーバー側に保存され、evaluation_id を get_evaluation_result に渡して取得できる。
+    問題の一覧はセッションの分析結果（get_component_analysis）と共有し、同じ内容なら再計算しない。
+    """
+    if detail not in ("summary", "issues", "full"):
+        return {"status": "error", "message": f"detail は summary / issues / full のいずれかを指定してください: {detail}"}
+    
+    cached = None
+    if tool_context is not None and detail != "full":
+        cached = load_session_analysis(tool_context, file_path, component_code, "evaluation")
+    if cached is not None:
+        evaluation_id = _evaluation_id(file_path, component_code)
+        compact = {**cached, "file_path": file_path}
+        # 全評価結果がこのプロセスに残っている場合のみ evaluation_id を返す
+        if evaluation_id in _evaluation_store:
+            compact = {"evaluation_id": evaluation_id, **compact}
+    else:
+        result, compact = _evaluate(component_code, file_path)
+        if detail == "full":
+            return result
+        if tool_context is not None:
+            save_session_analysis(tool_context, file_path, component_code, "evaluation", compact)
+    if detail == "issues":
+        return compact
+    
+    # summary: 上位の問題から token_budget に収まる分だけ含める
+    issues = compact["issues"]
+    compact = {**compact, "issues": []}
+    for issue in issues[:max(0, max_issues)]:
+        compact["issues"].append(issue)
+        if _estimate_tokens(compact) > token_budget and len(compact["issues"]) > 1:
+            compact["issues"].pop()
+            break
+    compact["omitted_issues"] = len(issues) - len(compact["issues"])
+    if compact["omitted_issues"] and "evaluation_id" in compact:
+        compact["more"] = "get_evaluation_result(evaluation_id, section) で全結果を取得できます"
+    return compact
+
+def _evaluation_id(file_path: str, component_code: str) -> str:
+    return hashlib.sha256(f"{file_path}\0{component_code}".encode("utf-8")).hexdigest()[:16]
+
+def _evaluate(component_code: str, file_path: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """全評価を実行して _evaluation_store に保存し、(全評価結果, detail="issues" の結果) を返す"""
     # 各評価の実行
     component_analysis = vue_component_analysis(component_code, file_path)
     wcag_compliance = wcag_compliance_check(component_code)
@@ -307,7 +466,11 @@ def comprehensive_evaluation(component_code: str, file_path: str = "component.vu
         wcag_compliance, heuristic_eval, material_review
     )
     
-    return {
+    issues = collect_evaluation_issues(component_code, wcag_compliance, heuristic_eval, material_review)
+    evaluation_id = _evaluation_id(file_path, component_code)
+    
+    result = {
+        "evaluation_id": evaluation_id,
         "overall_score": round(overall_score, 2),
         "grade": get_grade(overall_score),
         "detailed_scores": scores,
@@ -317,8 +480,41 @@ def comprehensive_evaluation(component_code: str, file_path: str = "component.vu
         "material_design_review": material_review,
         "improvement_suggestions": improvement_suggestions,
         "prioritized_issues": prioritized_issues,
+        "issues": issues,
         "summary": generate_evaluation_summary(overall_score, prioritized_issues)
     }
+    
+    _evaluation_store[evaluation_id] = result
+    _evaluation_store.move_to_end(evaluation_id)
+    while len(_evaluation_store) > _EVALUATION_STORE_SIZE:
+        _evaluation_store.popitem(last=False)
+    
+    return result, {
+        "evaluation_id": evaluation_id,
+        "file_path": file_path,
+        "overall_score": result["overall_score"],
+        "grade": result["grade"],
+        "wcag_level": wcag_compliance["overall_level"],
+        "detailed_scores": {key: round(value, 1) for key, value in scores.items()},
+        "issue_count": len(issues),
+        "issues": issues
+    }
+
+def get_evaluation_result(evaluation_id: str, section: str = "") -> Dict[str, Any]:
+    """comprehensive_evaluation の全評価結果を evaluation_id で取得
+
+    Args:
+        evaluation_id: comprehensive_evaluation が返した evaluation_id
+        section: 取得するセクション（例: "wcag_compliance"、"issues"）。省略時は全体
+    """
+    result = _evaluation_store.get(evaluation_id)
+    if result is None:
+        return {"status": "error", "message": f"評価結果 '{evaluation_id}' が見つかりません。comprehensive_evaluation を再実行してください"}
+    if not section:
+        return result
+    if section not in result:
+        return {"status": "error", "message": f"セクション '{section}' はありません", "available_sections": list(result.keys())}
+    return {"evaluation_id": evaluation_id, section: result[section]}
 
 # ヘルパー関数の実装
 def calculate_template_complexity(component_code: str) -> int:
@@ -376,12 +572,14 @@ def detailed_accessibility_check(component_code: str) -> List[str]:
 
 def analyze_performance_indicators(component_code: str) -> Dict[str, Any]:
     """パフォーマンス指標の分析"""
+    script = build_sfc_script_index(component_code)
+    template = extract_template_section(component_code)
     indicators = {
-        "computed_properties": len(re.findall(r'computed:', component_code)),
-        "watchers": len(re.findall(r'watch:', component_code)),
-        "event_listeners": len(re.findall(r'@\w+', component_code)),
-        "reactive_refs": len(re.findall(r'ref\(', component_code)),
-        "template_refs": len(re.findall(r'ref="', component_code)),
+        "computed_properties": len(script.calls_of(COMPUTED_APIS)) + len(script.options.get("computed", [])),
+        "watchers": len(script.calls_of(WATCH_APIS)) + len(script.options.get("watch", [])),
+        "event_listeners": len(re.findall(r'(?:@|v-on:)[\w:.-]+\s*=', template)),
+        "reactive_refs": len(script.calls_of(REACTIVE_APIS)),
+        "template_refs": len(re.findall(r'\sref="', template)),
         "potential_issues": []
     }
     
@@ -526,13 +724,19 @@ def check_material_motion(component_code: str) -> bool:
     motion_keywords = ['transition', 'animation', 'v-fade-transition', 'v-slide-transition']
     return any(motion in component_code for motion in motion_keywords)
 
+def normalize_wcag_issue(issue: Any) -> Dict[str, Any]:
+    """WCAGの問題（文字列または辞書）を辞書形式に揃える"""
+    if isinstance(issue, dict):
+        return issue
+    return {"severity": "medium", "description": str(issue), "solution": ""}
+
 def generate_improvement_suggestions(wcag_compliance: Dict, heuristic_eval: Dict, material_review: Dict) -> List[Dict[str, Any]]:
     """改善提案の生成"""
     suggestions = []
     
     # WCAG準拠の改善提案
     for category, data in wcag_compliance["categories"].items():
-        for issue in data["issues"]:
+        for issue in map(normalize_wcag_issue, data["issues"]):
             suggestions.append({
                 "category": "WCAG 2.1",
                 "priority": issue["severity"],
@@ -560,7 +764,7 @@ def prioritize_issues(wcag_compliance: Dict, heuristic_eval: Dict, material_revi
     
     # 高優先度: WCAG準拠の重要な問題
     for category, data in wcag_compliance["categories"].items():
-        for issue in data["issues"]:
+        for issue in map(normalize_wcag_issue, data["issues"]):
             if issue["severity"] == "high":
                 issues.append({
                     "priority": "高",
@@ -623,20 +827,32 @@ def find_line_number(content: str, search_term: str) -> int:
             return i
     return 0
 
-def create_evaluation_agent():
-    """評価エージェントを作成"""
+def create_evaluation_agent(memoize: Optional[bool] = None):
+    """評価エージェントを作成
+
+    Args:
+        memoize: 決定的なツールの結果をキャッシュするか（None の場合は環境変数 UI_TOOL_CACHE に従う）
+    """
     
     # ツールを作成
-    analysis_tool = FunctionTool(func=vue_component_analysis)
-    wcag_tool = FunctionTool(func=wcag_compliance_check)
+    analysis_tool = make_function_tool(vue_component_analysis, memoize)
+    wcag_tool = make_function_tool(wcag_compliance_check, memoize)
+    vuetify_tool = make_function_tool(validate_vuetify_usage, memoize)
+    # comprehensive_evaluation は結果を保存する副作用があり、get_evaluation_result は保存済みの
+    # 結果を参照するだけなので、どちらもキャッシュしない
+    evaluation_tool = make_function_tool(comprehensive_evaluation, memoize=False)
+    result_tool = make_function_tool(get_evaluation_result, memoize=False)
+    # Artifact の分析結果はセッション状態で他のエージェントと共有する
+    artifact_analysis_tool = FunctionTool(func=get_component_analysis)
+    tools = [analysis_tool, wcag_tool, vuetify_tool, evaluation_tool, result_tool, artifact_analysis_tool]
     
     # エージェントを作成
     agent = Agent(
-        name="evaluation_agent",
-        model="gemini-1.5-flash-8b",
-        description="Vue.jsコンポーネントの包括的な評価を行い、WCAG 2.1準拠性とユーザビリティを詳細に分析する専門エージェント",
-        instruction=create_evaluation_instruction(),
-        tools=[analysis_tool, wcag_tool]
+        name=AGENT_NAME,
+        model=resolve_model("gemini-1.5-flash-8b"),
+        description=AGENT_DESCRIPTION,
+        instruction=build_instruction(AGENT_NAME, create_evaluation_instruction(), tools),
+        tools=tools
     )
     
-    return agent 
\ No newline at end of file
+    return instrument_agent(agent) 
\ No newline at end of file
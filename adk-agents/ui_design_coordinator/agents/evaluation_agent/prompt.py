@@ -100,9 +100,14 @@ design_agentから受け取ったVue.jsコンポーネントを以下の観点
 
 1. **vue_component_analysis**: Vue.jsコンポーネントの詳細分析
 2. **wcag_compliance_check**: WCAG 2.1準拠性チェック
-3. **heuristic_evaluation**: ニールセンの10のヒューリスティック評価
-4. **material_design_review**: Material Design準拠性レビュー
-5. **comprehensive_evaluation**: 総合評価とレポート生成
+3. **validate_vuetify_usage**: Vuetify のコンポーネント・props・イベント・スロットが実在するかの検証（typo の候補付き）
+4. **comprehensive_evaluation**: WCAG・ニールセンの10のヒューリスティック・Material Design を含む総合評価
+   （既定は要約。detail="issues" で全問題、detail="full" で全結果）
+5. **get_evaluation_result**: evaluation_id から保存済みの全評価結果（またはセクション）を取得
+
+プロジェクトの既存コンポーネントを評価する場合は、コードを受け渡す代わりに
+`get_component_analysis(component_name="src/components/Login")` を使用してください。
+同じセッションで他のエージェントが計算した分析結果（outline / metrics / evaluation）が再利用されます。
 
 # 評価結果フォーマット
 
@@ -1,3 +1,9 @@
-from .agent import create_improvement_agent
+from .._lazy import lazy_getattr
+
+AGENT_NAME = "improvement_agent"
+AGENT_DESCRIPTION = "UI/UX改善提案と最適化計画を作成する専門エージェント"
+
+# factory は初回参照時に import する（ツールモジュールの読み込みを遅延）
+__getattr__ = lazy_getattr(__name__, {"create_improvement_agent": ".agent"})
 
 __all__ = ["create_improvement_agent"] 
\ No newline at end of file
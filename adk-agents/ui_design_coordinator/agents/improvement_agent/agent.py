@@ -1,10 +1,22 @@
-from dotenv import load_dotenv
 from google.adk import Agent
 from google.adk.tools import FunctionTool
 from .prompt import IMPROVEMENT_AGENT_INSTRUCTION
+from ...config import load_config
+from ...llm_cache import resolve_model
+from ...prompt_manifest import build_instruction
+from ...tracing import instrument_agent
+from . import AGENT_NAME, AGENT_DESCRIPTION
+from ..design_agent.tools import get_component_analysis
+from ...tools.batch_pipeline import evaluate_components
+from ...tools.vue_integration_tools import (
+    begin_virtual_edits,
+    commit_virtual_edits,
+    discard_virtual_edits,
+    modify_existing_component,
+)
 
 # 環境変数を読み込み
-load_dotenv()
+load_config()
 
 def generate_improvement_suggestions(evaluation_results: dict) -> dict:
     """評価結果に基づいて改善提案を生成する"""
@@ -71,14 +83,24 @@ def create_improvement_agent():
     # ツールを作成
     suggestion_tool = FunctionTool(func=generate_improvement_suggestions)
     optimization_tool = FunctionTool(func=create_optimization_plan)
+    analysis_tool = FunctionTool(func=get_component_analysis)
+    # 改善案を仮想編集セッションに適用し、書き込む前に再評価する
+    edit_tools = [
+        FunctionTool(func=begin_virtual_edits),
+        FunctionTool(func=modify_existing_component),
+        FunctionTool(func=evaluate_components),
+        FunctionTool(func=commit_virtual_edits),
+        FunctionTool(func=discard_virtual_edits),
+    ]
+    tools = [suggestion_tool, optimization_tool, analysis_tool, *edit_tools]
     
     # エージェントを作成
     agent = Agent(
-        name="improvement_agent",
-        model="gemini-1.5-flash-8b",
-        description="UI/UX改善提案と最適化計画を作成する専門エージェント",
-        instruction=IMPROVEMENT_AGENT_INSTRUCTION,
-        tools=[suggestion_tool, optimization_tool]
+        name=AGENT_NAME,
+        model=resolve_model("gemini-1.5-flash-8b"),
+        description=AGENT_DESCRIPTION,
+        instruction=build_instruction(AGENT_NAME, IMPROVEMENT_AGENT_INSTRUCTION, tools),
+        tools=tools
     )
     
-    return agent 
\ No newline at end of file
+    return instrument_agent(agent) 
\ No newline at end of file
@@ -111,6 +111,11 @@ evaluation_agentから受け取った詳細な分析結果に基づいて、実
 5. **テスト可能性**: テストしやすいコード構造
 
 改善は具体的で実装可能な内容とし、変更理由を明確にしてください。
+既存コンポーネントの分析結果・評価の問題一覧は `get_component_analysis(component_name)` で取得できます
+（同じセッションで計算済みの結果は再利用されます）。
+改善をファイルに反映する場合は `begin_virtual_edits()` の後に `modify_existing_component(...)` で変更を保持し、
+`evaluate_components(...)` で未確定の内容を再評価してから `commit_virtual_edits()` で書き込んでください
+（改善が不十分なら `discard_virtual_edits()` で破棄します）。
 """
 
     return base_instruction.format(existing_patterns=existing_patterns)
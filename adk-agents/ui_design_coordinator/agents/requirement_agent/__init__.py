@@ -1,3 +1,9 @@
-from .agent import create_requirement_agent
+from .._lazy import lazy_getattr
+
+AGENT_NAME = "requirement_agent"
+AGENT_DESCRIPTION = "ユーザーの要求を分析し、構造化された要件に変換する専門エージェント"
+
+# factory は初回参照時に import する（ツールモジュールの読み込みを遅延）
+__getattr__ = lazy_getattr(__name__, {"create_requirement_agent": ".agent"})
 
 __all__ = ["create_requirement_agent"] 
\ No newline at end of file
@@ -1,10 +1,14 @@
-from dotenv import load_dotenv
 from google.adk import Agent
 from google.adk.tools import FunctionTool
 from .prompt import REQUIREMENT_AGENT_INSTRUCTION
+from ...config import load_config
+from ...llm_cache import resolve_model
+from ...prompt_manifest import build_instruction
+from ...tracing import instrument_agent
+from . import AGENT_NAME, AGENT_DESCRIPTION
 
 # 環境変数を読み込み
-load_dotenv()
+load_config()
 
 def analyze_user_requirements(user_input: str) -> dict:
     """ユーザーの要求を分析し、構造化された要件に変換する"""
@@ -42,14 +46,15 @@ def create_requirement_agent(artifact_service=None):
     # ツールを作成
     analyze_tool = FunctionTool(func=analyze_user_requirements)
     specification_tool = FunctionTool(func=create_specification_document)
+    tools = [analyze_tool, specification_tool]
     
     # エージェントを作成
     agent = Agent(
-        name="requirement_agent",
-        model="gemini-1.5-flash-8b",
-        description="ユーザーの要求を分析し、構造化された要件に変換する専門エージェント",
-        instruction=REQUIREMENT_AGENT_INSTRUCTION,
-        tools=[analyze_tool, specification_tool]
+        name=AGENT_NAME,
+        model=resolve_model("gemini-1.5-flash-8b"),
+        description=AGENT_DESCRIPTION,
+        instruction=build_instruction(AGENT_NAME, REQUIREMENT_AGENT_INSTRUCTION, tools),
+        tools=tools
     )
     
-    return agent 
\ No newline at end of file
+    return instrument_agent(agent) 
\ No newline at end of file
@@ -0,0 +1,15 @@
+"""
+共通設定の読み込み
+
+各エージェントモジュールから呼ばれるが、.env の読み込みはプロセス内で1回だけ行う。
+"""
+
+from functools import lru_cache
+
+from dotenv import load_dotenv
+
+
+@lru_cache(maxsize=None)
+def load_config() -> bool:
+    """.env を読み込む（2回目以降は何もしない）"""
+    return load_dotenv()
@@ -0,0 +1,59 @@
+"""
+初回使用時にエージェントを構築する AgentTool
+
+ルートエージェントの import 時にはサブエージェント（とそのツールモジュール）を
+構築せず、ツール宣言の生成や実行で初めて `agent` が参照された時点で factory を呼ぶ。
+宣言と実行は、その時点で作成する AgentTool に委譲する。
+"""
+
+from typing import Any, Callable, Optional
+
+from google.adk.agents import BaseAgent
+from google.adk.tools import BaseTool, ToolContext
+from google.adk.tools.agent_tool import AgentTool
+from google.genai import types
+
+from .startup_profiler import get_startup_profiler
+
+
+class LazyAgentTool(BaseTool):
+    """factory で遅延構築したエージェントを AgentTool として実行するツール"""
+
+    def __init__(
+        self,
+        factory: Callable[[], BaseAgent],
+        name: str,
+        description: str,
+        skip_summarization: bool = False,
+    ):
+        super().__init__(name=name, description=description)
+        self._factory = factory
+        self._skip_summarization = skip_summarization
+        self._agent_tool: Optional[AgentTool] = None
+
+    @property
+    def agent_tool(self) -> AgentTool:
+        """エージェントを構築してラップした AgentTool（初回参照時に作成）"""
+        if self._agent_tool is None:
+            with get_startup_profiler().measure(self.name):
+                agent = self._factory()
+            self._agent_tool = AgentTool(agent=agent, skip_summarization=self._skip_summarization)
+        return self._agent_tool
+
+    @property
+    def agent(self) -> BaseAgent:
+        return self.agent_tool.agent
+
+    @property
+    def is_built(self) -> bool:
+        """エージェントが構築済みかどうか"""
+        return self._agent_tool is not None
+
+    def _get_declaration(self) -> Optional[types.FunctionDeclaration]:
+        declaration = self.agent_tool._get_declaration()
+        if declaration is not None:
+            declaration.name = self.name
+        return declaration
+
+    async def run_async(self, *, args: dict[str, Any], tool_context: ToolContext) -> Any:
+        return await self.agent_tool.run_async(args=args, tool_context=tool_context)
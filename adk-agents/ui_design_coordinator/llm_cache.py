@@ -0,0 +1,185 @@
+"""
+LLM レスポンスの記録・再生（record / replay）
+
+エージェントのモデルを `RecordReplayLlm` で包み、正規化したリクエストのハッシュを
+キーにレスポンスをローカルに保存する。replay モードではネットワークに接続せず
+保存済みのレスポンスを返すため、オーケストレーションの変更をオフラインで
+ベンチマークしたり、セッションを決定的に再実行したりできる。
+
+環境変数:
+    UI_LLM_CACHE      off（既定）/ record（常に LLM を呼んで保存）/
+                      replay（保存済みのみ。ない場合はエラー）/ auto（保存済みなら再生、なければ記録）
+    UI_LLM_CACHE_DIR  保存先（既定: adk-agents/.cache/llm）
+
+正規化では ADK が付与する function call / response の ID と HTTP オプション、
+ツール結果のうち実行ごとに変わる項目（処理時間・ツール結果キャッシュの情報）を除外する。
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, AsyncGenerator, Dict, List, Optional, Union
+
+from google.adk.models import BaseLlm, LlmRequest, LlmResponse
+from google.adk.models.registry import LLMRegistry
+
+ENV_MODE = "UI_LLM_CACHE"
+ENV_DIR = "UI_LLM_CACHE_DIR"
+MODES = ("off", "record", "replay", "auto")
+
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parents[1] / ".cache" / "llm"
+
+# キーから除外する GenerateContentConfig の項目（レスポンスの内容に影響しない）
+_IGNORED_CONFIG_KEYS = {"http_options", "labels"}
+
+
+# キーから除外するツール結果（function_response.response）内の項目（実行ごとに変わる）
+_VOLATILE_RESPONSE_KEYS = {"elapsed_seconds", "_cache"}
+
+
+class LlmReplayMiss(RuntimeError):
+    """replay モードで保存済みのレスポンスが見つからない場合の例外"""
+
+
+def _strip_call_ids(value: Any, parent: str = "") -> Any:
+    if isinstance(value, dict):
+        return {
+            key: _strip_call_ids(item, key)
+            for key, item in value.items()
+            if not (key == "id" and parent in ("function_call", "function_response"))
+        }
+    if isinstance(value, list):
+        return [_strip_call_ids(item, parent) for item in value]
+    return value
+
+
+def _strip_volatile(value: Any) -> Any:
+    if isinstance(value, dict):
+        return {key: _strip_volatile(item) for key, item in value.items() if key not in _VOLATILE_RESPONSE_KEYS}
+    if isinstance(value, list):
+        return [_strip_volatile(item) for item in value]
+    return value
+
+
+def _normalize_content(content: Dict[str, Any]) -> Dict[str, Any]:
+    parts = []
+    for part in content.get("parts", []):
+        response = part.get("function_response")
+        if response and "response" in response:
+            part = {**part, "function_response": {**response, "response": _strip_volatile(response["response"])}}
+        parts.append(part)
+    return {**content, "parts": parts} if "parts" in content else content
+
+
+def normalize_request(llm_request: LlmRequest, stream: bool = False) -> Dict[str, Any]:
+    """キャッシュキーの元になるリクエストの正規形"""
+    config = llm_request.config.model_dump(mode="json", exclude_none=True) if llm_request.config else {}
+    return {
+        "model": llm_request.model,
+        "stream": stream,
+        "contents": _strip_call_ids([
+            _normalize_content(c.model_dump(mode="json", exclude_none=True)) for c in llm_request.contents
+        ]),
+        "config": {key: value for key, value in config.items() if key not in _IGNORED_CONFIG_KEYS},
+    }
+
+
+def request_key(llm_request: LlmRequest, stream: bool = False) -> str:
+    payload = json.dumps(normalize_request(llm_request, stream), sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LlmResponseStore:
+    """{root}/{key[:2]}/{key}.json にリクエストとレスポンス列を保存するストア"""
+
+    def __init__(self, root: Optional[Union[str, Path]] = None):
+        self.root = Path(root or os.environ.get(ENV_DIR) or DEFAULT_CACHE_DIR)
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> Optional[List[LlmResponse]]:
+        try:
+            record = json.loads(self._path(key).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        return [LlmResponse.model_validate(response) for response in record["responses"]]
+
+    def put(self, key: str, request: Dict[str, Any], responses: List[LlmResponse]) -> None:
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        record = {
+            "key": key,
+            "model": request["model"],
+            "recorded_at": time.time(),
+            "request": request,
+            "responses": [_strip_call_ids(r.model_dump(mode="json", exclude_none=True)) for r in responses],
+        }
+        fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(record, f, ensure_ascii=False)
+            os.replace(temp_path, path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+            raise
+
+
+class RecordReplayLlm(BaseLlm):
+    """LLM のレスポンスを記録・再生するモデルラッパー"""
+
+    mode: str = "auto"
+    store_dir: Optional[str] = None
+    inner: Optional[BaseLlm] = None
+
+    def _inner_llm(self) -> BaseLlm:
+        if self.inner is None:
+            self.inner = LLMRegistry.new_llm(self.model)
+        return self.inner
+
+    def _store(self) -> LlmResponseStore:
+        return LlmResponseStore(self.store_dir)
+
+    async def generate_content_async(
+        self, llm_request: LlmRequest, stream: bool = False
+    ) -> AsyncGenerator[LlmResponse, None]:
+        store = self._store()
+        request = normalize_request(llm_request, stream)
+        key = request_key(llm_request, stream)
+
+        if self.mode in ("replay", "auto"):
+            cached = store.get(key)
+            if cached is not None:
+                for response in cached:
+                    response.custom_metadata = {**(response.custom_metadata or {}), "llm_cache": "hit", "llm_cache_key": key}
+                    yield response
+                return
+            if self.mode == "replay":
+                raise LlmReplayMiss(f"No recorded LLM response for request {key} (model={self.model})")
+
+        responses = []
+        async for response in self._inner_llm().generate_content_async(llm_request, stream=stream):
+            responses.append(response.model_copy(deep=True))
+            yield response
+
+        # エラーレスポンスは記録しない（次回は再度 LLM を呼ぶ）
+        if responses and not any(r.error_code for r in responses):
+            store.put(key, request, responses)
+
+    def connect(self, llm_request: LlmRequest):
+        # Live API（双方向ストリーミング）は記録対象外
+        return self._inner_llm().connect(llm_request)
+
+
+def resolve_model(model: str) -> Union[str, BaseLlm]:
+    """エージェントに渡すモデル（UI_LLM_CACHE が off の場合はモデル名のまま）"""
+    mode = os.environ.get(ENV_MODE, "off").lower()
+    if mode not in MODES:
+        raise ValueError(f"{ENV_MODE} must be one of {MODES}: {mode!r}")
+    if mode == "off":
+        return model
+    return RecordReplayLlm(model=model, mode=mode)
@@ -0,0 +1,148 @@
+"""
+登録済みツールからのプロンプト生成
+
+各エージェントの instruction の末尾に、実際に登録されたツールの一覧
+（名前・シグネチャ・1行の説明）を付け加える。プロンプト本文に手書きの
+ツール一覧を持たないことで、存在しないツールをモデルに案内しないようにする。
+
+生成したプロンプトごとに概算トークン数を記録し、本文中で `name(` の形で
+参照されているのに登録されていないツールがあれば警告する。`name` の形の参照は、
+いずれかのエージェントに登録されたツール名・エージェント名・共通ツール
+（tools パッケージ）と一致する場合だけ同様に扱う。
+一覧は `tools/prompt_report.py` で確認できる。
+"""
+
+import inspect
+import logging
+import re
+from typing import Any, Dict, List, Optional, Set
+
+from google.adk.tools import BaseTool, FunctionTool
+from google.adk.tools.agent_tool import AgentTool
+
+from .lazy_agent_tool import LazyAgentTool
+
+logger = logging.getLogger(__name__)
+
+# 本文中のツール参照（`name(` 形式）
+_TOOL_REFERENCE = re.compile(r'`(\w+)\(')
+# 本文中の識別子の参照（`name` 形式、既知のツール・エージェント名のみ参照とみなす）
+_NAME_REFERENCE = re.compile(r'`(\w+)`')
+
+# エージェント名 -> プロンプトの統計
+_prompt_stats: Dict[str, Dict[str, Any]] = {}
+# エージェント名 -> 本文中の `name` 形式の識別子
+_name_references: Dict[str, Set[str]] = {}
+
+
+def estimate_tokens(text: str) -> int:
+    """トークン数の概算（ASCII は4文字≒1トークン、それ以外は1文字≒1トークン）"""
+    ascii_chars = sum(1 for c in text if ord(c) < 128)
+    return (ascii_chars + 3) // 4 + (len(text) - ascii_chars)
+
+
+def _annotation_name(annotation: Any) -> str:
+    if annotation is inspect.Parameter.empty:
+        return ""
+    if isinstance(annotation, str):
+        return annotation
+    name = getattr(annotation, "__name__", None)
+    return name if name and not getattr(annotation, "__args__", None) else str(annotation).replace("typing.", "")
+
+
+def tool_signature(tool: BaseTool) -> str:
+    """ツールのシグネチャ（ToolContext 引数を除く）"""
+    if isinstance(tool, (AgentTool, LazyAgentTool)):
+        return f"{tool.name}(request: str)"
+    func = getattr(tool, "func", None)
+    if not isinstance(tool, FunctionTool) or func is None:
+        return f"{tool.name}(...)"
+
+    params = []
+    for name, param in inspect.signature(func).parameters.items():
+        if name in ("tool_context", "input_stream") or param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD):
+            continue
+        text = name
+        annotation = _annotation_name(param.annotation)
+        if annotation:
+            text += f": {annotation}"
+        if param.default is not inspect.Parameter.empty:
+            text += f" = {param.default!r}"
+        params.append(text)
+    return f"{tool.name}({', '.join(params)})"
+
+
+def tool_summary(tool: BaseTool) -> str:
+    """ツールの説明の1行目"""
+    for line in (tool.description or "").splitlines():
+        if line.strip():
+            return line.strip()
+    return ""
+
+
+def tool_manifest(tools: List[BaseTool]) -> List[Dict[str, str]]:
+    """ツールの一覧（name / signature / summary）"""
+    return [{"name": tool.name, "signature": tool_signature(tool), "summary": tool_summary(tool)} for tool in tools]
+
+
+def render_tool_section(tools: List[BaseTool]) -> str:
+    """プロンプトに付け加えるツール一覧のセクション"""
+    lines = ["## 利用可能なツール", "", "以下のツールだけが登録されています（これ以外のツールは呼び出せません）:"]
+    for entry in tool_manifest(tools):
+        line = f"- `{entry['signature']}`"
+        if entry["summary"] and entry["summary"] != entry["name"]:
+            line += f": {entry['summary']}"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+def build_instruction(agent_name: str, body: str, tools: List[BaseTool]) -> str:
+    """プロンプト本文に登録済みツールの一覧を付け加えた instruction を作成"""
+    instruction = f"{body.rstrip()}\n\n---\n{render_tool_section(tools)}\n"
+
+    tool_names = {tool.name for tool in tools}
+    unknown = sorted({name for name in _TOOL_REFERENCE.findall(body) if name not in tool_names})
+    if unknown:
+        logger.warning("Prompt for %s references unregistered tools: %s", agent_name, ", ".join(unknown))
+
+    _prompt_stats[agent_name] = {
+        "agent": agent_name,
+        "chars": len(instruction),
+        "estimated_tokens": estimate_tokens(instruction),
+        "tools": sorted(tool_names),
+        "unknown_tool_references": unknown,
+    }
+    _name_references[agent_name] = set(_NAME_REFERENCE.findall(body))
+    return instruction
+
+
+def _known_names() -> Set[str]:
+    """構築済みのエージェント名・登録済みツール名・共通ツール名"""
+    from . import tools
+
+    names = set(tools.__all__)
+    for entry in _prompt_stats.values():
+        names.add(entry["agent"])
+        names.update(entry["tools"])
+    return names
+
+
+def _with_name_references(entry: Dict[str, Any], known: Set[str]) -> Dict[str, Any]:
+    """`name` 形式の参照のうち、既知の名前で未登録のものを unknown_tool_references に加える"""
+    unknown = {
+        name for name in _name_references.get(entry["agent"], ())
+        if name in known and name not in entry["tools"] and name != entry["agent"]
+    }
+    return {**entry, "unknown_tool_references": sorted(unknown.union(entry["unknown_tool_references"]))}
+
+
+def get_prompt_stats(agent_name: Optional[str] = None) -> Any:
+    """build_instruction で作成したプロンプトの統計
+
+    `name` 形式の参照は、その時点で構築済みのエージェントの名前と照合する。
+    """
+    known = _known_names()
+    if agent_name is not None:
+        entry = _prompt_stats.get(agent_name)
+        return _with_name_references(entry, known) if entry is not None else None
+    return {name: _with_name_references(entry, known) for name, entry in _prompt_stats.items()}
@@ -0,0 +1,287 @@
+"""
+起動時間のプロファイラ
+
+環境変数 `UI_STARTUP_PROFILE=1` で有効化すると、パッケージの import 時に
+import フックを登録し、モジュールごとの import 時間（累積 / 自身のみ）と
+エージェント factory ごとの構築時間を記録する。
+
+環境変数:
+    UI_STARTUP_PROFILE         "1" で有効化
+    UI_STARTUP_PROFILE_OUTPUT  レポート（JSON）の出力先。プロセス終了時にも更新する
+    UI_STARTUP_BUDGETS         起動時間の予算（秒）。例: "ready=2.0,group:google.adk=1.5,factory:design_agent=0.3"
+
+予算のキー:
+    ready              パッケージの import 完了（root_agent 構築完了）までの時間
+    total              レポート作成時点までの時間（遅延構築された factory を含む）
+    import:<module>    モジュールの累積 import 時間
+    group:<package>    パッケージ単位（google.* は2階層）の import 時間の合計
+    factory:<name>     factory の構築時間
+
+`adk web` は本パッケージより先に google.adk を import するため、コールドスタートは
+`tools/startup_benchmark.py` から別プロセスで計測する。
+"""
+
+import atexit
+import json
+import logging
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+ENV_ENABLED = "UI_STARTUP_PROFILE"
+ENV_OUTPUT = "UI_STARTUP_PROFILE_OUTPUT"
+ENV_BUDGETS = "UI_STARTUP_BUDGETS"
+
+
+class StartupBudgetExceeded(AssertionError):
+    """起動時間が予算を超えた場合の例外"""
+
+    def __init__(self, violations: List[Dict[str, Any]]):
+        self.violations = violations
+        super().__init__(", ".join(
+            f"{v['key']}: {v['seconds']:.3f}s > {v['budget']:.3f}s" for v in violations
+        ))
+
+
+def parse_budgets(spec: Optional[str]) -> Dict[str, float]:
+    """"key=seconds,key=seconds" 形式の予算を辞書に変換"""
+    budgets: Dict[str, float] = {}
+    for item in (spec or "").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        key, sep, value = item.rpartition("=")
+        if not sep or not key:
+            raise ValueError(f"Invalid startup budget: {item!r}")
+        budgets[key.strip()] = float(value)
+    return budgets
+
+
+def _group_name(module_name: str) -> str:
+    parts = module_name.split(".")
+    # google は名前空間パッケージなので2階層でまとめる（google.adk / google.genai など）
+    return ".".join(parts[:2] if parts[0] == "google" and len(parts) > 1 else parts[:1])
+
+
+class _ImportTimer:
+    """sys.meta_path の先頭に置き、各モジュールの exec_module の時間を計測する finder"""
+
+    def __init__(self, profiler: "StartupProfiler"):
+        self.profiler = profiler
+        self._local = threading.local()
+
+    def find_spec(self, fullname, path=None, target=None):
+        finding = getattr(self._local, "finding", None)
+        if finding is None:
+            finding = self._local.finding = set()
+        if fullname in finding:
+            return None
+
+        finding.add(fullname)
+        try:
+            spec = None
+            for finder in sys.meta_path:
+                if finder is self or not hasattr(finder, "find_spec"):
+                    continue
+                spec = finder.find_spec(fullname, path, target)
+                if spec is not None:
+                    break
+        finally:
+            finding.discard(fullname)
+
+        loader = spec.loader if spec is not None else None
+        # 組み込み / frozen モジュールの loader はクラスそのものなので対象外
+        if loader is None or isinstance(loader, type) or not hasattr(loader, "exec_module"):
+            return spec
+        if getattr(loader.exec_module, "_startup_timed", False):
+            return spec
+
+        original = loader.exec_module
+
+        def exec_module(module):
+            self.profiler._time_import(module.__name__, original, module)
+
+        exec_module._startup_timed = True
+        try:
+            loader.exec_module = exec_module
+        except AttributeError:
+            pass
+        return spec
+
+
+class StartupProfiler:
+    """import 時間と factory の構築時間を記録するプロファイラ"""
+
+    def __init__(self, enabled: bool = False, output: Optional[str] = None, budgets: Optional[Dict[str, float]] = None):
+        self.enabled = enabled
+        self.output = output
+        self.budgets = budgets or {}
+        self.started_at = time.perf_counter()
+        self.ready_seconds: Optional[float] = None
+        self._imports: Dict[str, Dict[str, float]] = {}
+        self._factories: List[Dict[str, Any]] = []
+        self._stack = threading.local()
+        self._timer: Optional[_ImportTimer] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "StartupProfiler":
+        return cls(
+            enabled=os.environ.get(ENV_ENABLED, "").lower() in ("1", "true", "yes"),
+            output=os.environ.get(ENV_OUTPUT) or None,
+            budgets=parse_budgets(os.environ.get(ENV_BUDGETS)),
+        )
+
+    # ------------------------------
+    # Recording
+    # ------------------------------
+    def install(self) -> None:
+        """import フックを登録（無効時は何もしない）"""
+        if not self.enabled or self._timer is not None:
+            return
+        self._timer = _ImportTimer(self)
+        sys.meta_path.insert(0, self._timer)
+        if self.output:
+            atexit.register(self.write_report)
+
+    def uninstall(self) -> None:
+        if self._timer is not None and self._timer in sys.meta_path:
+            sys.meta_path.remove(self._timer)
+        self._timer = None
+
+    def _time_import(self, name: str, exec_module: Callable[[Any], None], module: Any) -> None:
+        stack = getattr(self._stack, "children", None)
+        if stack is None:
+            stack = self._stack.children = []
+        stack.append(0.0)
+        start = time.perf_counter()
+        try:
+            exec_module(module)
+        finally:
+            elapsed = time.perf_counter() - start
+            children = stack.pop()
+            if stack:
+                stack[-1] += elapsed
+            with self._lock:
+                self._imports[name] = {"cumulative": elapsed, "self": max(elapsed - children, 0.0)}
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """factory などの処理時間を記録するコンテキストマネージャ"""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._factories.append({
+                    "name": name,
+                    "seconds": time.perf_counter() - start,
+                    "at": start - self.started_at,
+                })
+
+    def mark_ready(self) -> None:
+        """パッケージの import 完了を記録し、レポートを出力"""
+        if not self.enabled:
+            return
+        self.ready_seconds = time.perf_counter() - self.started_at
+        if self.output:
+            self.write_report()
+        for violation in check_budgets(self.report(), self.budgets):
+            logger.warning(
+                "Startup budget exceeded: %s %.3fs > %.3fs",
+                violation["key"], violation["seconds"], violation["budget"],
+            )
+
+    # ------------------------------
+    # Report
+    # ------------------------------
+    def report(self) -> Dict[str, Any]:
+        """構造化レポートを作成"""
+        with self._lock:
+            imports = dict(self._imports)
+            factories = list(self._factories)
+
+        groups: Dict[str, float] = {}
+        for name, timing in imports.items():
+            group = _group_name(name)
+            groups[group] = groups.get(group, 0.0) + timing["self"]
+
+        report = {
+            "enabled": self.enabled,
+            "python": sys.version.split()[0],
+            "ready_seconds": self.ready_seconds,
+            "total_seconds": time.perf_counter() - self.started_at,
+            "import_count": len(imports),
+            "imports": [
+                {"module": name, **timing}
+                for name, timing in sorted(imports.items(), key=lambda item: item[1]["cumulative"], reverse=True)
+            ],
+            "import_groups": dict(sorted(groups.items(), key=lambda item: item[1], reverse=True)),
+            "factories": factories,
+        }
+        report["budgets"] = dict(self.budgets)
+        report["violations"] = check_budgets(report, self.budgets)
+        return report
+
+    def write_report(self, path: Optional[str] = None) -> Optional[str]:
+        path = path or self.output
+        if not path:
+            return None
+        temp_path = f"{path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.report(), f, indent=2, ensure_ascii=False)
+        os.replace(temp_path, path)
+        return path
+
+
+def _budget_value(report: Dict[str, Any], key: str) -> Optional[float]:
+    kind, _, name = key.partition(":")
+    if key == "ready":
+        return report.get("ready_seconds")
+    if key == "total":
+        return report.get("total_seconds")
+    if kind == "import":
+        return next((i["cumulative"] for i in report["imports"] if i["module"] == name), None)
+    if kind == "group":
+        return report["import_groups"].get(name)
+    if kind == "factory":
+        seconds = [f["seconds"] for f in report["factories"] if f["name"] == name]
+        return sum(seconds) if seconds else None
+    raise ValueError(f"Unknown startup budget key: {key!r}")
+
+
+def check_budgets(report: Dict[str, Any], budgets: Dict[str, float]) -> List[Dict[str, Any]]:
+    """予算を超えた項目の一覧（計測されていない項目は対象外）"""
+    violations = []
+    for key, budget in budgets.items():
+        seconds = _budget_value(report, key)
+        if seconds is not None and seconds > budget:
+            violations.append({"key": key, "seconds": seconds, "budget": budget})
+    return violations
+
+
+def assert_budgets(report: Dict[str, Any], budgets: Optional[Dict[str, float]] = None) -> None:
+    """予算を超えた項目があれば StartupBudgetExceeded を送出"""
+    violations = check_budgets(report, report.get("budgets", {}) if budgets is None else budgets)
+    if violations:
+        raise StartupBudgetExceeded(violations)
+
+
+_startup_profiler: Optional[StartupProfiler] = None
+
+
+def get_startup_profiler() -> StartupProfiler:
+    """プロセス共有の StartupProfiler を取得（環境変数で有効な場合は import フックを登録）"""
+    global _startup_profiler
+    if _startup_profiler is None:
+        _startup_profiler = StartupProfiler.from_env()
+        _startup_profiler.install()
+    return _startup_profiler
@@ -10,18 +10,37 @@ from .ui_analysis_tools import (
 
 from .vue_integration_tools import (
     generate_vue_component,
+    generate_vue_components,
+    write_files_atomically,
     modify_existing_component,
+    list_component_backups,
+    restore_component_backup,
+    begin_virtual_edits,
+    commit_virtual_edits,
+    discard_virtual_edits,
     analyze_project_structure,
     integrate_vuetify_component
 )
 
+from .component_graph import find_affected_components
+from .vuetify_catalog import validate_vuetify_usage
+
 __all__ = [
     'analyze_vue_component',
     'evaluate_ui_design_quality',
     'check_accessibility',
     'analyze_performance_metrics',
     'generate_vue_component',
+    'generate_vue_components',
+    'write_files_atomically',
     'modify_existing_component',
+    'list_component_backups',
+    'restore_component_backup',
+    'begin_virtual_edits',
+    'commit_virtual_edits',
+    'discard_virtual_edits',
     'analyze_project_structure',
-    'integrate_vuetify_component'
+    'integrate_vuetify_component',
+    'find_affected_components',
+    'validate_vuetify_usage'
 ] 
\ No newline at end of file
@@ -0,0 +1,171 @@
+"""
+Artifact ツールのオフラインベンチマーク
+
+`LocalArtifactService` を使い、design_agent の Artifact ツール
+（save_all_vue_files_to_artifacts / list_vue_components_in_artifacts /
+get_vue_component_from_artifacts）のスループットをネットワークなしで計測する。
+
+使い方:
+    cd adk-agents
+    python -m ui_design_coordinator.tools.artifact_benchmark --iterations 10 --read-latency 0.005
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+from google.genai import types
+
+from .local_artifact_service import LocalArtifactService
+
+
+class LocalToolContext:
+    """Artifact ツールが使用する ToolContext の最小限の代替
+
+    state / save_artifact / load_artifact / list_artifacts のみを提供し、
+    固定の app_name / user_id / session_id で Artifact Service に委譲する。
+    """
+
+    def __init__(
+        self,
+        artifact_service: LocalArtifactService,
+        app_name: str = "ui_design_coordinator",
+        user_id: str = "benchmark",
+        session_id: str = "benchmark",
+        state: Optional[Dict[str, Any]] = None,
+    ):
+        self.artifact_service = artifact_service
+        self.app_name = app_name
+        self.user_id = user_id
+        self.session_id = session_id
+        self.state = state if state is not None else {}
+
+    async def save_artifact(
+        self, filename: str, artifact: types.Part, custom_metadata: Optional[Dict[str, Any]] = None
+    ) -> int:
+        return await self.artifact_service.save_artifact(
+            app_name=self.app_name,
+            user_id=self.user_id,
+            session_id=self.session_id,
+            filename=filename,
+            artifact=artifact,
+            custom_metadata=custom_metadata,
+        )
+
+    async def load_artifact(self, filename: str, version: Optional[int] = None) -> Optional[types.Part]:
+        return await self.artifact_service.load_artifact(
+            app_name=self.app_name,
+            user_id=self.user_id,
+            session_id=self.session_id,
+            filename=filename,
+            version=version,
+        )
+
+    async def list_artifacts(self) -> List[str]:
+        return await self.artifact_service.list_artifact_keys(
+            app_name=self.app_name, user_id=self.user_id, session_id=self.session_id
+        )
+
+
+def _summarize(samples: List[float]) -> Dict[str, float]:
+    """計測値（秒）をミリ秒の統計値に変換"""
+    return {
+        "count": len(samples),
+        "mean_ms": round(statistics.mean(samples) * 1000, 3),
+        "min_ms": round(min(samples) * 1000, 3),
+        "max_ms": round(max(samples) * 1000, 3),
+    }
+
+
+async def run_benchmark(
+    root_dir: Optional[str] = None,
+    iterations: int = 5,
+    use_mmap: bool = False,
+    read_latency: float = 0.0,
+    write_latency: float = 0.0,
+    list_latency: float = 0.0,
+) -> Dict[str, Any]:
+    """Artifact ツールを LocalArtifactService 上で繰り返し実行し、所要時間を集計する
+
+    各イテレーションは新しいセッション（空の state）として実行する。
+
+    Returns:
+        ツール名ごとの計測結果（count / mean_ms / min_ms / max_ms）
+    """
+    # 循環 import を避けるため遅延 import
+    from ..agents.design_agent.tools import (
+        get_vue_component_from_artifacts,
+        list_vue_components_in_artifacts,
+        save_all_vue_files_to_artifacts,
+    )
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        service = LocalArtifactService(
+            root_dir or tmp_dir,
+            use_mmap=use_mmap,
+            read_latency=read_latency,
+            write_latency=write_latency,
+            list_latency=list_latency,
+        )
+        timings: Dict[str, List[float]] = {
+            "save_all_vue_files_to_artifacts": [],
+            "list_vue_components_in_artifacts": [],
+            "get_vue_component_from_artifacts": [],
+        }
+
+        for i in range(iterations):
+            ctx = LocalToolContext(service, session_id=f"benchmark-{i}")
+
+            start = time.perf_counter()
+            await save_all_vue_files_to_artifacts(ctx)
+            timings["save_all_vue_files_to_artifacts"].append(time.perf_counter() - start)
+
+            start = time.perf_counter()
+            await list_vue_components_in_artifacts(ctx, page_size=200)
+            timings["list_vue_components_in_artifacts"].append(time.perf_counter() - start)
+
+            keys = [k for k in await ctx.list_artifacts() if k.startswith("user:vue/")]
+            for key in keys:
+                start = time.perf_counter()
+                await get_vue_component_from_artifacts(ctx, key.removeprefix("user:vue/"))
+                timings["get_vue_component_from_artifacts"].append(time.perf_counter() - start)
+
+        return {
+            "config": {
+                "iterations": iterations,
+                "use_mmap": use_mmap,
+                "read_latency": read_latency,
+                "write_latency": write_latency,
+                "list_latency": list_latency,
+            },
+            "results": {name: _summarize(samples) for name, samples in timings.items() if samples},
+        }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark design_agent artifact tools offline")
+    parser.add_argument("--root-dir", help="Artifact の保存先（省略時は一時ディレクトリ）")
+    parser.add_argument("--iterations", type=int, default=5)
+    parser.add_argument("--mmap", action="store_true", help="mmap で読み込む")
+    parser.add_argument("--read-latency", type=float, default=0.0, help="読み込みごとの疑似レイテンシ（秒）")
+    parser.add_argument("--write-latency", type=float, default=0.0, help="書き込みごとの疑似レイテンシ（秒）")
+    parser.add_argument("--list-latency", type=float, default=0.0, help="一覧取得ごとの疑似レイテンシ（秒）")
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run_benchmark(
+        root_dir=args.root_dir,
+        iterations=args.iterations,
+        use_mmap=args.mmap,
+        read_latency=args.read_latency,
+        write_latency=args.write_latency,
+        list_latency=args.list_latency,
+    ))
+    print(json.dumps(report, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,170 @@
+"""
+決定的な自動修正（LLM を使わない修正）
+
+評価エージェントが検出する問題のうち、機械的に直せるものだけを修正する。
+各 fixer は SFC のセクション本文を受け取り、修正後の本文と修正件数を返す。
+修正結果は `modify_existing_component` にそのまま渡せる modifications 形式で返す。
+
+    aria_required     required 属性のある要素に aria-required="true" を追加
+    positive_tabindex 正の tabindex を 0 に変更（WCAG 2.4.3）
+    focus_visible     :focus スタイルがない場合にフォーカスリングを追加（WCAG 2.4.7）
+
+画像の代替テキスト（WCAG 1.1.1）は内容を見ないと決められないため自動修正しない
+（alt="" は装飾画像の指定になり、意味のある画像がスクリーンリーダーから消える）。
+alt のない <img> は `review_required` として返す。
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .ui_analysis_tools import parse_sfc_blocks
+from .vue_integration_tools import _ATTR_TOKEN, _TAG_TOKEN, _find_section_block
+
+FOCUSABLE_SELECTORS = ("a", "button", "input", "select", "textarea", "[tabindex]")
+
+
+def _attr_names(raw_attrs: str) -> Dict[str, Tuple[int, int]]:
+    """属性名（バインディングの `:` / `v-bind:` を除く）-> 属性のスパン"""
+    names = {}
+    for attr in _ATTR_TOKEN.finditer(raw_attrs):
+        name = attr.group(1)
+        for binding in ("v-bind:", ":"):
+            if name.startswith(binding):
+                name = name[len(binding):]
+                break
+        names.setdefault(name, (attr.start(), attr.end()))
+    return names
+
+
+def _rewrite_tags(template: str, rewrite: Callable[[str, str], Optional[str]]) -> Tuple[str, int]:
+    """開始タグごとに rewrite(tag, raw_attrs) を呼び、None 以外が返れば属性を差し替える"""
+    parts = []
+    pos = 0
+    count = 0
+    for token in _TAG_TOKEN.finditer(template):
+        if token.group(2) is None or token.group(1):
+            continue
+        raw_attrs = token.group(3)
+        new_attrs = rewrite(token.group(2).lower(), raw_attrs)
+        if new_attrs is None or new_attrs == raw_attrs:
+            continue
+        parts.append(template[pos:token.start(3)])
+        parts.append(new_attrs)
+        pos = token.end(3)
+        count += 1
+    parts.append(template[pos:])
+    return "".join(parts), count
+
+
+def _add_attr(raw_attrs: str, attr: str) -> str:
+    """属性を先頭に追加（自己終了の `/` や末尾の書式は保持）"""
+    return f" {attr}{raw_attrs}" if raw_attrs[:1].isspace() or not raw_attrs else f" {attr} {raw_attrs}"
+
+
+def find_review_items(template: str, start_line: int = 1) -> List[Dict[str, Any]]:
+    """自動修正できず、人（または LLM）の確認が必要な問題（alt のない <img>）"""
+    items = []
+    for token in _TAG_TOKEN.finditer(template):
+        if token.group(2) is None or token.group(1) or token.group(2).lower() != "img":
+            continue
+        if "alt" not in _attr_names(token.group(3)):
+            items.append({
+                "rule": "wcag.1.1.1.img-alt",
+                "line": start_line + template.count("\n", 0, token.start()),
+                "message": "画像に代替テキストがありません。内容を表す alt（装飾画像なら alt=\"\"）を設定してください",
+            })
+    return items
+
+
+def fix_aria_required(template: str) -> Tuple[str, int]:
+    def rewrite(tag, raw_attrs):
+        names = _attr_names(raw_attrs)
+        if "required" in names and "aria-required" not in names:
+            return _add_attr(raw_attrs, 'aria-required="true"')
+        return None
+    return _rewrite_tags(template, rewrite)
+
+
+def fix_positive_tabindex(template: str) -> Tuple[str, int]:
+    def rewrite(tag, raw_attrs):
+        for attr in _ATTR_TOKEN.finditer(raw_attrs):
+            value = (attr.group(3) or "").strip("\"'")
+            if attr.group(1) == "tabindex" and value.isdigit() and int(value) > 0:
+                return raw_attrs[:attr.start()] + 'tabindex="0"' + raw_attrs[attr.end():]
+        return None
+    return _rewrite_tags(template, rewrite)
+
+
+def fix_focus_visible(style: str, template: str) -> Tuple[str, int]:
+    if ":focus" in style:
+        return style, 0
+    used = {token.group(2).lower() for token in _TAG_TOKEN.finditer(template) if token.group(2) and not token.group(1)}
+    selectors = [
+        f"{s}:focus-visible" for s in FOCUSABLE_SELECTORS
+        if s in used or (s == "[tabindex]" and "tabindex" in template)
+    ]
+    if not selectors:
+        return style, 0
+    rule = ",\n".join(selectors) + " {\n  outline: 2px solid currentColor;\n  outline-offset: 2px;\n}"
+    return (style.rstrip() + "\n\n" + rule if style.strip() else rule), 1
+
+
+TEMPLATE_FIXERS: Dict[str, Callable[[str], Tuple[str, int]]] = {
+    "aria_required": fix_aria_required,
+    "positive_tabindex": fix_positive_tabindex,
+}
+STYLE_FIXERS: Dict[str, Callable[[str, str], Tuple[str, int]]] = {
+    "focus_visible": fix_focus_visible,
+}
+FIXERS = [*TEMPLATE_FIXERS, *STYLE_FIXERS]
+
+
+def _section_body(content: str, blocks: List[Dict[str, Any]], section: str) -> Optional[str]:
+    block = _find_section_block(blocks, section)
+    if block is None:
+        return None
+    return content[block["content_start"]:block["content_end"]].strip("\n")
+
+
+def compute_auto_fixes(content: str, fixers: Optional[List[str]] = None) -> Dict[str, Any]:
+    """SFC の内容に決定的な修正を適用した結果を計算（ファイルは変更しない）
+
+    Returns:
+        {"modifications": {section: 新しい本文}, "applied": {fixer: 修正件数},
+         "review_required": [{"rule", "line", "message"}]}
+    """
+    fixers = FIXERS if fixers is None else fixers
+    unknown = [name for name in fixers if name not in FIXERS]
+    if unknown:
+        raise ValueError(f"Unknown fixers: {unknown}")
+
+    blocks = parse_sfc_blocks(content)
+    template = _section_body(content, blocks, "template")
+    style = _section_body(content, blocks, "style")
+    applied: Dict[str, int] = {}
+    modifications: Dict[str, str] = {}
+    review_required: List[Dict[str, Any]] = []
+
+    if template is not None:
+        # _section_body は先頭の改行を除くので、その分も数える
+        body_start = content.index(template, _find_section_block(blocks, "template")["content_start"])
+        review_required = find_review_items(template, content.count("\n", 0, body_start) + 1)
+
+        fixed = template
+        for name, fixer in TEMPLATE_FIXERS.items():
+            if name in fixers:
+                fixed, count = fixer(fixed)
+                if count:
+                    applied[name] = count
+        if fixed != template:
+            modifications["template"] = template = fixed
+
+        fixed = style or ""
+        for name, fixer in STYLE_FIXERS.items():
+            if name in fixers:
+                fixed, count = fixer(fixed, template)
+                if count:
+                    applied[name] = count
+        if fixed != (style or ""):
+            modifications["style"] = fixed
+
+    return {"modifications": modifications, "applied": applied, "review_required": review_required}
@@ -0,0 +1,169 @@
+"""
+コンテンツアドレス方式のバックアップストア
+
+`modify_existing_component` が修正前後のファイル内容を保存する。
+`src/` の外（既定では `adk-agents/.backups/`、環境変数 `UI_BACKUP_DIR` で変更可）に
+保存するため、Vite の監視対象ディレクトリにバックアップファイルが散らばらない。
+
+レイアウト:
+    {root}/objects/{hash[:2]}/{hash}   zlib 圧縮した JSON（全文または前版との差分）
+    {root}/index/{path hash}.json      ファイルごとのリビジョン一覧
+
+同一内容は SHA-256 で重複排除し、各版は直前の版との行単位の差分として保存する。
+差分チェーンは MAX_CHAIN_DEPTH 版ごとに全文で区切るため、任意の版の復元は
+最大 MAX_CHAIN_DEPTH 回の差分適用で済む。
+"""
+
+import difflib
+import hashlib
+import json
+import os
+import tempfile
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+# 差分チェーンの最大長（これを超える場合は全文で保存）
+MAX_CHAIN_DEPTH = 10
+
+
+def _default_root() -> Path:
+    return Path(os.environ.get("UI_BACKUP_DIR") or Path(__file__).resolve().parents[2] / ".backups")
+
+
+def _atomic_write_bytes(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.unlink(temp_path)
+        raise
+
+
+class BackupStore:
+    """ファイルの版をコンテンツアドレスで保存するストア"""
+
+    def __init__(self, root: Optional[Union[str, Path]] = None):
+        self.root = Path(root) if root is not None else _default_root()
+
+    # ------------------------------
+    # Objects
+    # ------------------------------
+    def _object_path(self, content_hash: str) -> Path:
+        return self.root / "objects" / content_hash[:2] / content_hash
+
+    def _read_object(self, content_hash: str) -> Dict[str, Any]:
+        return json.loads(zlib.decompress(self._object_path(content_hash).read_bytes()))
+
+    def _write_object(self, content_hash: str, content: str, base_hash: Optional[str]) -> None:
+        """オブジェクトを保存（既に存在する場合は何もしない）"""
+        path = self._object_path(content_hash)
+        if path.exists():
+            return
+
+        obj: Dict[str, Any] = {"depth": 0, "base": None, "text": content}
+        if base_hash and self._object_path(base_hash).exists():
+            base_obj = self._read_object(base_hash)
+            if base_obj["depth"] + 1 < MAX_CHAIN_DEPTH:
+                delta = {
+                    "depth": base_obj["depth"] + 1,
+                    "base": base_hash,
+                    "ops": self._diff(self.read(base_hash), content),
+                }
+                # 差分の方が小さい場合のみ差分で保存
+                if len(json.dumps(delta["ops"])) < len(content):
+                    obj = delta
+
+        _atomic_write_bytes(path, zlib.compress(json.dumps(obj, ensure_ascii=False).encode("utf-8"), 9))
+
+    @staticmethod
+    def _diff(base: str, content: str) -> List[Any]:
+        """行単位の差分: ["c", i1, i2] は基準版の行をコピー、文字列は挿入"""
+        base_lines = base.splitlines(keepends=True)
+        lines = content.splitlines(keepends=True)
+        ops: List[Any] = []
+        matcher = difflib.SequenceMatcher(None, base_lines, lines, autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                ops.append(["c", i1, i2])
+            elif tag in ("replace", "insert"):
+                ops.append("".join(lines[j1:j2]))
+        return ops
+
+    def read(self, content_hash: str) -> str:
+        """ハッシュからファイル内容を復元"""
+        chain = []
+        obj = self._read_object(content_hash)
+        while obj["base"] is not None:
+            chain.append(obj["ops"])
+            obj = self._read_object(obj["base"])
+
+        content = obj["text"]
+        for ops in reversed(chain):
+            base_lines = content.splitlines(keepends=True)
+            parts = []
+            for op in ops:
+                if isinstance(op, str):
+                    parts.append(op)
+                else:
+                    parts.extend(base_lines[op[1]:op[2]])
+            content = "".join(parts)
+        return content
+
+    # ------------------------------
+    # Index
+    # ------------------------------
+    def _index_path(self, file_path: Union[str, Path]) -> Path:
+        key = hashlib.sha256(str(Path(file_path).resolve()).encode("utf-8")).hexdigest()
+        return self.root / "index" / f"{key}.json"
+
+    def list_revisions(self, file_path: Union[str, Path]) -> List[Dict[str, Any]]:
+        """ファイルのリビジョン一覧（古い順）"""
+        index_path = self._index_path(file_path)
+        if not index_path.exists():
+            return []
+        return json.loads(index_path.read_text(encoding="utf-8"))["revisions"]
+
+    def save(self, file_path: Union[str, Path], content: str) -> Dict[str, Any]:
+        """ファイル内容を新しいリビジョンとして保存
+
+        直前のリビジョンと同一内容の場合は新しいリビジョンを作らず、それを返す。
+        """
+        content_hash = hashlib.sha256(content.encode("utf-8")).hexdigest()
+        revisions = self.list_revisions(file_path)
+        if revisions and revisions[-1]["hash"] == content_hash:
+            return revisions[-1]
+
+        self._write_object(content_hash, content, revisions[-1]["hash"] if revisions else None)
+
+        revision = {
+            "revision": len(revisions),
+            "hash": content_hash,
+            "size": len(content),
+            "time": time.time(),
+        }
+        revisions.append(revision)
+        _atomic_write_bytes(
+            self._index_path(file_path),
+            json.dumps(
+                {"path": str(Path(file_path).resolve()), "revisions": revisions},
+                ensure_ascii=False,
+            ).encode("utf-8"),
+        )
+        return revision
+
+    def load(self, file_path: Union[str, Path], revision: Optional[int] = None) -> str:
+        """指定リビジョン（省略時は最新）の内容を取得"""
+        revisions = self.list_revisions(file_path)
+        if not revisions:
+            raise FileNotFoundError(f"No backups for {file_path}")
+        if revision is None:
+            revision = revisions[-1]["revision"]
+        if not 0 <= revision < len(revisions):
+            raise IndexError(f"Revision {revision} not found for {file_path}")
+        return self.read(revisions[revision]["hash"])
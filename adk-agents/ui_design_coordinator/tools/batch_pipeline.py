@@ -0,0 +1,316 @@
+"""
+LLM を使わないバッチパイプライン
+
+評価エージェントの決定的なツール（vue_component_analysis / wcag_compliance_check /
+comprehensive_evaluation）と自動修正（auto_fixers + modify_existing_component）を
+ファイル群に対して直接実行し、1ファイル1行の JSONL で結果を出力する。
+自動修正後も問題が残るファイルには `needs_review: true` を付けるので、
+LLM エージェントはそのファイルだけに使えばよい。
+
+使い方:
+    cd adk-agents
+    python -m ui_design_coordinator.tools.batch_pipeline ../src --steps evaluation,fix --workers 4 -o results.jsonl
+    python -m ui_design_coordinator.tools.batch_pipeline --changed ../src/components/Login.vue   # 影響範囲だけ
+
+ルートエージェントからは `evaluate_components` で複数コンポーネントをまとめて評価・改善する。
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+from google.adk.tools import ToolContext
+
+from .auto_fixers import FIXERS, compute_auto_fixes
+from .component_graph import get_component_graph
+from .overlay_fs import get_active_overlay, overlay_scope, read_text
+from .project_index import get_project_index
+from .vue_integration_tools import modify_existing_component
+
+STEPS = ("analysis", "wcag", "evaluation", "fix")
+DEFAULT_STEPS = ("evaluation",)
+
+
+def collect_vue_files(paths: Optional[Sequence[str]] = None) -> List[str]:
+    """対象の .vue ファイルを列挙（省略時はプロジェクトインデックスの全 SFC）"""
+    if not paths:
+        index = get_project_index()
+        return [str(index.root / rel_path) for rel_path in index.structure()["sfcs"]]
+
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for directory, dirnames, filenames in os.walk(path):
+                dirnames[:] = sorted(d for d in dirnames if d not in ("node_modules", ".git", "dist"))
+                files.extend(os.path.join(directory, f) for f in sorted(filenames) if f.endswith(".vue"))
+        else:
+            files.append(path)
+    return files
+
+
+def collect_affected_files(changed: Sequence[str]) -> List[str]:
+    """変更したファイルと、それを推移的に import / 描画している SFC を列挙
+
+    Args:
+        changed: 変更した .vue ファイルのパスまたはコンポーネント名
+    """
+    graph = get_component_graph()
+    rel_paths = []
+    for component in changed:
+        rel_path = graph.resolve(os.path.abspath(component) if os.path.isfile(component) else component)
+        if rel_path is None:
+            raise ValueError(f"コンポーネント '{component}' が見つかりません")
+        rel_paths.append(rel_path)
+    return [str(graph.index.root / rel_path) for rel_path in graph.affected_by(rel_paths)]
+
+
+def _issue_count(evaluation: Dict[str, Any]) -> int:
+    wcag = evaluation.get("wcag_compliance", evaluation)
+    return sum(len(category["issues"]) for category in wcag.get("categories", {}).values())
+
+
+def process_file(
+    file_path: str,
+    steps: Sequence[str] = DEFAULT_STEPS,
+    fixers: Optional[List[str]] = None,
+    dry_run: bool = False,
+) -> Dict[str, Any]:
+    """1ファイルに対してパイプラインを実行し、JSONL の1行分の結果を返す"""
+    # 評価ツールは評価エージェントのモジュールにあるため、ワーカー内で import する
+    from ..agents.evaluation_agent.agent import (
+        comprehensive_evaluation,
+        vue_component_analysis,
+        wcag_compliance_check,
+    )
+
+    started = time.perf_counter()
+    record: Dict[str, Any] = {"file_path": file_path, "status": "success"}
+    try:
+        # 仮想編集セッション中は未確定の内容を評価する
+        content = read_text(file_path)
+
+        if "analysis" in steps:
+            record["analysis"] = vue_component_analysis(content, file_path)
+        if "wcag" in steps:
+            record["wcag"] = wcag_compliance_check(content)
+        if "evaluation" in steps:
+            record["evaluation"] = comprehensive_evaluation(content, file_path, detail="full")
+
+        remaining_issues = _issue_count(wcag_compliance_check(content))
+        if "fix" in steps:
+            fixes = compute_auto_fixes(content, fixers)
+            record["fix"] = {
+                "applied": fixes["applied"],
+                "review_required": fixes["review_required"],
+                "dry_run": dry_run,
+                "file_changed": False,
+            }
+            if fixes["modifications"]:
+                if dry_run:
+                    record["fix"]["modifications"] = fixes["modifications"]
+                else:
+                    result = modify_existing_component(file_path, fixes["modifications"])
+                    if result["status"] != "success":
+                        raise RuntimeError(result["message"])
+                    record["fix"].update(file_changed=True, backup_revision=result["backup_revision"])
+                    content = read_text(file_path)
+                    if "evaluation" in steps:
+                        record["evaluation_after_fix"] = comprehensive_evaluation(content, file_path, detail="full")
+                    remaining_issues = _issue_count(wcag_compliance_check(content))
+
+        record["remaining_issues"] = remaining_issues
+        # 自動修正できない問題（alt のない画像など）は残っている限り確認が必要
+        record["needs_review"] = remaining_issues > 0 or bool(record.get("fix", {}).get("review_required"))
+    except Exception as e:
+        record.update(status="error", message=str(e))
+
+    record["elapsed_seconds"] = round(time.perf_counter() - started, 4)
+    return record
+
+
+def run_pipeline(
+    files: Iterable[str],
+    steps: Sequence[str] = DEFAULT_STEPS,
+    fixers: Optional[List[str]] = None,
+    dry_run: bool = False,
+    workers: int = 1,
+) -> Iterator[Dict[str, Any]]:
+    """ファイル群に対してパイプラインを実行し、結果を入力順に返す
+
+    Args:
+        files: 対象の .vue ファイル
+        steps: 実行するステップ（analysis / wcag / evaluation / fix）
+        fixers: 使用する自動修正（省略時はすべて）
+        dry_run: True の場合、修正内容を結果に含めるだけでファイルは変更しない
+        workers: ワーカープロセス数（1 の場合は同一プロセスで実行）
+    """
+    unknown = [step for step in steps if step not in STEPS]
+    if unknown:
+        raise ValueError(f"Unknown steps: {unknown}")
+
+    files = list(files)
+    worker = partial(process_file, steps=tuple(steps), fixers=fixers, dry_run=dry_run)
+    # オーバーレイはプロセス内にしかないので、仮想編集セッション中は同一プロセスで実行する
+    if workers <= 1 or len(files) <= 1 or get_active_overlay() is not None:
+        yield from map(worker, files)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        yield from executor.map(worker, files, chunksize=max(1, len(files) // (workers * 4)))
+
+
+def _resolve_component(component: str) -> Optional[str]:
+    """コンポーネント名・プロジェクト相対パス・絶対パスをファイルパスに解決"""
+    if os.path.isfile(component):
+        return os.path.abspath(component)
+    graph = get_component_graph()
+    rel_path = graph.resolve(component)
+    return str(graph.index.root / rel_path) if rel_path else None
+
+
+def _merge_record(component: str, record: Dict[str, Any], top_issues: int) -> Dict[str, Any]:
+    """process_file の結果を LLM 向けの要約に変換"""
+    if record["status"] != "success":
+        return {"component": component, "file_path": record["file_path"], "status": "error", "message": record["message"]}
+
+    evaluation = record.get("evaluation_after_fix") or record.get("evaluation") or {}
+    merged = {
+        "component": component,
+        "file_path": record["file_path"],
+        "status": "success",
+        "remaining_issues": record["remaining_issues"],
+        "needs_review": record["needs_review"],
+        "elapsed_seconds": record["elapsed_seconds"],
+    }
+    if evaluation:
+        merged.update(
+            evaluation_id=evaluation["evaluation_id"],
+            overall_score=evaluation["overall_score"],
+            grade=evaluation["grade"],
+            issue_count=len(evaluation["issues"]),
+            top_issues=evaluation["issues"][:top_issues],
+        )
+    if "fix" in record:
+        merged["fixes_applied"] = record["fix"]["applied"]
+        merged["review_required"] = record["fix"]["review_required"]
+        merged["file_changed"] = record["fix"]["file_changed"]
+    return merged
+
+
+async def evaluate_components(
+    components: List[str],
+    mode: str = "evaluate",
+    max_concurrency: int = 4,
+    top_issues: int = 3,
+    include_dependents: bool = False,
+    tool_context: Optional[ToolContext] = None
+) -> Dict[str, Any]:
+    """複数のコンポーネントを並行して評価（または自動修正）し、結果をまとめて返す
+
+    Args:
+        components: コンポーネント名（例: "SignUp"）またはパス（例: "src/components/Login.vue"）のリスト
+        mode: "evaluate"（評価のみ）または "improve"（決定的な自動修正を適用してから評価）
+        max_concurrency: 同時に処理するコンポーネント数の上限
+        top_issues: コンポーネントごとに含める問題の件数
+        include_dependents: True の場合、components を変更したファイルとみなし、それらを
+            import / 描画しているコンポーネントも含めて評価する
+
+    各コンポーネントの全評価結果は evaluation_id を get_evaluation_result に渡して取得できる。
+    セッションの仮想編集セッション中は、未確定の内容を評価・修正する。
+    """
+    with overlay_scope(tool_context):
+        return await _evaluate_components(components, mode, max_concurrency, top_issues, include_dependents)
+
+
+async def _evaluate_components(
+    components: List[str],
+    mode: str,
+    max_concurrency: int,
+    top_issues: int,
+    include_dependents: bool
+) -> Dict[str, Any]:
+    try:
+        if mode not in ("evaluate", "improve"):
+            return {"status": "error", "message": f"mode は evaluate / improve のいずれかを指定してください: {mode}"}
+        steps = ("evaluation", "fix") if mode == "improve" else ("evaluation",)
+        if include_dependents:
+            components = collect_affected_files(components)
+
+        started = time.perf_counter()
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def run(component: str) -> Dict[str, Any]:
+            file_path = _resolve_component(component)
+            if file_path is None:
+                return {"component": component, "status": "error", "message": f"コンポーネント '{component}' が見つかりません"}
+            async with semaphore:
+                record = await asyncio.to_thread(process_file, file_path, steps)
+            return _merge_record(component, record, top_issues)
+
+        results = await asyncio.gather(*(run(component) for component in dict.fromkeys(components)))
+
+        succeeded = [r for r in results if r["status"] == "success"]
+        scores = [r["overall_score"] for r in succeeded if "overall_score" in r]
+        return {
+            "status": "success" if succeeded or not results else "error",
+            "mode": mode,
+            "components": results,
+            "summary": {
+                "count": len(results),
+                "errors": len(results) - len(succeeded),
+                "average_score": round(sum(scores) / len(scores), 2) if scores else None,
+                "lowest_score": min(succeeded, key=lambda r: r.get("overall_score", 100))["component"] if scores else None,
+                "needs_review": [r["component"] for r in succeeded if r["needs_review"]],
+                "files_changed": [r["component"] for r in succeeded if r.get("file_changed")],
+            },
+            "elapsed_seconds": round(time.perf_counter() - started, 4),
+        }
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Run deterministic UI evaluation / auto-fix over Vue components")
+    parser.add_argument("paths", nargs="*", help=".vue ファイルまたはディレクトリ（省略時はプロジェクトの全 SFC）")
+    parser.add_argument("--steps", default=",".join(DEFAULT_STEPS), help=f"実行するステップ（{' / '.join(STEPS)}）")
+    parser.add_argument("--fixers", help=f"使用する自動修正（{' / '.join(FIXERS)}、省略時はすべて）")
+    parser.add_argument("--dry-run", action="store_true", help="修正内容を出力するだけでファイルは変更しない")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("-o", "--output", help="JSONL の出力先（省略時は標準出力）")
+    parser.add_argument(
+        "--changed", action="append", default=[],
+        help="変更したファイル（複数指定可）。影響を受ける SFC だけを処理する（paths を指定した場合はその範囲内）",
+    )
+    args = parser.parse_args(argv)
+
+    steps = [s.strip() for s in args.steps.split(",") if s.strip()]
+    fixers = [f.strip() for f in args.fixers.split(",") if f.strip()] if args.fixers else None
+    files = collect_vue_files(args.paths)
+    if args.changed:
+        affected = {os.path.realpath(path) for path in collect_affected_files(args.changed)}
+        files = [path for path in files if os.path.realpath(path) in affected]
+
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    summary = {"files": 0, "errors": 0, "fixed": 0, "needs_review": 0}
+    try:
+        for record in run_pipeline(files, steps=steps, fixers=fixers, dry_run=args.dry_run, workers=args.workers):
+            output.write(json.dumps(record, ensure_ascii=False) + "\n")
+            output.flush()
+            summary["files"] += 1
+            summary["errors"] += record["status"] != "success"
+            summary["fixed"] += bool(record.get("fix", {}).get("file_changed"))
+            summary["needs_review"] += bool(record.get("needs_review"))
+    finally:
+        if output is not sys.stdout:
+            output.close()
+    print(json.dumps(summary, ensure_ascii=False), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
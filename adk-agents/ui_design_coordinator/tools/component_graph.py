@@ -0,0 +1,238 @@
+"""
+コンポーネント間の依存グラフ
+
+`import ... from './X.vue'`（動的 import を含む）とテンプレート内のタグ使用から、
+どの SFC がどの SFC を読み込み・描画しているかを記録する。
+ファイルごとの解析結果は mtime / size で管理し、変化したファイルだけを再解析する。
+グラフは `adk-agents/.cache/component_graph.json` に保存される。
+"""
+
+import json
+import os
+import posixpath
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Union
+
+from .project_index import PROJECT_ROOT, ProjectIndex, get_project_index
+from .ui_analysis_tools import parse_sfc_blocks
+
+_VUE_IMPORT = re.compile(r'(?:\bfrom|\bimport)\s*\(?\s*[\'"]([^\'"]+\.vue)[\'"]')
+_TEMPLATE_TAG = re.compile(r'<([A-Za-z][\w-]*)')
+_HTML_COMMENT = re.compile(r'<!--.*?-->', re.DOTALL)
+
+# ネイティブの HTML / SVG 要素（Vue と同じく大文字小文字を区別して判定するので <Button> はコンポーネント）
+_NATIVE_TAGS = frozenset({
+    "html", "body", "base", "head", "link", "meta", "style", "title", "address", "article", "aside", "footer",
+    "header", "hgroup", "h1", "h2", "h3", "h4", "h5", "h6", "nav", "section", "div", "dd", "dl", "dt",
+    "figcaption", "figure", "picture", "hr", "img", "li", "main", "ol", "p", "pre", "ul", "a", "b", "abbr",
+    "bdi", "bdo", "br", "cite", "code", "data", "dfn", "em", "i", "kbd", "mark", "q", "rp", "rt", "ruby", "s",
+    "samp", "small", "span", "strong", "sub", "sup", "time", "u", "var", "wbr", "area", "audio", "map", "track",
+    "video", "embed", "object", "param", "source", "canvas", "script", "noscript", "del", "ins", "caption",
+    "col", "colgroup", "table", "thead", "tbody", "td", "th", "tr", "button", "datalist", "fieldset", "form",
+    "input", "label", "legend", "meter", "optgroup", "option", "output", "progress", "select", "textarea",
+    "details", "dialog", "menu", "summary", "search", "blockquote", "iframe", "tfoot",
+    "svg", "animate", "animateMotion", "animateTransform", "circle", "clipPath", "defs", "desc", "ellipse",
+    "feBlend", "feColorMatrix", "feComposite", "feGaussianBlur", "feOffset", "filter", "foreignObject", "g",
+    "image", "line", "linearGradient", "marker", "mask", "metadata", "path", "pattern", "polygon", "polyline",
+    "radialGradient", "rect", "set", "stop", "switch", "symbol", "text", "textPath", "tspan", "use", "view",
+})
+# Vue の組み込みコンポーネント（kebab-case に正規化して判定）
+_VUE_BUILTIN_TAGS = frozenset({
+    "template", "slot", "component", "transition", "transition-group", "keep-alive", "teleport", "suspense",
+})
+
+
+def _kebab_case(name: str) -> str:
+    return re.sub(r'(?<!^)(?=[A-Z])', '-', name).lower()
+
+
+def _parse_sfc_references(rel_path: str, content: str) -> Dict[str, List[str]]:
+    """SFC 内の .vue import（解決済みパス）とテンプレートのタグ名を抽出"""
+    imports: Set[str] = set()
+    tags: Set[str] = set()
+    for block in parse_sfc_blocks(content):
+        body = content[block["content_start"]:block["content_end"]]
+        if block["type"] == "script":
+            for spec in _VUE_IMPORT.findall(body):
+                if spec.startswith("@/"):
+                    resolved = "src/" + spec[2:]
+                elif spec.startswith("."):
+                    resolved = posixpath.normpath(posixpath.join(posixpath.dirname(rel_path), spec))
+                else:
+                    continue
+                imports.add(resolved)
+        elif block["type"] == "template":
+            tags.update(_TEMPLATE_TAG.findall(_HTML_COMMENT.sub("", body)))
+    return {"imports": sorted(imports), "tags": sorted(tags)}
+
+
+class ComponentGraph:
+    """SFC 間の依存グラフ"""
+
+    def __init__(self, index: Optional[ProjectIndex] = None, cache_path: Optional[Union[str, Path]] = None):
+        self.index = index or get_project_index()
+        self.cache_path = Path(cache_path) if cache_path else Path(__file__).resolve().parents[2] / ".cache" / "component_graph.json"
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._edges: Dict[str, Set[str]] = {}
+        self._reverse: Dict[str, Set[str]] = {}
+        self._load_cache()
+
+    # ------------------------------
+    # Disk cache
+    # ------------------------------
+    def _load_cache(self) -> None:
+        try:
+            cached = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            if cached.get("root") == str(self.index.root):
+                self._files = cached["files"]
+        except (OSError, ValueError, KeyError):
+            self._files = {}
+
+    def _save_cache(self) -> None:
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.cache_path.with_suffix(".tmp")
+            temp_path.write_text(json.dumps({"root": str(self.index.root), "files": self._files}), encoding="utf-8")
+            os.replace(temp_path, self.cache_path)
+        except OSError:
+            pass
+
+    # ------------------------------
+    # Build
+    # ------------------------------
+    def refresh(self) -> bool:
+        """変化した SFC だけを再解析してグラフを更新
+
+        Returns:
+            グラフに変化があった場合 True
+        """
+        sfcs = self.index.structure()["sfcs"]
+        changed = bool(set(self._files) - set(sfcs))
+        for rel_path in set(self._files) - set(sfcs):
+            del self._files[rel_path]
+
+        for rel_path in sfcs:
+            entry = self.index.file_entry(rel_path) or {}
+            cached = self._files.get(rel_path)
+            if cached and cached["mtime_ns"] == entry.get("mtime_ns") and cached["size"] == entry.get("size"):
+                continue
+            try:
+                content = (self.index.root / rel_path).read_text(encoding="utf-8")
+            except OSError:
+                continue
+            self._files[rel_path] = {
+                "mtime_ns": entry.get("mtime_ns"),
+                "size": entry.get("size"),
+                **_parse_sfc_references(rel_path, content),
+            }
+            changed = True
+
+        if changed or (self._files and not self._edges):
+            self._build_edges()
+            self._save_cache()
+        return changed
+
+    def _build_edges(self) -> None:
+        # タグ名（kebab-case に正規化）-> SFC パス（UserCard.vue / user-card.vue のどちらの表記でもよい）
+        by_name: Dict[str, Set[str]] = {}
+        for rel_path in self._files:
+            by_name.setdefault(_kebab_case(posixpath.basename(rel_path)[:-len(".vue")]), set()).add(rel_path)
+
+        self._edges = {}
+        self._reverse = {rel_path: set() for rel_path in self._files}
+        for rel_path, refs in self._files.items():
+            targets = {p for p in refs["imports"] if p in self._files}
+            imported_names = {posixpath.basename(p)[:-len(".vue")] for p in targets}
+            for tag in refs["tags"]:
+                # <button> や <form> を Button.vue / Form.vue に解決しない
+                if tag in _NATIVE_TAGS or _kebab_case(tag) in _VUE_BUILTIN_TAGS:
+                    continue
+                candidates = by_name.get(_kebab_case(tag), set())
+                # import 済みなら import 先、未 import（グローバル登録）なら名前が一意な場合のみ
+                if len(candidates) == 1:
+                    candidate = next(iter(candidates))
+                    if posixpath.basename(candidate)[:-len(".vue")] not in imported_names:
+                        targets.add(candidate)
+            targets.discard(rel_path)
+            self._edges[rel_path] = targets
+            for target in targets:
+                self._reverse[target].add(rel_path)
+
+    # ------------------------------
+    # Query
+    # ------------------------------
+    def resolve(self, component: str) -> Optional[str]:
+        """パス（絶対 / プロジェクト相対）またはコンポーネント名を SFC パスに解決"""
+        self.refresh()
+        path = Path(component)
+        if path.is_absolute():
+            try:
+                component = path.resolve().relative_to(self.index.root.resolve()).as_posix()
+            except ValueError:
+                return None
+        component = component.replace("\\", "/")
+        if component in self._files:
+            return component
+        name = posixpath.basename(component).removesuffix(".vue")
+        matches = [p for p in self._files if posixpath.basename(p)[:-len(".vue")] == name]
+        return matches[0] if len(matches) == 1 else None
+
+    def dependencies_of(self, rel_path: str) -> List[str]:
+        """rel_path が直接 import / 描画している SFC"""
+        self.refresh()
+        return sorted(self._edges.get(rel_path, set()))
+
+    def dependents_of(self, rel_path: str) -> List[str]:
+        """rel_path を直接 import / 描画している SFC"""
+        self.refresh()
+        return sorted(self._reverse.get(rel_path, set()))
+
+    def affected_by(self, rel_paths: Union[str, List[str]]) -> List[str]:
+        """変更の影響を受ける SFC（変更ファイル自身と、推移的に依存するすべての SFC）"""
+        self.refresh()
+        if isinstance(rel_paths, str):
+            rel_paths = [rel_paths]
+        affected = set()
+        stack = [p for p in rel_paths if p in self._files]
+        while stack:
+            rel_path = stack.pop()
+            if rel_path in affected:
+                continue
+            affected.add(rel_path)
+            stack.extend(self._reverse.get(rel_path, ()))
+        return sorted(affected)
+
+
+_component_graph: Optional[ComponentGraph] = None
+
+
+def get_component_graph() -> ComponentGraph:
+    """プロセス共有の ComponentGraph を取得"""
+    global _component_graph
+    if _component_graph is None:
+        _component_graph = ComponentGraph()
+    return _component_graph
+
+
+def find_affected_components(component: str) -> Dict[str, Any]:
+    """指定コンポーネントの変更で影響を受けるコンポーネントを取得
+
+    Args:
+        component: コンポーネントのパス（例: "src/components/SignUp.vue"）または名前（例: "SignUp"）
+    """
+    try:
+        graph = get_component_graph()
+        rel_path = graph.resolve(component)
+        if rel_path is None:
+            return {"status": "error", "message": f"コンポーネント '{component}' が見つかりません"}
+
+        return {
+            "status": "success",
+            "component": rel_path,
+            "dependencies": graph.dependencies_of(rel_path),
+            "dependents": graph.dependents_of(rel_path),
+            "affected_components": graph.affected_by(rel_path),
+        }
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
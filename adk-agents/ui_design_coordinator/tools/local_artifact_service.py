@@ -0,0 +1,239 @@
+"""
+ディレクトリベースのローカル Artifact Service
+
+ネットワークや外部ストレージに依存せずに Artifact ツールを動かすための実装。
+オフラインでのベンチマーク（`artifact_benchmark`）やローカル開発で使用する。
+
+レイアウト:
+    {root}/{app_name}/{user_id}/{scope}/{quoted filename}/{version}.bin
+    {root}/{app_name}/{user_id}/{scope}/{quoted filename}/{version}.json
+
+`scope` は `user:` 名前空間のファイルでは "user"、それ以外はセッションID。
+"""
+
+import asyncio
+import json
+import mmap
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+from urllib.parse import quote, unquote
+
+from google.adk.artifacts import BaseArtifactService
+from google.adk.artifacts.base_artifact_service import ArtifactVersion
+from google.genai import types
+
+
+class LocalArtifactService(BaseArtifactService):
+    """ローカルディレクトリに Artifact を保存する Artifact Service
+
+    Args:
+        root_dir: 保存先ディレクトリ
+        use_mmap: True の場合、読み込みに mmap を使用する
+        read_latency: load 系操作ごとに挿入する疑似レイテンシ（秒）
+        write_latency: save / delete 操作ごとに挿入する疑似レイテンシ（秒）
+        list_latency: list 系操作ごとに挿入する疑似レイテンシ（秒）
+    """
+
+    def __init__(
+        self,
+        root_dir: Union[str, Path],
+        *,
+        use_mmap: bool = False,
+        read_latency: float = 0.0,
+        write_latency: float = 0.0,
+        list_latency: float = 0.0,
+    ):
+        self.root_dir = Path(root_dir)
+        self.use_mmap = use_mmap
+        self.read_latency = read_latency
+        self.write_latency = write_latency
+        self.list_latency = list_latency
+        self.root_dir.mkdir(parents=True, exist_ok=True)
+
+    # ------------------------------
+    # Path helpers
+    # ------------------------------
+    def _scope_dir(self, app_name: str, user_id: str, filename: str, session_id: Optional[str]) -> Path:
+        if filename.startswith("user:"):
+            scope = "user"
+        elif session_id is None:
+            raise ValueError("Session ID must be provided for session-scoped artifacts.")
+        else:
+            scope = quote(session_id, safe="")
+        return self.root_dir / quote(app_name, safe="") / quote(user_id, safe="") / scope
+
+    def _artifact_dir(self, app_name: str, user_id: str, filename: str, session_id: Optional[str]) -> Path:
+        return self._scope_dir(app_name, user_id, filename, session_id) / quote(filename, safe="")
+
+    @staticmethod
+    def _versions(artifact_dir: Path) -> List[int]:
+        if not artifact_dir.is_dir():
+            return []
+        return sorted(int(p.stem) for p in artifact_dir.glob("*.json"))
+
+    def _read_bytes(self, path: Path) -> bytes:
+        if not self.use_mmap:
+            return path.read_bytes()
+        with open(path, "rb") as f:
+            # 空ファイルは mmap できない
+            if f.seek(0, 2) == 0:
+                return b""
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return mm[:]
+
+    @staticmethod
+    async def _delay(latency: float) -> None:
+        if latency > 0:
+            await asyncio.sleep(latency)
+
+    # ------------------------------
+    # BaseArtifactService
+    # ------------------------------
+    async def save_artifact(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        filename: str,
+        artifact: Union[types.Part, Dict[str, Any]],
+        session_id: Optional[str] = None,
+        custom_metadata: Optional[Dict[str, Any]] = None,
+    ) -> int:
+        await self._delay(self.write_latency)
+        if isinstance(artifact, dict):
+            artifact = types.Part.model_validate(artifact)
+
+        if artifact.text is not None:
+            payload, mime_type, is_text = artifact.text.encode("utf-8"), "text/plain", True
+        elif artifact.inline_data is not None:
+            payload, mime_type, is_text = artifact.inline_data.data or b"", artifact.inline_data.mime_type, False
+        else:
+            raise ValueError("Only text and inline_data artifacts are supported.")
+
+        artifact_dir = self._artifact_dir(app_name, user_id, filename, session_id)
+        artifact_dir.mkdir(parents=True, exist_ok=True)
+        versions = self._versions(artifact_dir)
+        version = versions[-1] + 1 if versions else 0
+
+        (artifact_dir / f"{version}.bin").write_bytes(payload)
+        # メタデータは本体の後に書き込み、バージョンの存在判定に使う
+        (artifact_dir / f"{version}.json").write_text(
+            json.dumps({
+                "mime_type": mime_type,
+                "is_text": is_text,
+                "custom_metadata": custom_metadata or {},
+                "create_time": time.time(),
+            }),
+            encoding="utf-8",
+        )
+        return version
+
+    async def load_artifact(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        filename: str,
+        session_id: Optional[str] = None,
+        version: Optional[int] = None,
+    ) -> Optional[types.Part]:
+        await self._delay(self.read_latency)
+        artifact_dir = self._artifact_dir(app_name, user_id, filename, session_id)
+        versions = self._versions(artifact_dir)
+        if not versions:
+            return None
+        if version is None:
+            version = versions[-1]
+        elif version not in versions:
+            return None
+
+        meta = json.loads((artifact_dir / f"{version}.json").read_text(encoding="utf-8"))
+        payload = self._read_bytes(artifact_dir / f"{version}.bin")
+        if meta["is_text"]:
+            return types.Part(text=payload.decode("utf-8"))
+        return types.Part.from_bytes(data=payload, mime_type=meta["mime_type"])
+
+    async def list_artifact_keys(
+        self, *, app_name: str, user_id: str, session_id: Optional[str] = None
+    ) -> List[str]:
+        await self._delay(self.list_latency)
+        user_dir = self.root_dir / quote(app_name, safe="") / quote(user_id, safe="")
+        scope_dirs = [user_dir / "user"]
+        if session_id is not None:
+            scope_dirs.append(user_dir / quote(session_id, safe=""))
+
+        keys = []
+        for scope_dir in scope_dirs:
+            if scope_dir.is_dir():
+                keys.extend(unquote(p.name) for p in scope_dir.iterdir() if p.is_dir())
+        return sorted(keys)
+
+    async def delete_artifact(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        filename: str,
+        session_id: Optional[str] = None,
+    ) -> None:
+        await self._delay(self.write_latency)
+        artifact_dir = self._artifact_dir(app_name, user_id, filename, session_id)
+        if not artifact_dir.is_dir():
+            return
+        for path in artifact_dir.iterdir():
+            path.unlink()
+        artifact_dir.rmdir()
+
+    async def list_versions(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        filename: str,
+        session_id: Optional[str] = None,
+    ) -> List[int]:
+        await self._delay(self.list_latency)
+        return self._versions(self._artifact_dir(app_name, user_id, filename, session_id))
+
+    def _artifact_version(self, artifact_dir: Path, version: int) -> ArtifactVersion:
+        meta = json.loads((artifact_dir / f"{version}.json").read_text(encoding="utf-8"))
+        return ArtifactVersion(
+            version=version,
+            canonical_uri=(artifact_dir / f"{version}.bin").as_uri(),
+            custom_metadata=meta["custom_metadata"],
+            create_time=meta["create_time"],
+            mime_type=meta["mime_type"],
+        )
+
+    async def list_artifact_versions(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        filename: str,
+        session_id: Optional[str] = None,
+    ) -> List[ArtifactVersion]:
+        await self._delay(self.list_latency)
+        artifact_dir = self._artifact_dir(app_name, user_id, filename, session_id).resolve()
+        return [self._artifact_version(artifact_dir, v) for v in self._versions(artifact_dir)]
+
+    async def get_artifact_version(
+        self,
+        *,
+        app_name: str,
+        user_id: str,
+        filename: str,
+        session_id: Optional[str] = None,
+        version: Optional[int] = None,
+    ) -> Optional[ArtifactVersion]:
+        await self._delay(self.read_latency)
+        artifact_dir = self._artifact_dir(app_name, user_id, filename, session_id).resolve()
+        versions = self._versions(artifact_dir)
+        if not versions:
+            return None
+        if version is None:
+            version = versions[-1]
+        elif version not in versions:
+            return None
+        return self._artifact_version(artifact_dir, version)
@@ -0,0 +1,102 @@
+"""
+メモリ上の仮想ファイルシステム（オーバーレイ）
+
+改善ループなどの途中版をディスクに書かずにメモリ上へ集め、読み込みは
+オーバーレイ → ディスクの順に解決する。最後に一括でフラッシュするか、
+破棄（ロールバック）する。
+
+オーバーレイはスコープ（ADK のセッション ID）ごとに1つ（`begin_overlay` / `end_overlay`）。
+現在のスコープは ContextVar で保持し、`overlay_scope()` の中では対応するセッションの
+オーバーレイが使われる。スコープを指定しない場合（CLI など）はプロセス共通のスコープになる。
+"""
+
+import os
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterator, Optional
+
+
+class OverlayFS:
+    """書き込みをメモリに保持するオーバーレイ"""
+
+    def __init__(self):
+        self._files: Dict[str, str] = {}
+
+    @staticmethod
+    def _key(path: str) -> str:
+        return os.path.abspath(path)
+
+    def read(self, path: str) -> str:
+        key = self._key(path)
+        if key in self._files:
+            return self._files[key]
+        with open(path, 'r', encoding='utf-8') as f:
+            return f.read()
+
+    def exists(self, path: str) -> bool:
+        return self._key(path) in self._files or os.path.exists(path)
+
+    def write(self, path: str, content: str) -> None:
+        self._files[self._key(path)] = content
+
+    def pending(self) -> Dict[str, str]:
+        """未フラッシュの {絶対パス: 内容}"""
+        return dict(self._files)
+
+    def clear(self) -> None:
+        self._files.clear()
+
+
+# スコープを指定しない場合のスコープ
+PROCESS_SCOPE = "process"
+
+_current_scope: ContextVar[str] = ContextVar("overlay_scope", default=PROCESS_SCOPE)
+# スコープ -> 有効なオーバーレイ
+_overlays: Dict[str, OverlayFS] = {}
+
+
+def scope_of(tool_context: Any = None) -> str:
+    """ToolContext に対応するスコープ（セッション ID）。None の場合は現在のスコープ"""
+    session = getattr(tool_context, "session", None)
+    return session.id if session is not None else _current_scope.get()
+
+
+@contextmanager
+def overlay_scope(tool_context: Any = None) -> Iterator[str]:
+    """ToolContext のセッションのオーバーレイを、このブロック内で使うようにする"""
+    token = _current_scope.set(scope_of(tool_context))
+    try:
+        yield _current_scope.get()
+    finally:
+        _current_scope.reset(token)
+
+
+def get_active_overlay(scope: Optional[str] = None) -> Optional[OverlayFS]:
+    """スコープ（省略時は現在のスコープ）で有効なオーバーレイ（なければ None）"""
+    return _overlays.get(scope or _current_scope.get())
+
+
+def begin_overlay(scope: Optional[str] = None) -> OverlayFS:
+    """オーバーレイを有効化（既に有効な場合はそれを返す）"""
+    return _overlays.setdefault(scope or _current_scope.get(), OverlayFS())
+
+
+def end_overlay(scope: Optional[str] = None) -> Optional[OverlayFS]:
+    """オーバーレイを無効化し、それまで有効だったオーバーレイを返す"""
+    return _overlays.pop(scope or _current_scope.get(), None)
+
+
+def read_text(path: str) -> str:
+    """オーバーレイを考慮してファイルを読み込む"""
+    overlay = get_active_overlay()
+    if overlay is not None:
+        return overlay.read(path)
+    with open(path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
+def path_exists(path: str) -> bool:
+    """オーバーレイを考慮してファイルの存在を確認"""
+    overlay = get_active_overlay()
+    return overlay.exists(path) if overlay is not None else os.path.exists(path)
+
@@ -0,0 +1,267 @@
+"""
+フロントエンドプロジェクトのインデックス
+
+SFC・ルート・アセット・依存関係・Vite 設定をまとめて記録し、メモリとディスク
+（既定では `adk-agents/.cache/project_index.json`）の両方に保持する。
+ファイルごとに mtime / size を記録し、変化したファイルだけを再解析する。
+`max_age` 秒以内の問い合わせはディレクトリを走査せずにキャッシュを返す。
+"""
+
+import fnmatch
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+# プロジェクトルート（src/ と package.json があるディレクトリ）
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+
+# .gitignore に関係なく常に除外するディレクトリ
+DEFAULT_IGNORED_DIRS = {".git", "node_modules", "dist", ".vite", "__pycache__", "adk-agents"}
+
+ASSET_EXTENSIONS = {
+    ".png", ".jpg", ".jpeg", ".gif", ".svg", ".webp", ".ico", ".avif",
+    ".woff", ".woff2", ".ttf", ".otf", ".eot", ".mp4", ".webm", ".mp3",
+}
+VITE_CONFIG_NAMES = {"vite.config.js", "vite.config.ts", "vite.config.mjs", "vite.config.cjs", "vite.config.mts"}
+
+_ROUTE_PATH = re.compile(r'path\s*:\s*[\'"`]([^\'"`]+)[\'"`]')
+_VITE_PLUGIN = re.compile(r'\b([A-Za-z_$][\w$]*)\s*\(')
+
+
+def _load_ignore_patterns(root: Path) -> List[Tuple[str, bool, bool]]:
+    """ルートの .gitignore を (pattern, dir_only, anchored) のリストに変換（否定パターンは未対応）"""
+    gitignore = root / ".gitignore"
+    if not gitignore.exists():
+        return []
+    patterns = []
+    for line in gitignore.read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line or line.startswith("#") or line.startswith("!"):
+            continue
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        anchored = "/" in line
+        patterns.append((line.lstrip("/"), dir_only, anchored))
+    return patterns
+
+
+def _classify(rel_path: str) -> Optional[str]:
+    """インデックス対象のファイル種別を判定"""
+    name = rel_path.rsplit("/", 1)[-1]
+    suffix = os.path.splitext(name)[1].lower()
+    if rel_path == "package.json":
+        return "package_json"
+    if name in VITE_CONFIG_NAMES and "/" not in rel_path:
+        return "vite_config"
+    if suffix == ".vue":
+        return "sfc"
+    if rel_path.startswith("src/router/") and suffix in (".js", ".ts"):
+        return "router"
+    if suffix in ASSET_EXTENSIONS and (rel_path.startswith("src/") or rel_path.startswith("public/")):
+        return "asset"
+    return None
+
+
+def _parse_file(path: Path, kind: str) -> Any:
+    """種別ごとの解析結果（SFC・アセットは解析不要）"""
+    if kind == "package_json":
+        data = json.loads(path.read_text(encoding="utf-8"))
+        return {
+            "name": data.get("name"),
+            "version": data.get("version"),
+            "scripts": data.get("scripts", {}),
+            "dependencies": data.get("dependencies", {}),
+            "devDependencies": data.get("devDependencies", {}),
+        }
+    if kind == "router":
+        return _ROUTE_PATH.findall(path.read_text(encoding="utf-8"))
+    if kind == "vite_config":
+        content = path.read_text(encoding="utf-8")
+        plugins_match = re.search(r'plugins\s*:\s*\[(.*?)\]', content, re.DOTALL)
+        plugins = _VITE_PLUGIN.findall(plugins_match.group(1)) if plugins_match else []
+        return {"plugins": plugins}
+    return None
+
+
+class ProjectIndex:
+    """プロジェクト構造のインデックス"""
+
+    def __init__(
+        self,
+        root: Union[str, Path] = PROJECT_ROOT,
+        cache_path: Optional[Union[str, Path]] = None,
+        max_age: float = 2.0,
+    ):
+        self.root = Path(root)
+        self.cache_path = Path(cache_path) if cache_path else Path(__file__).resolve().parents[2] / ".cache" / "project_index.json"
+        self.max_age = max_age
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._structure: Optional[Dict[str, Any]] = None
+        self._scanned_at = 0.0
+        self._load_cache()
+
+    # ------------------------------
+    # Disk cache
+    # ------------------------------
+    def _load_cache(self) -> None:
+        try:
+            cached = json.loads(self.cache_path.read_text(encoding="utf-8"))
+            if cached.get("root") == str(self.root):
+                self._entries = cached["entries"]
+        except (OSError, ValueError, KeyError):
+            self._entries = {}
+
+    def _save_cache(self) -> None:
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = self.cache_path.with_suffix(".tmp")
+            temp_path.write_text(json.dumps({"root": str(self.root), "entries": self._entries}), encoding="utf-8")
+            os.replace(temp_path, self.cache_path)
+        except OSError:
+            # キャッシュの保存失敗はインデックスの利用に影響しない
+            pass
+
+    # ------------------------------
+    # Scan
+    # ------------------------------
+    def _is_ignored(self, rel_path: str, name: str, is_dir: bool, patterns: List[Tuple[str, bool, bool]]) -> bool:
+        if is_dir and name in DEFAULT_IGNORED_DIRS:
+            return True
+        for pattern, dir_only, anchored in patterns:
+            if dir_only and not is_dir:
+                continue
+            if fnmatch.fnmatch(rel_path if anchored else name, pattern):
+                return True
+        return False
+
+    def _walk(self) -> Dict[str, os.stat_result]:
+        """os.scandir で対象ファイルを列挙し、rel_path -> stat を返す"""
+        patterns = _load_ignore_patterns(self.root)
+        found: Dict[str, os.stat_result] = {}
+        stack = [(self.root, "")]
+        while stack:
+            directory, prefix = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    for entry in it:
+                        rel_path = f"{prefix}{entry.name}"
+                        is_dir = entry.is_dir(follow_symlinks=False)
+                        if self._is_ignored(rel_path, entry.name, is_dir, patterns):
+                            continue
+                        if is_dir:
+                            stack.append((Path(entry.path), f"{rel_path}/"))
+                        elif _classify(rel_path):
+                            found[rel_path] = entry.stat()
+            except OSError:
+                continue
+        return found
+
+    def refresh(self, force: bool = False) -> bool:
+        """ディレクトリを走査し、変化したファイルだけを再解析する
+
+        Returns:
+            インデックスに変化があった場合 True
+        """
+        if not force and self._structure is not None and time.monotonic() - self._scanned_at < self.max_age:
+            return False
+
+        found = self._walk()
+        changed = set(self._entries) - set(found)
+        for rel_path in changed:
+            del self._entries[rel_path]
+
+        for rel_path, stat in found.items():
+            entry = self._entries.get(rel_path)
+            if entry and entry["mtime_ns"] == stat.st_mtime_ns and entry["size"] == stat.st_size:
+                continue
+            kind = _classify(rel_path)
+            try:
+                data = _parse_file(self.root / rel_path, kind)
+            except (OSError, ValueError) as e:
+                data = {"error": str(e)}
+            self._entries[rel_path] = {
+                "kind": kind,
+                "mtime_ns": stat.st_mtime_ns,
+                "size": stat.st_size,
+                "data": data,
+            }
+            changed.add(rel_path)
+
+        self._scanned_at = time.monotonic()
+        if changed or self._structure is None:
+            self._structure = self._build_structure()
+            self._save_cache()
+        return bool(changed)
+
+    def invalidate(self, path: Optional[Union[str, Path]] = None) -> None:
+        """次回の問い合わせで再走査させる（path 指定時はそのファイルを再解析させる）"""
+        self._scanned_at = 0.0
+        if path is not None:
+            try:
+                rel_path = Path(path).resolve().relative_to(self.root.resolve()).as_posix()
+            except ValueError:
+                return
+            self._entries.pop(rel_path, None)
+
+    # ------------------------------
+    # Query
+    # ------------------------------
+    def _build_structure(self) -> Dict[str, Any]:
+        by_kind: Dict[str, List[str]] = {}
+        for rel_path in sorted(self._entries):
+            by_kind.setdefault(self._entries[rel_path]["kind"], []).append(rel_path)
+
+        sfcs = by_kind.get("sfc", [])
+        package = self._entries.get("package.json", {}).get("data") or {}
+        vite_configs = by_kind.get("vite_config", [])
+
+        routes = []
+        for rel_path in by_kind.get("router", []):
+            for route in self._entries[rel_path]["data"] or []:
+                routes.append({"path": route, "source": rel_path})
+        # ファイルベースルーティング（src/pages/）
+        for rel_path in sfcs:
+            if rel_path.startswith("src/pages/"):
+                route = "/" + rel_path[len("src/pages/"):-len(".vue")]
+                route = re.sub(r'(^|/)index$', r'\1', route).rstrip("/") or "/"
+                routes.append({"path": route, "source": rel_path})
+
+        return {
+            "root": str(self.root),
+            "sfcs": sfcs,
+            "components": [p for p in sfcs if p.startswith("src/components/")],
+            "views": [p for p in sfcs if p.startswith("src/views/")],
+            "pages": [p for p in sfcs if p.startswith("src/pages/")],
+            "routes": routes,
+            "assets": by_kind.get("asset", []),
+            "package_json": package or None,
+            "dependencies": list(package.get("dependencies", {}).keys()),
+            "dev_dependencies": list(package.get("devDependencies", {}).keys()),
+            "vite_config": {
+                "path": vite_configs[0],
+                "plugins": (self._entries[vite_configs[0]]["data"] or {}).get("plugins", []),
+            } if vite_configs else None,
+        }
+
+    def file_entry(self, rel_path: str) -> Optional[Dict[str, Any]]:
+        """インデックス済みファイルの情報（kind / mtime_ns / size / data）"""
+        return self._entries.get(rel_path)
+
+    def structure(self) -> Dict[str, Any]:
+        """プロジェクト構造を取得（必要な場合のみ再走査）"""
+        self.refresh()
+        return self._structure
+
+
+_project_index: Optional[ProjectIndex] = None
+
+
+def get_project_index() -> ProjectIndex:
+    """プロセス共有の ProjectIndex を取得"""
+    global _project_index
+    if _project_index is None:
+        _project_index = ProjectIndex()
+    return _project_index
@@ -0,0 +1,65 @@
+"""
+エージェントのプロンプトサイズの一覧
+
+全エージェントを構築し、build_instruction で作成した instruction の文字数・
+概算トークン数・登録済みツール・未登録のツール参照を表示する。
+
+使い方:
+    cd adk-agents
+    python -m ui_design_coordinator.tools.prompt_report
+    python -m ui_design_coordinator.tools.prompt_report --json
+    python -m ui_design_coordinator.tools.prompt_report --show design_agent   # instruction 全文
+"""
+
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+from ..prompt_manifest import get_prompt_stats
+
+
+def _build_all_agents():
+    """ルートエージェントと全サブエージェントを構築（構築時に統計が記録される）"""
+    from .. import agents
+    from ..agent import root_agent
+
+    built = {root_agent.name: root_agent}
+    for factory_name in agents.__all__:
+        if factory_name.startswith("create_"):
+            agent = getattr(agents, factory_name)()
+            built[agent.name] = agent
+    return built
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Show instruction sizes of ui_design_coordinator agents")
+    parser.add_argument("--json", action="store_true", help="JSON で出力")
+    parser.add_argument("--show", metavar="AGENT", help="指定したエージェントの instruction 全文を表示")
+    args = parser.parse_args(argv)
+
+    built = _build_all_agents()
+    if args.show:
+        if args.show not in built:
+            print(f"Unknown agent: {args.show} (choices: {', '.join(built)})", file=sys.stderr)
+            sys.exit(1)
+        print(built[args.show].instruction)
+        return
+
+    stats = sorted(get_prompt_stats().values(), key=lambda s: s["estimated_tokens"], reverse=True)
+    if args.json:
+        print(json.dumps(stats, ensure_ascii=False, indent=2))
+        return
+
+    print(f"{'agent':<24} {'chars':>7} {'~tokens':>8} {'tools':>6}  unknown references")
+    for entry in stats:
+        unknown = ", ".join(entry["unknown_tool_references"]) or "-"
+        print(f"{entry['agent']:<24} {entry['chars']:>7} {entry['estimated_tokens']:>8} {len(entry['tools']):>6}  {unknown}")
+    print(f"{'total':<24} {sum(s['chars'] for s in stats):>7} {sum(s['estimated_tokens'] for s in stats):>8}")
+
+    if any(entry["unknown_tool_references"] for entry in stats):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,495 @@
+"""
+JS / TS のスクリプトインデックス
+
+<script>（<script setup> を含む）を軽量なトークナイザーで1パスでトークン化し、
+import・リアクティビティ API の呼び出し（ref / reactive / computed / watch など）・
+defineProps / defineEmits・トップレベルの宣言のインデックスを作成する。
+コメント・文字列・テンプレートリテラル・正規表現リテラルを考慮するため、
+コメント内のコードや `stopwatch` のような識別子を誤って数えない。
+vue からの import の別名（`import { computed as c } from 'vue'`）は元の API 名で記録する。
+
+スクリプトの指標（ui_analysis_tools・評価エージェント）はすべてこのインデックスから求める。
+"""
+
+import re
+from bisect import bisect_right
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+_TOKEN = re.compile(
+    r"""
+    (?P<ws>\s+)
+    |(?P<comment>//[^\n]*|/\*.*?(?:\*/|\Z))
+    |(?P<string>"(?:[^"\\\n]|\\.)*"?|'(?:[^'\\\n]|\\.)*'?)
+    |(?P<template>`)
+    |(?P<ident>[A-Za-z_$][\w$]*)
+    |(?P<number>\d[\w.]*|\.\d\w*)
+    |(?P<punct>=>|\.\.\.|\?\.|[^\s\w])
+    """,
+    re.DOTALL | re.VERBOSE,
+)
+
+# 直後の "/" を正規表現リテラルとして扱うキーワード
+_REGEX_PRECEDING_KEYWORDS = {"return", "typeof", "instanceof", "in", "of", "new", "delete", "void", "throw", "case", "do", "else", "yield", "await"}
+
+REACTIVE_APIS = ("ref", "shallowRef", "reactive", "shallowReactive", "customRef")
+COMPUTED_APIS = ("computed",)
+WATCH_APIS = ("watch", "watchEffect", "watchPostEffect", "watchSyncEffect")
+LIFECYCLE_APIS = (
+    "onBeforeMount", "onMounted", "onBeforeUpdate", "onUpdated", "onBeforeUnmount", "onUnmounted",
+    "onActivated", "onDeactivated", "onErrorCaptured",
+)
+MACROS = ("defineProps", "defineEmits", "defineExpose", "defineModel", "defineOptions", "defineSlots", "withDefaults")
+TRACKED_CALLS = set(REACTIVE_APIS + COMPUTED_APIS + WATCH_APIS + LIFECYCLE_APIS + MACROS) | {
+    "readonly", "toRef", "toRefs", "nextTick", "provide", "inject", "defineAsyncComponent", "defineComponent",
+}
+
+_DECLARATION_KEYWORDS = {"const": "const", "let": "let", "var": "var", "function": "function", "class": "class",
+                         "interface": "interface", "type": "type", "enum": "enum"}
+
+
+def _template_literal_end(text: str, pos: int) -> Tuple[int, List[Tuple[int, int]]]:
+    """テンプレートリテラルの終端と ${} 式の範囲 [(start, end)]（pos は開始の ` の次）"""
+    expressions = []
+    length = len(text)
+    while pos < length:
+        char = text[pos]
+        if char == "\\":
+            pos += 2
+            continue
+        if char == "`":
+            return pos + 1, expressions
+        if text.startswith("${", pos):
+            depth, end = 1, pos + 2
+            while end < length and depth:
+                if text[end] in "'\"`":  # 式内の文字列
+                    quote, end = text[end], end + 1
+                    while end < length and text[end] != quote:
+                        end += 2 if text[end] == "\\" else 1
+                depth += {"{": 1, "}": -1}.get(text[end], 0) if end < length else 0
+                end += 1
+            expressions.append((pos + 2, end - 1))
+            pos = end
+            continue
+        pos += 1
+    return length, expressions
+
+
+def _regex_literal_end(text: str, pos: int) -> int:
+    """正規表現リテラルの終端（pos は開始の / の次）。改行までに閉じなければ -1"""
+    in_class = False
+    length = len(text)
+    while pos < length:
+        char = text[pos]
+        if char == "\\":
+            pos += 2
+            continue
+        if char == "\n":
+            return -1
+        if char == "[":
+            in_class = True
+        elif char == "]":
+            in_class = False
+        elif char == "/" and not in_class:
+            pos += 1
+            while pos < length and (text[pos].isalnum() or text[pos] == "_"):
+                pos += 1
+            return pos
+        pos += 1
+    return -1
+
+
+def tokenize_js(text: str, base: int = 0, end: Optional[int] = None) -> Iterator[Tuple[str, str, int]]:
+    """JS / TS をトークン化する
+
+    Yields:
+        (kind, value, offset)
+        kind は "ident" / "string" / "template" / "regex" / "number" / "punct"。コメントと空白は除かれる。
+        テンプレートリテラルの ${} 内の式もトークン化して続けて返す。
+    """
+    pos = base
+    end = len(text) if end is None else end
+    previous: Optional[Tuple[str, str]] = None
+    while pos < end:
+        match = _TOKEN.match(text, pos, end)
+        if not match:
+            pos += 1
+            continue
+        kind = match.lastgroup
+        value = match.group(0)
+        start = pos
+        pos = match.end()
+        if kind in ("ws", "comment"):
+            continue
+        if kind == "template":
+            pos, expressions = _template_literal_end(text, pos)
+            pos = min(pos, end)
+            yield "template", text[start:pos], start
+            for expr_start, expr_end in expressions:
+                yield from tokenize_js(text, expr_start, min(expr_end, end))
+            previous = ("template", "`")
+            continue
+        if kind == "punct" and value == "/":
+            regex_allowed = previous is None or (
+                previous[0] == "punct" and previous[1] not in (")", "]", "}")
+            ) or (previous[0] == "ident" and previous[1] in _REGEX_PRECEDING_KEYWORDS)
+            if regex_allowed:
+                regex_end = _regex_literal_end(text, pos)
+                if regex_end > 0:
+                    pos = min(regex_end, end)
+                    yield "regex", text[start:pos], start
+                    previous = ("regex", "")
+                    continue
+        previous = (kind, value)
+        yield kind, value, start
+
+
+# 式の途中に置かれる（前後のオペランドをつなぐ）キーワード
+_OPERATOR_KEYWORDS = {
+    "in", "of", "instanceof", "as", "satisfies", "typeof", "new", "await", "async", "void", "delete", "yield", "keyof",
+}
+
+
+def _starts_statement(previous: Tuple[str, str, int], token: Tuple[str, str, int]) -> bool:
+    """オペランドの直後にオペランドが続く（= ASI で新しい文が始まる）か"""
+    ends_operand = previous[0] in ("ident", "number", "string", "template", "regex") or previous[1] in (")", "]", "}")
+    starts_operand = token[0] in ("ident", "number", "string", "template", "regex")
+    return (ends_operand and starts_operand
+            and previous[1] not in _OPERATOR_KEYWORDS and token[1] not in _OPERATOR_KEYWORDS)
+
+
+def _unquote(value: str) -> str:
+    return value[1:-1] if len(value) >= 2 and value[0] in "'\"`" and value[-1] == value[0] else value
+
+
+class ScriptIndex:
+    """import・リアクティビティ API の呼び出し・マクロ・トップレベル宣言のインデックス"""
+
+    def __init__(self, script: str = "", setup: bool = False, lang: str = "js"):
+        self.setup = setup
+        self.lang = lang
+        # [{"source", "default", "named", "aliases", "namespace", "type_only", "line", "start", "end"}]
+        # named はローカル名、aliases は {ローカル名: import 元での名前}（`x as y` の場合のみ）
+        self.imports: List[Dict[str, Any]] = []
+        self.dynamic_imports: List[str] = []
+        # [{"name", "line", "depth", "assigned_to", "options", "start", "end"}]
+        self.calls: List[Dict[str, Any]] = []
+        # [{"name", "kind", "exported", "line"}]
+        self.declarations: List[Dict[str, Any]] = []
+        self.props: List[str] = []
+        self.emits: List[str] = []
+        # Options API のブロック（computed: {...} など）のメンバー名
+        self.options: Dict[str, List[str]] = {}
+        self.identifiers: Dict[str, int] = {}
+        self.has_setup_function = False
+        self.line_count = len(script.split("\n")) if script else 0
+        if script:
+            self._build(script)
+
+    # ------------------------------
+    # Build
+    # ------------------------------
+    def _build(self, script: str) -> None:
+        tokens = list(tokenize_js(script))
+        newlines = [i for i, char in enumerate(script) if char == "\n"]
+
+        def line_of(offset: int) -> int:
+            return bisect_right(newlines, offset - 1) + 1
+
+        # 各トークンの括弧の深さ（{ ( [ をまとめて数える）と、対応する閉じ括弧の位置
+        depths, closing, stack = [], {}, []
+        for i, (kind, value, _) in enumerate(tokens):
+            if kind == "punct" and value in ")]}" and stack:
+                closing[stack.pop()] = i
+            depths.append(len(stack))
+            if kind == "punct" and value in "([{":
+                stack.append(i)
+
+        def at(i: int) -> Tuple[str, str]:
+            return (tokens[i][0], tokens[i][1]) if 0 <= i < len(tokens) else ("", "")
+
+        # import は巻き上げられるので先に集め、vue の API の別名（import { computed as c }）を解決する
+        for i, (kind, value, _) in enumerate(tokens):
+            if (kind, value) == ("ident", "import") and depths[i] == 0 and at(i - 1)[1] not in (".", "?.") \
+                    and at(i + 1)[1] not in ("(", "."):  # import() / import.meta は除く
+                self._add_import(script, tokens, i, line_of)
+        api_aliases = {
+            local: imported
+            for entry in self.imports if entry["source"] == "vue" or entry["source"].startswith("@vue/")
+            for local, imported in entry["aliases"].items() if imported in TRACKED_CALLS
+        }
+
+        for i, (kind, value, offset) in enumerate(tokens):
+            if kind == "ident":
+                self.identifiers[value] = self.identifiers.get(value, 0) + 1
+            if kind != "ident" or at(i - 1) in (("punct", "."), ("punct", "?.")):
+                continue
+
+            if value == "import":
+                if at(i + 1) == ("punct", "(") and at(i + 2)[0] == "string":
+                    self.dynamic_imports.append(_unquote(tokens[i + 2][1]))
+                continue
+
+            if depths[i] == 0:
+                self._add_declaration(tokens, i, line_of, depths)
+
+            api = api_aliases.get(value, value)
+            if api in TRACKED_CALLS:
+                type_args_end = None
+                j = i + 1
+                if at(j) == ("punct", "<"):  # defineProps<{...}>()
+                    angle = 0
+                    while j < len(tokens):
+                        if at(j) == ("punct", "<"):
+                            angle += 1
+                        elif at(j) == ("punct", ">"):
+                            angle -= 1
+                            if angle == 0:
+                                break
+                        j += 1
+                    type_args_end = j
+                    j += 1
+                # computed: {...} / watch: {...} のような Options API の形は下で扱う
+                if at(j) == ("punct", "(") and at(i - 1) != ("ident", "function"):
+                    call_end = closing.get(j, len(tokens) - 1)
+                    call = {
+                        "name": api,
+                        "line": line_of(offset),
+                        "depth": depths[i],
+                        "assigned_to": tokens[i - 2][1] if at(i - 1) == ("punct", "=") and at(i - 2)[0] == "ident" else None,
+                        "options": self._call_options(tokens, j, call_end, depths),
+                        "start": offset,
+                        "end": tokens[call_end][2] + len(tokens[call_end][1]),
+                    }
+                    self.calls.append(call)
+                    if api in ("defineProps", "defineEmits"):
+                        spans = [(i + 2, type_args_end)] if type_args_end else []
+                        spans.append((j + 1, call_end))
+                        names = self._macro_names(tokens, spans, depths, emits=api == "defineEmits")
+                        (self.props if api == "defineProps" else self.emits).extend(
+                            name for name in names if name not in (self.props if api == "defineProps" else self.emits)
+                        )
+                    continue
+
+            if value == "setup" and at(i + 1)[1] in ("(", ":") and depths[i] > 0:  # setup() { ... } オプション
+                self.has_setup_function = True
+                continue
+
+            # Options API: computed: { ... } / watch: { ... } / methods: { ... } / props / emits
+            if value in ("computed", "watch", "methods", "props", "emits") and at(i + 1) == ("punct", ":"):
+                opener = i + 2
+                if at(opener)[1] in ("{", "["):
+                    members = self._object_keys(tokens, opener, closing.get(opener, len(tokens) - 1), depths)
+                    self.options.setdefault(value, []).extend(members)
+                    if value == "props":
+                        self.props.extend(m for m in members if m not in self.props)
+                    elif value == "emits":
+                        self.emits.extend(m for m in members if m not in self.emits)
+
+    def _add_import(self, script: str, tokens: List[Tuple[str, str, int]], i: int, line_of) -> None:
+        entry = {"source": None, "default": None, "named": [], "aliases": {}, "namespace": None, "type_only": False,
+                 "line": line_of(tokens[i][2]), "start": tokens[i][2], "end": tokens[i][2]}
+        j = i + 1
+        in_braces = False
+        while j < len(tokens):
+            kind, value, offset = tokens[j]
+            if kind == "punct" and value == ";":
+                break
+            if kind == "string":
+                entry["source"] = _unquote(value)
+                entry["end"] = offset + len(value)
+                if j + 1 < len(tokens) and tokens[j + 1][1] == ";":
+                    entry["end"] = tokens[j + 1][2] + 1
+                break
+            if kind == "punct" and value == "{":
+                in_braces = True
+            elif kind == "punct" and value == "}":
+                in_braces = False
+            elif kind == "ident":
+                if value == "type" and not entry["named"] and not entry["default"] and not in_braces:
+                    entry["type_only"] = True
+                elif in_braces:
+                    if value not in ("as", "type"):
+                        if tokens[j - 1][1] == "as" and entry["named"]:
+                            entry["aliases"][value] = entry["named"][-1]
+                            entry["named"][-1] = value
+                        else:
+                            entry["named"].append(value)
+                elif tokens[j - 1][1] == "as" and tokens[j - 2][1] == "*":
+                    entry["namespace"] = value
+                elif value not in ("from", "as"):
+                    entry["default"] = value
+            j += 1
+        if entry["source"] is not None:
+            self.imports.append(entry)
+
+    def _add_declaration(self, tokens: List[Tuple[str, str, int]], i: int, line_of, depths: List[int]) -> None:
+        kind_name = _DECLARATION_KEYWORDS.get(tokens[i][1])
+        if kind_name is None:
+            return
+        previous = tokens[i - 1][1] if i > 0 else ""
+        exported = previous == "export" or (previous in ("async", "default", "declare") and i > 1 and tokens[i - 2][1] == "export")
+        j = i + 1
+        if j < len(tokens) and tokens[j][1] == "*":  # function*
+            j += 1
+        if kind_name == "type" and not (j + 1 < len(tokens) and tokens[j + 1][1] in ("=", "<")):
+            return  # 識別子としての type
+        names, k = self._binding_names(tokens, j)
+        if not names:
+            return  # `as const` など
+        if kind_name in ("const", "let", "var"):
+            # const a = ref(0), b = reactive({}) の2つ目以降の宣言子
+            while k < len(tokens) and depths[k] >= depths[i]:
+                kind, value, _ = tokens[k]
+                if depths[k] == depths[i]:
+                    if kind == "punct" and value == ";":
+                        break
+                    if kind == "punct" and value == ",":
+                        more, k = self._binding_names(tokens, k + 1)
+                        names.extend(more)
+                        continue
+                    if _starts_statement(tokens[k - 1], tokens[k]):  # セミコロンなしの次の文
+                        break
+                k += 1
+        for name in names:
+            self.declarations.append({"name": name, "kind": kind_name, "exported": exported, "line": line_of(tokens[i][2])})
+
+    @staticmethod
+    def _binding_names(tokens: List[Tuple[str, str, int]], j: int) -> Tuple[List[str], int]:
+        """宣言される名前（識別子、または1階層の分割代入）と、その直後の位置"""
+        if j < len(tokens) and tokens[j][0] == "ident":
+            return [tokens[j][1]], j + 1
+        names = []
+        if j < len(tokens) and tokens[j][1] in ("{", "["):  # 分割代入（1階層のみ）
+            depth = 0
+            for k in range(j, len(tokens)):
+                kind, value, _ = tokens[k]
+                if value in ("{", "["):
+                    depth += 1
+                elif value in ("}", "]"):
+                    depth -= 1
+                    if depth == 0:
+                        return names, k + 1
+                elif kind == "ident" and depth == 1:
+                    names.append(value)
+        return names, len(tokens) if names else j
+
+    @staticmethod
+    def _call_options(tokens, start: int, end: int, depths: List[int]) -> Dict[str, Any]:
+        """呼び出しの引数内の `key: true/false` オプション（deep / immediate / flush など）"""
+        options = {}
+        for k in range(start + 1, end - 1):
+            kind, value, _ = tokens[k]
+            if kind == "ident" and tokens[k + 1][1] == ":" and depths[k] == depths[start] + 2:
+                literal_kind, literal, _ = tokens[k + 2]
+                if literal in ("true", "false"):
+                    options[value] = literal == "true"
+                elif literal_kind == "string":
+                    options[value] = _unquote(literal)
+        return options
+
+    @staticmethod
+    def _object_keys(tokens, opener: int, closer: int, depths: List[int]) -> List[str]:
+        """{ ... } のキー、または [ ... ] の文字列要素"""
+        inner_depth = depths[opener] + 1
+        keys = []
+        for k in range(opener + 1, closer):
+            kind, value, _ = tokens[k]
+            if depths[k] != inner_depth:
+                continue
+            if tokens[opener][1] == "[":
+                if kind == "string":
+                    keys.append(_unquote(value))
+            elif kind in ("ident", "string") and tokens[k - 1][1] in ("{", ",", ";") and tokens[k + 1][1] in (":", "(", "?", ",", "}"):
+                keys.append(_unquote(value))
+        return keys
+
+    def _macro_names(self, tokens, spans, depths: List[int], emits: bool) -> List[str]:
+        """defineProps / defineEmits の引数・型引数からプロパティ名・イベント名を抽出"""
+        names = []
+        for start, end in spans:
+            if start >= end:
+                continue
+            opener = start
+            if tokens[opener][1] not in ("{", "["):
+                continue
+            closer = min(end, len(tokens) - 1)
+            if emits and tokens[opener][1] == "{":
+                # 型引数 { (e: 'change', id: number): void } / { change: [id: number] }
+                inner = depths[opener] + 1
+                for k in range(opener + 1, closer):
+                    kind, value, _ = tokens[k]
+                    if kind == "string" and tokens[k - 1][1] == ":" and depths[k] == inner + 1 and tokens[k - 3][1] == "(":
+                        names.append(_unquote(value))
+                    elif kind in ("ident", "string") and depths[k] == inner and tokens[k - 1][1] in ("{", ",", ";") and tokens[k + 1][1] == ":":
+                        names.append(_unquote(value))
+            else:
+                names.extend(self._object_keys(tokens, opener, closer, depths))
+        return list(dict.fromkeys(names))
+
+    # ------------------------------
+    # Queries
+    # ------------------------------
+    def calls_of(self, names: Tuple[str, ...]) -> List[Dict[str, Any]]:
+        return [call for call in self.calls if call["name"] in names]
+
+    @property
+    def uses_composition_api(self) -> bool:
+        return self.setup or self.has_setup_function or bool(
+            self.calls_of(REACTIVE_APIS + COMPUTED_APIS + WATCH_APIS + LIFECYCLE_APIS)
+        )
+
+    def summary(self) -> Dict[str, Any]:
+        """LLM 向けの要約"""
+        return {
+            "setup": self.setup,
+            "lang": self.lang,
+            "imports": [{"source": i["source"], "default": i["default"], "named": i["named"]} for i in self.imports],
+            "props": self.props,
+            "emits": self.emits,
+            "reactive": [c["assigned_to"] or c["name"] for c in self.calls_of(REACTIVE_APIS)],
+            "computed": [c["assigned_to"] or c["name"] for c in self.calls_of(COMPUTED_APIS)] + self.options.get("computed", []),
+            "watchers": len(self.calls_of(WATCH_APIS)) + len(self.options.get("watch", [])),
+            "declarations": [f"{d['kind']} {d['name']}" for d in self.declarations],
+        }
+
+
+def build_script_index(script: str, setup: bool = False, lang: str = "js") -> ScriptIndex:
+    """スクリプトの文字列からインデックスを作成"""
+    return ScriptIndex(script, setup=setup, lang=lang)
+
+
+def build_sfc_script_index(content: str) -> ScriptIndex:
+    """SFC の <script> / <script setup> ブロックからインデックスを作成
+
+    両方のブロックがある場合は1つのインデックスにまとめる（オフセット・行番号はブロックごと）。
+    """
+    # ui_analysis_tools がこのモジュールを使用するため、使用時に import する
+    from .ui_analysis_tools import parse_sfc_blocks
+
+    scripts = [block for block in parse_sfc_blocks(content) if block["type"] == "script"]
+    if not scripts:
+        return ScriptIndex()
+
+    merged: Optional[ScriptIndex] = None
+    for block in scripts:
+        lang_match = re.search(r'\blang\s*=\s*["\']?(\w+)', block["attrs"])
+        index = ScriptIndex(
+            content[block["content_start"]:block["content_end"]],
+            setup=re.search(r'\bsetup\b', block["attrs"]) is not None,
+            lang=lang_match.group(1) if lang_match else "js",
+        )
+        if merged is None:
+            merged = index
+            continue
+        merged.setup = merged.setup or index.setup
+        merged.has_setup_function = merged.has_setup_function or index.has_setup_function
+        merged.line_count += index.line_count
+        for attr in ("imports", "dynamic_imports", "calls", "declarations"):
+            getattr(merged, attr).extend(getattr(index, attr))
+        merged.props.extend(p for p in index.props if p not in merged.props)
+        merged.emits.extend(e for e in index.emits if e not in merged.emits)
+        for key, members in index.options.items():
+            merged.options.setdefault(key, []).extend(members)
+        for name, count in index.identifiers.items():
+            merged.identifiers[name] = merged.identifiers.get(name, 0) + count
+    return merged
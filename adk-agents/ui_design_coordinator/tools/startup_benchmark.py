@@ -0,0 +1,85 @@
+"""
+起動時間のベンチマーク
+
+別プロセスで `ui_design_coordinator` を import し（`UI_STARTUP_PROFILE=1`）、
+`StartupProfiler` のレポートを出力する。予算を超えた場合は終了コード 1 で終了する。
+
+使い方:
+    cd adk-agents
+    python -m ui_design_coordinator.tools.startup_benchmark --build-agents --budget ready=2.0 --budget group:google.adk=1.0
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from ..startup_profiler import (
+    ENV_BUDGETS,
+    ENV_ENABLED,
+    ENV_OUTPUT,
+    StartupBudgetExceeded,
+    assert_budgets,
+    check_budgets,
+    parse_budgets,
+)
+
+_PROFILE_SCRIPT = """
+import ui_design_coordinator
+if {build_agents!r}:
+    for tool in ui_design_coordinator.root_agent.tools:
+        getattr(tool, "agent", None)
+"""
+
+
+def profile_startup(build_agents: bool = False, python: str = sys.executable) -> Dict[str, Any]:
+    """別プロセスでパッケージを import し、コールドスタートのレポートを取得"""
+    with tempfile.TemporaryDirectory() as temp_dir:
+        output = os.path.join(temp_dir, "startup_profile.json")
+        env = {**os.environ, ENV_ENABLED: "1", ENV_OUTPUT: output}
+        env.pop(ENV_BUDGETS, None)
+        subprocess.run(
+            [python, "-c", _PROFILE_SCRIPT.format(build_agents=build_agents)],
+            cwd=str(Path(__file__).resolve().parents[2]),
+            env=env,
+            check=True,
+        )
+        with open(output, encoding="utf-8") as f:
+            return json.load(f)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Profile ui_design_coordinator startup")
+    parser.add_argument("--build-agents", action="store_true", help="サブエージェントも構築して計測する")
+    parser.add_argument("--budget", action="append", default=[], help="予算（例: ready=2.0、factory:design_agent=0.3）")
+    parser.add_argument("--top", type=int, default=20, help="出力する import / グループの件数")
+    args = parser.parse_args(argv)
+
+    budgets = parse_budgets(os.environ.get(ENV_BUDGETS))
+    budgets.update(parse_budgets(",".join(args.budget)))
+
+    report = profile_startup(build_agents=args.build_agents)
+    report["budgets"] = budgets
+    report["violations"] = check_budgets(report, budgets)
+
+    # 予算は全件で判定し、出力するコピーだけ --top 件に絞る
+    printed = {
+        **report,
+        "imports": report["imports"][:args.top],
+        "import_groups": dict(list(report["import_groups"].items())[:args.top]),
+    }
+    print(json.dumps(printed, indent=2, ensure_ascii=False))
+
+    try:
+        assert_budgets(report)
+    except StartupBudgetExceeded as e:
+        print(f"Startup budget exceeded: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
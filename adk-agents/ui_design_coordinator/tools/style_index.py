@@ -0,0 +1,364 @@
+"""
+CSS / SCSS のスタイルインデックス
+
+<style> ブロックを1パスでトークン化し、セレクタ → 宣言のインデックスを作成する。
+文字列・コメント（/* */ と SCSS の //）・#{} 補間・括弧内の ; を考慮し、
+SCSS のネスト（& による親参照を含む）と @media などの条件付きグループを
+解決したセレクタ・メディアクエリ付きで宣言を記録する。
+
+色・スペーシング・タイポグラフィ・メディアクエリの分析
+（ui_analysis_tools）はすべてこのインデックスに問い合わせる。
+"""
+
+import re
+from bisect import bisect_right
+from collections import Counter
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+# トークン化で特別扱いする文字列
+_SPECIAL = re.compile(r'/\*|//|#\{|["\'{};()]')
+
+# 宣言ではなくグループとして扱う at-rule（中のルールは親のセレクタを引き継ぐ）
+_CONDITIONAL_AT_RULES = ("@media", "@supports", "@layer", "@container", "@if", "@else", "@each", "@for", "@while", "@at-root", "@include")
+# 中身をインデックスに含めない at-rule
+_SKIPPED_AT_RULES = ("@mixin", "@function", "@keyframes", "@-webkit-keyframes", "@page")
+
+COLOR_PROPERTIES = (
+    "color", "background", "background-color", "border", "border-color", "border-top", "border-right",
+    "border-bottom", "border-left", "outline", "outline-color", "fill", "stroke", "box-shadow", "text-shadow",
+    "caret-color", "accent-color", "text-decoration-color",
+)
+SPACING_PROPERTIES = (
+    "margin", "margin-top", "margin-right", "margin-bottom", "margin-left", "margin-inline", "margin-block",
+    "padding", "padding-top", "padding-right", "padding-bottom", "padding-left", "padding-inline", "padding-block",
+    "gap", "row-gap", "column-gap",
+)
+TYPOGRAPHY_PROPERTIES = ("font", "font-family", "font-size", "font-weight", "line-height", "letter-spacing")
+
+_COLOR_VALUE = re.compile(
+    r'#[0-9a-fA-F]{3,8}\b|\b(?:rgba?|hsla?|hwb|lab|lch|oklab|oklch|color-mix)\([^()]*(?:\([^()]*\)[^()]*)*\)'
+    r'|\b(?:white|black|red|green|blue|yellow|orange|purple|gray|grey|transparent|currentColor)\b'
+)
+_LENGTH_VALUE = re.compile(r'(-?\d*\.?\d+)(px|rem|em|%|vh|vw|dp)?(?![\w%])')
+
+
+def tokenize_css(text: str) -> Iterator[Tuple[str, str, int]]:
+    """CSS / SCSS をトークン化する
+
+    Yields:
+        (kind, text, offset)
+        kind は "open"（"{" の前のセレクタ / at-rule）、"decl"（";" または "}" で終わる宣言・文）、"close"（"}"）。
+        offset は text の開始位置。コメントは除かれる。
+    """
+    length = len(text)
+    pos = 0
+    start = 0
+    parts: List[str] = []
+    first: List[int] = []  # 現在のトークンの最初の非空白文字の位置
+    paren_depth = 0
+
+    def take(end: int) -> None:
+        segment = text[start:end]
+        if not first and segment.strip():
+            first.append(start + len(segment) - len(segment.lstrip()))
+        parts.append(segment)
+
+    def flush() -> Tuple[str, int]:
+        take(pos)
+        chunk = "".join(parts).strip()
+        offset = first[0] if first else pos
+        parts.clear()
+        first.clear()
+        return chunk, offset
+
+    while True:
+        match = _SPECIAL.search(text, pos)
+        if not match:
+            pos = length
+            chunk, offset = flush()
+            if chunk:
+                yield "decl", chunk, offset
+            return
+
+        token = match.group(0)
+        pos = match.start()
+        if token == "/*":
+            take(pos)
+            end = text.find("*/", pos + 2)
+            pos = start = length if end < 0 else end + 2
+            continue
+        if token == "//":
+            if paren_depth:  # url(http://...) など
+                pos += 2
+                continue
+            take(pos)
+            end = text.find("\n", pos)
+            pos = start = length if end < 0 else end
+            continue
+        if token in ('"', "'"):
+            end = pos + 1
+            while end < length and text[end] != token:
+                end += 2 if text[end] == "\\" else 1
+            pos = end + 1
+            continue
+        if token == "#{":
+            depth, end = 1, pos + 2
+            while end < length and depth:
+                depth += {"{": 1, "}": -1}.get(text[end], 0)
+                end += 1
+            pos = end
+            continue
+        if token == "(":
+            paren_depth += 1
+            pos += 1
+            continue
+        if token == ")":
+            paren_depth = max(0, paren_depth - 1)
+            pos += 1
+            continue
+        if token == ";" and paren_depth:  # url(data:...;base64,...)
+            pos += 1
+            continue
+
+        chunk, offset = flush()
+        pos = start = pos + 1
+        if token == "{":
+            paren_depth = 0
+            yield "open", chunk, offset
+        elif token == ";":
+            if chunk:
+                yield "decl", chunk, offset
+        else:
+            paren_depth = 0
+            if chunk:
+                yield "decl", chunk, offset
+            yield "close", "", match.start()
+
+
+def parse_lengths(value: str) -> List[Tuple[str, float, str]]:
+    """値に含まれる長さ [(元の表記, 数値, 単位)]"""
+    return [(m.group(0), float(m.group(1)), m.group(2) or "") for m in _LENGTH_VALUE.finditer(value)]
+
+
+def _split_selectors(selector: str) -> List[str]:
+    """カンマ区切りのセレクタを分割（括弧内のカンマは分割しない）"""
+    selectors, depth, current = [], 0, []
+    for char in selector:
+        if char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == "," and depth == 0:
+            selectors.append("".join(current))
+            current = []
+            continue
+        current.append(char)
+    selectors.append("".join(current))
+    return [" ".join(s.split()) for s in selectors if s.strip()]
+
+
+def _resolve_selectors(parents: List[str], selector: str) -> List[str]:
+    """SCSS のネストを解決（& は親セレクタに置き換える）"""
+    children = _split_selectors(selector)
+    if not parents:
+        return [child.replace("&", "").strip() or child for child in children]
+    resolved = []
+    for parent in parents:
+        for child in children:
+            resolved.append(child.replace("&", parent) if "&" in child else f"{parent} {child}")
+    return resolved
+
+
+class StyleIndex:
+    """セレクタ → 宣言のインデックス"""
+
+    def __init__(self):
+        # [{"selectors", "media", "declarations": [{"property", "value", "important", "line"}], "line", "block"}]
+        # 宣言のないルール（.a {} やネストしたルールだけを持つルール）も含む
+        self.rules: List[Dict[str, Any]] = []
+        self.by_selector: Dict[str, List[Dict[str, Any]]] = {}
+        self.variables: Dict[str, str] = {}
+        self.keyframes: List[str] = []
+        self.at_statements: List[Dict[str, Any]] = []  # @use / @import / @include など
+        self.blocks: List[Dict[str, Any]] = []  # [{"lang", "scoped", "start_line"}]
+
+    # ------------------------------
+    # Build
+    # ------------------------------
+    def add_stylesheet(self, text: str, lang: str = "css", scoped: bool = False, start_line: int = 1) -> None:
+        """1つのスタイルシート（<style> ブロックの中身）をインデックスに追加"""
+        block = len(self.blocks)
+        self.blocks.append({"lang": lang, "scoped": scoped, "start_line": start_line})
+        newlines = [i for i, char in enumerate(text) if char == "\n"]
+
+        def line_of(offset: int) -> int:
+            return start_line + bisect_right(newlines, offset - 1)
+
+        # スタック要素: {"selectors", "media", "rule", "skip"}
+        stack: List[Dict[str, Any]] = [{"selectors": [], "media": [], "rule": None, "skip": False}]
+        for kind, chunk, offset in tokenize_css(text):
+            context = stack[-1]
+            if kind == "close":
+                if len(stack) > 1:
+                    stack.pop()
+                continue
+
+            if kind == "open":
+                frame = dict(context, rule=None)
+                if context["skip"]:
+                    pass
+                elif chunk.startswith("@"):
+                    name = chunk.split(None, 1)[0].lower()
+                    if name in _SKIPPED_AT_RULES or name.endswith("keyframes"):
+                        frame["skip"] = True
+                        if name.endswith("keyframes"):
+                            self.keyframes.append(chunk.split(None, 1)[1].strip() if " " in chunk else "")
+                    elif name in _CONDITIONAL_AT_RULES:
+                        if name in ("@media", "@container"):
+                            frame["media"] = context["media"] + [" ".join(chunk.split())]
+                    else:  # @font-face など、宣言を直接持つ at-rule
+                        frame["selectors"] = [name]
+                        frame["rule"] = self._add_rule(frame, line_of(offset), block)
+                else:
+                    frame["selectors"] = _resolve_selectors(context["selectors"], chunk)
+                    # 宣言のないルール（.a {}）も1つのルールとして数える
+                    frame["rule"] = self._add_rule(frame, line_of(offset), block)
+                stack.append(frame)
+                continue
+
+            # decl
+            if context["skip"]:
+                continue
+            if chunk.startswith("@"):
+                self.at_statements.append({"statement": " ".join(chunk.split()), "line": line_of(offset), "block": block})
+                continue
+            name, sep, value = chunk.partition(":")
+            if not sep:
+                continue
+            name = name.strip()
+            value = " ".join(value.split())
+            if name.startswith("$"):
+                self.variables[name] = value
+                continue
+            if not context["selectors"]:
+                continue
+            important = value.lower().endswith("!important")
+            if important:
+                value = value[: -len("!important")].rstrip()
+            declaration = {"property": name.lower() if not name.startswith("--") else name,
+                           "value": value, "important": important, "line": line_of(offset)}
+            rule = context["rule"]
+            if rule is None:  # ルール内の @media などに直接書かれた宣言
+                rule = context["rule"] = self._add_rule(context, declaration["line"], block)
+            rule["declarations"].append(declaration)
+
+    def _add_rule(self, frame: Dict[str, Any], line: int, block: int) -> Dict[str, Any]:
+        rule = {"selectors": frame["selectors"], "media": frame["media"], "declarations": [], "line": line, "block": block}
+        self.rules.append(rule)
+        for selector in rule["selectors"]:
+            self.by_selector.setdefault(selector, []).append(rule)
+        return rule
+
+    # ------------------------------
+    # Queries
+    # ------------------------------
+    @property
+    def rule_count(self) -> int:
+        return len(self.rules)
+
+    def selectors(self) -> List[str]:
+        return list(self.by_selector)
+
+    def declarations(self, properties: Optional[Tuple[str, ...]] = None, selector: Optional[str] = None) -> List[Dict[str, Any]]:
+        """宣言の一覧（セレクタ・メディアクエリ付き）。properties / selector で絞り込む"""
+        rules = self.by_selector.get(selector, []) if selector is not None else self.rules
+        return [
+            {**declaration, "selectors": rule["selectors"], "media": rule["media"]}
+            for rule in rules
+            for declaration in rule["declarations"]
+            if properties is None or declaration["property"] in properties
+        ]
+
+    def resolve_value(self, value: str) -> str:
+        """SCSS 変数を展開した値"""
+        for _ in range(5):  # 変数が変数を参照する場合
+            expanded = re.sub(r'\$[\w-]+', lambda m: self.variables.get(m.group(0), m.group(0)), value)
+            if expanded == value:
+                break
+            value = expanded
+        return value
+
+    def colors(self) -> List[Dict[str, Any]]:
+        """色の使用箇所 [{"value", "property", "selectors", "line"}]"""
+        colors = []
+        for declaration in self.declarations():
+            if declaration["property"] not in COLOR_PROPERTIES and not declaration["property"].startswith("--"):
+                continue
+            for match in _COLOR_VALUE.finditer(self.resolve_value(declaration["value"])):
+                colors.append({
+                    "value": match.group(0).lower(),
+                    "property": declaration["property"],
+                    "selectors": declaration["selectors"],
+                    "line": declaration["line"],
+                })
+        return colors
+
+    def lengths(self, properties: Tuple[str, ...]) -> List[Dict[str, Any]]:
+        """指定したプロパティの長さの値 [{"value", "number", "unit", "property", "selectors", "line"}]"""
+        lengths = []
+        for declaration in self.declarations(properties):
+            for text, number, unit in parse_lengths(self.resolve_value(declaration["value"])):
+                lengths.append({
+                    "value": text,
+                    "number": number,
+                    "unit": unit,
+                    "property": declaration["property"],
+                    "selectors": declaration["selectors"],
+                    "line": declaration["line"],
+                })
+        return lengths
+
+    def media_queries(self) -> List[str]:
+        return list(dict.fromkeys(query for rule in self.rules for query in rule["media"]))
+
+    def summary(self) -> Dict[str, Any]:
+        """LLM 向けの要約"""
+        return {
+            "blocks": self.blocks,
+            "rule_count": self.rule_count,
+            "selectors": self.selectors(),
+            "variables": self.variables,
+            "media_queries": self.media_queries(),
+            "keyframes": self.keyframes,
+            "color_counts": dict(Counter(color["value"] for color in self.colors()).most_common()),
+        }
+
+
+def build_style_index(style: str, lang: str = "css") -> StyleIndex:
+    """スタイルシートの文字列からインデックスを作成"""
+    index = StyleIndex()
+    index.add_stylesheet(style, lang=lang)
+    return index
+
+
+def _attr(attrs: str, name: str) -> Optional[str]:
+    match = re.search(rf'\b{name}\s*=\s*["\']?([\w-]+)', attrs)
+    return match.group(1) if match else None
+
+
+def build_sfc_style_index(content: str) -> StyleIndex:
+    """SFC のすべての <style> ブロックからインデックスを作成（行番号は SFC 内の位置）"""
+    # ui_analysis_tools がこのモジュールを使用するため、使用時に import する
+    from .ui_analysis_tools import parse_sfc_blocks
+
+    index = StyleIndex()
+    for block in parse_sfc_blocks(content):
+        if block["type"] != "style":
+            continue
+        index.add_stylesheet(
+            content[block["content_start"]:block["content_end"]],
+            lang=_attr(block["attrs"], "lang") or "css",
+            scoped=re.search(r'\bscoped\b', block["attrs"]) is not None,
+            start_line=content.count("\n", 0, block["content_start"]) + 1,
+        )
+    return index
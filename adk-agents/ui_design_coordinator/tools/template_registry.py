@@ -0,0 +1,133 @@
+"""
+コンポーネントテンプレートのレジストリ
+
+`component_templates/` 配下の SFC スケルトン（`{name}.vue`）を初回使用時に読み込み、
+セクション（template / script / style）ごとにプレースホルダーを解析した
+コンパイル済みテンプレートとして保持する。
+
+プレースホルダー:
+    {% name %}             customizations["name"] で置換（未指定時は空文字）
+    {% name | 既定値 %}     未指定時は既定値
+
+レンダリング結果は (テンプレート名, customizations のハッシュ) でキャッシュする。
+ファイルが更新された場合は次回使用時に再コンパイルされる。
+"""
+
+import hashlib
+import json
+import re
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .ui_analysis_tools import parse_sfc_blocks
+
+TEMPLATE_DIR = Path(__file__).resolve().parent / "component_templates"
+SECTIONS = ("template", "script", "style")
+
+_PLACEHOLDER = re.compile(r'\{%\s*(\w+)\s*(?:\|\s*(.*?)\s*)?%\}', re.DOTALL)
+
+# コンパイル済みセクション: 文字列（リテラル）または (名前, 既定値) の列
+CompiledSection = List[Union[str, Tuple[str, str]]]
+
+
+def _compile_section(text: str) -> CompiledSection:
+    parts: CompiledSection = []
+    pos = 0
+    for match in _PLACEHOLDER.finditer(text):
+        if match.start() > pos:
+            parts.append(text[pos:match.start()])
+        parts.append((match.group(1), match.group(2) or ""))
+        pos = match.end()
+    if pos < len(text):
+        parts.append(text[pos:])
+    return parts
+
+
+class TemplateRegistry:
+    """SFC スケルトンのレジストリ"""
+
+    def __init__(self, template_dir: Union[str, Path] = TEMPLATE_DIR, cache_size: int = 256):
+        self.template_dir = Path(template_dir)
+        self.cache_size = cache_size
+        # name -> (mtime_ns, {section: CompiledSection})
+        self._compiled: Dict[str, Tuple[int, Dict[str, CompiledSection]]] = {}
+        self._rendered: "OrderedDict[Tuple[str, int, str], Dict[str, str]]" = OrderedDict()
+
+    def names(self) -> List[str]:
+        """利用可能なテンプレート名"""
+        return sorted(p.stem for p in self.template_dir.glob("*.vue"))
+
+    def _load(self, name: str) -> Tuple[int, Dict[str, CompiledSection]]:
+        path = self.template_dir / f"{name}.vue"
+        if not re.fullmatch(r'[\w-]+', name) or not path.is_file():
+            raise KeyError(name)
+
+        mtime_ns = path.stat().st_mtime_ns
+        cached = self._compiled.get(name)
+        if cached and cached[0] == mtime_ns:
+            return cached
+
+        content = path.read_text(encoding="utf-8")
+        sections = {section: [] for section in SECTIONS}
+        for block in parse_sfc_blocks(content):
+            if block["type"] in sections and not sections[block["type"]]:
+                body = content[block["content_start"]:block["content_end"]].strip("\n")
+                sections[block["type"]] = _compile_section(body)
+
+        self._compiled[name] = (mtime_ns, sections)
+        return self._compiled[name]
+
+    def placeholders(self, name: str) -> Dict[str, str]:
+        """テンプレートのプレースホルダー名と既定値"""
+        _, sections = self._load(name)
+        return {
+            part[0]: part[1]
+            for parts in sections.values()
+            for part in parts
+            if isinstance(part, tuple)
+        }
+
+    def render(self, name: str, customizations: Optional[Dict[str, Any]] = None) -> Dict[str, str]:
+        """テンプレートを描画して {template, script, style} を返す
+
+        customizations のうちセクション名のキーはセクション全体を置き換え、
+        それ以外のキーはプレースホルダーを置換する。
+        """
+        customizations = customizations or {}
+        mtime_ns, sections = self._load(name)
+        key = (
+            name,
+            mtime_ns,
+            hashlib.sha256(json.dumps(customizations, sort_keys=True, default=str).encode("utf-8")).hexdigest(),
+        )
+        cached = self._rendered.get(key)
+        if cached is not None:
+            self._rendered.move_to_end(key)
+            return dict(cached)
+
+        rendered = {}
+        for section, parts in sections.items():
+            if section in customizations:
+                rendered[section] = str(customizations[section])
+                continue
+            rendered[section] = "".join(
+                part if isinstance(part, str) else str(customizations.get(part[0], part[1]))
+                for part in parts
+            )
+
+        self._rendered[key] = rendered
+        if len(self._rendered) > self.cache_size:
+            self._rendered.popitem(last=False)
+        return dict(rendered)
+
+
+_template_registry: Optional[TemplateRegistry] = None
+
+
+def get_template_registry() -> TemplateRegistry:
+    """プロセス共有の TemplateRegistry を取得"""
+    global _template_registry
+    if _template_registry is None:
+        _template_registry = TemplateRegistry()
+    return _template_registry
@@ -0,0 +1,140 @@
+"""
+決定的な FunctionTool の結果キャッシュ
+
+同じセッション内で LLM が同じ component_code に対して wcag_compliance_check などを
+繰り返し呼び出すため、(ツール名, 引数のハッシュ) をキーに結果を保持する。
+LRU（件数上限）と TTL で管理し、キャッシュから返した結果には `_cache` を付ける。
+
+ToolContext を受け取るツール（State / Artifact に依存する）はキャッシュしない。
+
+環境変数:
+    UI_TOOL_CACHE       "1" で有効化（create_*_agent の memoize 引数が優先）
+    UI_TOOL_CACHE_SIZE  最大件数（既定 256）
+    UI_TOOL_CACHE_TTL   有効期間（秒、既定 600）
+"""
+
+import copy
+import hashlib
+import inspect
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from google.adk.tools import FunctionTool, ToolContext
+
+
+def _env_enabled() -> bool:
+    return os.environ.get("UI_TOOL_CACHE", "").lower() in ("1", "true", "yes")
+
+
+class ToolResultCache:
+    """TTL 付きの LRU キャッシュ"""
+
+    def __init__(self, max_size: int = 256, ttl: float = 600.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(tool_name: str, args: Dict[str, Any]) -> str:
+        payload = json.dumps(args, sort_keys=True, ensure_ascii=False, default=str)
+        return f"{tool_name}:{hashlib.sha256(payload.encode('utf-8')).hexdigest()}"
+
+    def get(self, key: str) -> Optional[Tuple[float, Any]]:
+        """(保存からの経過秒数, 結果) を返す（なければ None）"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and time.monotonic() - entry[0] > self.ttl:
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return time.monotonic() - entry[0], copy.deepcopy(entry[1])
+
+    def put(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), copy.deepcopy(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"size": len(self._entries), "max_size": self.max_size, "ttl": self.ttl, "hits": self.hits, "misses": self.misses}
+
+
+_tool_cache: Optional[ToolResultCache] = None
+
+
+def get_tool_cache() -> ToolResultCache:
+    """プロセス共有の ToolResultCache を取得"""
+    global _tool_cache
+    if _tool_cache is None:
+        _tool_cache = ToolResultCache(
+            max_size=int(os.environ.get("UI_TOOL_CACHE_SIZE", 256)),
+            ttl=float(os.environ.get("UI_TOOL_CACHE_TTL", 600)),
+        )
+    return _tool_cache
+
+
+def _is_error(result: Any) -> bool:
+    return isinstance(result, dict) and (result.get("status") == "error" or "error" in result)
+
+
+class MemoizedFunctionTool(FunctionTool):
+    """引数が同じ呼び出しの結果をキャッシュから返す FunctionTool"""
+
+    def __init__(self, func: Callable[..., Any], cache: Optional[ToolResultCache] = None):
+        super().__init__(func=func)
+        self.cache = cache or get_tool_cache()
+
+    async def run_async(self, *, args: Dict[str, Any], tool_context: ToolContext) -> Any:
+        key = self.cache.make_key(self.name, args)
+        cached = self.cache.get(key)
+        if cached is not None:
+            age, result = cached
+            metadata = {"hit": True, "age_seconds": round(age, 3)}
+            if isinstance(result, dict):
+                return {**result, "_cache": metadata}
+            return {"result": result, "_cache": metadata}
+
+        result = await super().run_async(args=args, tool_context=tool_context)
+        # エラー（引数の検証エラーを含む）はキャッシュしない
+        if not _is_error(result):
+            self.cache.put(key, result)
+        return result
+
+
+def _takes_tool_context(func: Callable[..., Any]) -> bool:
+    return any(
+        name == "tool_context" or param.annotation is ToolContext
+        for name, param in inspect.signature(func).parameters.items()
+    )
+
+
+def make_function_tool(func: Callable[..., Any], memoize: Optional[bool] = None) -> FunctionTool:
+    """FunctionTool を作成（memoize が有効かつ ToolContext を使わない関数はキャッシュ付き）
+
+    Args:
+        func: ツール関数
+        memoize: キャッシュの有効・無効（None の場合は環境変数 UI_TOOL_CACHE に従う）
+    """
+    if memoize is None:
+        memoize = _env_enabled()
+    if memoize and not _takes_tool_context(func):
+        return MemoizedFunctionTool(func=func)
+    return FunctionTool(func=func)
@@ -0,0 +1,158 @@
+"""
+トレースのフレームグラフ風サマリー
+
+`UI_TRACE=1` で記録したスパン（JSONL / OTLP ファイル）を読み込み、
+1トレース（セッション）分の agent → tool → sub-agent の入れ子を所要時間付きで表示する。
+
+使い方:
+    cd adk-agents
+    python -m ui_design_coordinator.tools.trace_report --list
+    python -m ui_design_coordinator.tools.trace_report                  # 最新のトレース
+    python -m ui_design_coordinator.tools.trace_report --session <id> --min-ms 5
+"""
+
+import argparse
+import json
+import os
+import sys
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..tracing import DEFAULT_TRACE_FILE, ENV_FILE
+
+_OTLP_VALUE_KEYS = ("stringValue", "intValue", "doubleValue", "boolValue")
+
+
+def _from_otlp(record: Dict[str, Any]) -> Iterable[Dict[str, Any]]:
+    for resource_spans in record.get("resourceSpans", []):
+        for scope_spans in resource_spans.get("scopeSpans", []):
+            for span in scope_spans.get("spans", []):
+                attributes = {}
+                for attr in span.get("attributes", []):
+                    value = next((attr["value"][k] for k in _OTLP_VALUE_KEYS if k in attr["value"]), None)
+                    attributes[attr["key"]] = int(value) if "intValue" in attr["value"] else value
+                start_ns = int(span["startTimeUnixNano"])
+                yield {
+                    "trace_id": span["traceId"],
+                    "span_id": span["spanId"],
+                    "parent_id": span.get("parentSpanId"),
+                    "name": span["name"],
+                    "kind": attributes.pop("kind", ""),
+                    "session_id": attributes.pop("session_id", None),
+                    "start_time": start_ns / 1e9,
+                    "duration_ms": (int(span["endTimeUnixNano"]) - start_ns) / 1e6,
+                    "attributes": attributes,
+                }
+
+
+def load_spans(path: str) -> List[Dict[str, Any]]:
+    """JSONL / OTLP 形式のトレースファイルからスパンを読み込む"""
+    spans = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if "resourceSpans" in record:
+                spans.extend(_from_otlp(record))
+            else:
+                spans.append(record)
+    return spans
+
+
+def summarize_traces(spans: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """トレースごとの概要（開始時刻順）"""
+    traces: Dict[str, Dict[str, Any]] = {}
+    for span in spans:
+        trace = traces.setdefault(span["trace_id"], {
+            "trace_id": span["trace_id"], "session_id": None, "root": None,
+            "start_time": span["start_time"], "duration_ms": 0.0, "spans": 0,
+        })
+        trace["spans"] += 1
+        trace["start_time"] = min(trace["start_time"], span["start_time"])
+        if not span["parent_id"]:
+            trace.update(session_id=span.get("session_id"), root=span["name"])
+            trace["duration_ms"] += span["duration_ms"]
+    return sorted(traces.values(), key=lambda t: t["start_time"])
+
+
+def render_flame(spans: List[Dict[str, Any]], width: int = 40, min_ms: float = 0.0) -> str:
+    """1トレース分のスパンを入れ子の棒グラフで表示し、名前ごとの自己時間を集計する"""
+    children: Dict[Optional[str], List[Dict[str, Any]]] = {}
+    span_ids = {span["span_id"] for span in spans}
+    for span in spans:
+        parent = span["parent_id"] if span["parent_id"] in span_ids else None
+        children.setdefault(parent, []).append(span)
+    for siblings in children.values():
+        siblings.sort(key=lambda s: s["start_time"])
+
+    roots = children.get(None, [])
+    total = sum(s["duration_ms"] for s in roots) or 1.0
+    self_times: Dict[str, List[float]] = {}
+    lines = []
+
+    def visit(span: Dict[str, Any], depth: int) -> None:
+        kids = children.get(span["span_id"], [])
+        self_ms = max(span["duration_ms"] - sum(k["duration_ms"] for k in kids), 0.0)
+        entry = self_times.setdefault(span["name"], [0.0, 0])
+        entry[0] += self_ms
+        entry[1] += 1
+        if span["duration_ms"] >= min_ms:
+            attrs = span["attributes"]
+            sizes = " ".join(
+                f"{key}={attrs[key]}" for key in ("args_bytes", "result_bytes", "prompt_tokens", "output_tokens")
+                if attrs.get(key) is not None
+            )
+            bar = "█" * max(1, round(span["duration_ms"] / total * width))
+            label = ("  " * depth + span["name"])[:48]
+            lines.append(f"{label:<48} {span['duration_ms']:>10.1f}ms {bar:<{width}} {span['duration_ms'] / total:>6.1%}  {sizes}".rstrip())
+        for kid in kids:
+            visit(kid, depth + 1)
+
+    for root in roots:
+        visit(root, 0)
+
+    lines.append("")
+    lines.append(f"{'self time by span':<48} {'total':>12} {'calls':>6}")
+    for name, (self_ms, calls) in sorted(self_times.items(), key=lambda item: item[1][0], reverse=True):
+        lines.append(f"{name[:48]:<48} {self_ms:>10.1f}ms {calls:>6}")
+    return "\n".join(lines)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Render a flame-style summary of ui_design_coordinator traces")
+    parser.add_argument("--file", default=os.environ.get(ENV_FILE) or str(DEFAULT_TRACE_FILE), help="トレースファイル")
+    parser.add_argument("--list", action="store_true", help="トレースの一覧を表示")
+    parser.add_argument("--trace", help="表示するトレース ID（省略時は最新）")
+    parser.add_argument("--session", help="表示するセッション ID（ルートエージェントのセッション）")
+    parser.add_argument("--min-ms", type=float, default=0.0, help="これより短いスパンは表示しない（集計には含める）")
+    parser.add_argument("--width", type=int, default=40)
+    args = parser.parse_args(argv)
+
+    spans = load_spans(args.file)
+    traces = summarize_traces(spans)
+    if not traces:
+        print("No spans recorded", file=sys.stderr)
+        sys.exit(1)
+
+    if args.list:
+        for trace in traces:
+            print(f"{trace['trace_id']}  session={trace['session_id']}  {trace['root']}  {trace['duration_ms']:.1f}ms  spans={trace['spans']}")
+        return
+
+    if args.trace:
+        trace_id = args.trace
+    elif args.session:
+        trace_id = next((t["trace_id"] for t in reversed(traces) if t["session_id"] == args.session), None)
+    else:
+        trace_id = traces[-1]["trace_id"]
+    trace_spans = [span for span in spans if span["trace_id"] == trace_id]
+    if not trace_spans:
+        print(f"Trace not found: {args.trace or args.session}", file=sys.stderr)
+        sys.exit(1)
+
+    print(f"trace {trace_id}")
+    print(render_flame(trace_spans, width=args.width, min_ms=args.min_ms))
+
+
+if __name__ == "__main__":
+    main()
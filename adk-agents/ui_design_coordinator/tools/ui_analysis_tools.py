@@ -1,25 +1,45 @@
 import re
 import json
-from typing import Dict, List, Any
+from collections import Counter
+from typing import Dict, List, Any, Optional
 from pathlib import Path
 
+from .overlay_fs import read_text
+from .script_index import (
+    COMPUTED_APIS,
+    REACTIVE_APIS,
+    WATCH_APIS,
+    ScriptIndex,
+    build_script_index,
+    build_sfc_script_index,
+)
+from .style_index import (
+    SPACING_PROPERTIES,
+    TYPOGRAPHY_PROPERTIES,
+    StyleIndex,
+    build_sfc_style_index,
+    build_style_index,
+    parse_lengths,
+)
+
 def analyze_vue_component(file_path: str) -> Dict[str, Any]:
-    """Vue.jsコンポーネントを詳細分析"""
+    """Vue.jsコンポーネントを詳細分析（仮想編集セッション中は未確定の内容を分析する）"""
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = read_text(file_path)
         
         # テンプレート、スクリプト、スタイルを抽出
         template = extract_template_section(content)
         script = extract_script_section(content)
         style = extract_style_section(content)
+        style_index = build_sfc_style_index(content)
+        script_index = build_sfc_script_index(content)
         
         return {
             "status": "success",
             "file_path": file_path,
             "template_analysis": analyze_template(template),
-            "script_analysis": analyze_script(script),
-            "style_analysis": analyze_style(style),
+            "script_analysis": analyze_script(script, script_index),
+            "style_analysis": analyze_style(style, style_index),
             "ui_metrics": calculate_ui_metrics(template, style),
             "accessibility_score": check_accessibility(template),
             "vuetify_usage": detect_vuetify_components(template)
@@ -27,20 +47,100 @@ def analyze_vue_component(file_path: str) -> Dict[str, Any]:
     except Exception as e:
         return {"status": "error", "message": str(e)}
 
+_SFC_BLOCK_OPEN = re.compile(
+    r'<!--.*?-->|<(template|script|style)\b([^>]*)>', re.DOTALL | re.IGNORECASE
+)
+_TEMPLATE_TAG = re.compile(
+    r'<!--.*?-->|</template\s*>|<template\b[^>]*?(/)?>', re.DOTALL | re.IGNORECASE
+)
+
+def parse_sfc_blocks(content: str) -> List[Dict[str, Any]]:
+    """SFC のトップレベルブロック（template / script / style）を1パスで解析
+
+    ネストした <template> とトップレベルのコメントを考慮する。
+
+    Returns:
+        [{"type", "attrs", "start", "content_start", "content_end", "end"}, ...]
+        オフセットは content 内の位置（start/end は開始タグ先頭・終了タグ末尾）
+    """
+    blocks = []
+    pos = 0
+    while True:
+        match = _SFC_BLOCK_OPEN.search(content, pos)
+        if not match:
+            break
+        if match.group(1) is None:  # トップレベルのコメント
+            pos = match.end()
+            continue
+        
+        block_type = match.group(1).lower()
+        attrs = match.group(2)
+        content_start = match.end()
+        
+        if attrs.rstrip().endswith('/'):  # 自己終了タグ
+            blocks.append({
+                "type": block_type,
+                "attrs": attrs.rstrip()[:-1].strip(),
+                "start": match.start(),
+                "content_start": content_start,
+                "content_end": content_start,
+                "end": content_start
+            })
+            pos = content_start
+            continue
+        
+        close = None
+        if block_type == "template":
+            depth = 1
+            for tag in _TEMPLATE_TAG.finditer(content, content_start):
+                text = tag.group(0)
+                if text.startswith('<!--'):
+                    continue
+                if text.startswith('</'):
+                    depth -= 1
+                    if depth == 0:
+                        close = tag
+                        break
+                elif not tag.group(1):
+                    depth += 1
+        else:
+            close = re.compile(rf'</{block_type}\s*>', re.IGNORECASE).search(content, content_start)
+        
+        if close is None:  # 閉じられていないブロック
+            break
+        
+        blocks.append({
+            "type": block_type,
+            "attrs": attrs.strip(),
+            "start": match.start(),
+            "content_start": content_start,
+            "content_end": close.start(),
+            "end": close.end()
+        })
+        pos = close.end()
+    
+    return blocks
+
 def extract_template_section(content: str) -> str:
     """<template>セクションを抽出"""
     match = re.search(r'<template[^>]*>(.*?)</template>', content, re.DOTALL)
     return match.group(1).strip() if match else ""
 
 def extract_script_section(content: str) -> str:
-    """<script>セクションを抽出"""
-    match = re.search(r'<script[^>]*>(.*?)</script>', content, re.DOTALL)
-    return match.group(1).strip() if match else ""
+    """<script>セクションを抽出（<script> と <script setup> がある場合は両方を連結）"""
+    return "\n".join(
+        content[block["content_start"]:block["content_end"]].strip()
+        for block in parse_sfc_blocks(content)
+        if block["type"] == "script"
+    ).strip()
 
 def extract_style_section(content: str) -> str:
-    """<style>セクションを抽出"""
-    match = re.search(r'<style[^>]*>(.*?)</style>', content, re.DOTALL)
-    return match.group(1).strip() if match else ""
+    """<style>セクションを抽出（複数ある場合はすべてを連結）"""
+    return "\n".join(
+        content[block["content_start"]:block["content_end"]].strip()
+        for block in parse_sfc_blocks(content)
+        if block["type"] == "style"
+    ).strip()
 
 def analyze_template(template: str) -> Dict[str, Any]:
     """テンプレートの構造分析"""
@@ -52,23 +152,43 @@ def analyze_template(template: str) -> Dict[str, Any]:
         "nesting_depth": calculate_nesting_depth(template)
     }
 
-def analyze_script(script: str) -> Dict[str, Any]:
-    """スクリプトの分析"""
+def analyze_script(script: str, index: Optional[ScriptIndex] = None) -> Dict[str, Any]:
+    """スクリプトの分析
+
+    Args:
+        script: スクリプトの文字列
+        index: 作成済みのスクリプトインデックス（SFC から作成した場合は <script setup> を判定できる）
+    """
+    index = index or build_script_index(script)
     return {
         "line_count": len(script.split('\n')),
-        "has_composition_api": 'setup' in script,
-        "has_props": 'defineProps' in script,
-        "has_emits": 'defineEmits' in script,
-        "reactive_variables": count_reactive_variables(script)
+        "has_composition_api": index.uses_composition_api,
+        "has_props": bool(index.props) or bool(index.calls_of(("defineProps",))),
+        "has_emits": bool(index.emits) or bool(index.calls_of(("defineEmits",))),
+        "reactive_variables": len(index.calls_of(REACTIVE_APIS)),
+        "computed_properties": len(index.calls_of(COMPUTED_APIS)) + len(index.options.get("computed", [])),
+        "watchers": len(index.calls_of(WATCH_APIS)) + len(index.options.get("watch", [])),
+        "imports": [i["source"] for i in index.imports],
+        "props": index.props,
+        "emits": index.emits,
+        "top_level_declarations": len(index.declarations)
     }
 
-def analyze_style(style: str) -> Dict[str, Any]:
-    """スタイルの分析"""
+def analyze_style(style: str, index: Optional[StyleIndex] = None) -> Dict[str, Any]:
+    """スタイルの分析
+
+    Args:
+        style: スタイルシートの文字列
+        index: 作成済みのスタイルインデックス（SFC から作成した場合は scoped を判定できる）
+    """
+    index = index or build_style_index(style)
     return {
         "line_count": len(style.split('\n')),
-        "has_scoped": 'scoped' in style,
-        "css_rules": count_css_rules(style),
-        "color_usage": extract_colors(style)
+        "has_scoped": any(block["scoped"] for block in index.blocks) or 'scoped' in style,
+        "css_rules": index.rule_count,
+        "color_usage": [color["value"] for color in index.colors()],
+        "media_queries": index.media_queries(),
+        "variables": len(index.variables)
     }
 
 def calculate_ui_metrics(template: str, style: str) -> Dict[str, Any]:
@@ -100,13 +220,24 @@ def check_accessibility(template: str) -> Dict[str, Any]:
     }
 
 def detect_vuetify_components(template: str) -> Dict[str, Any]:
-    """Vuetifyコンポーネントの使用状況を検出"""
-    vuetify_components = []
-    
-    # v-で始まるコンポーネントを検出
-    v_components = re.findall(r'<(v-[a-zA-Z-]+)', template)
-    vuetify_components.extend(v_components)
-    
+    """Vuetifyコンポーネントの使用状況を検出（Vuetify のカタログがあれば未定義のコンポーネントも検出する）"""
+    # vuetify_catalog は parse_sfc_blocks のためにこのモジュールを import するので遅延 import
+    from .vuetify_catalog import get_vuetify_catalog
+
+    catalog = get_vuetify_catalog()
+    if catalog.available:
+        result = catalog.validate_template(template)
+        unknown = sorted({issue["tag"] for issue in result["issues"] if issue["rule"] == "vuetify.unknown-component"})
+        return {
+            "components_used": list(result["components"]),
+            "component_count": sum(entry["count"] for entry in result["components"].values()),
+            "is_vuetify_project": bool(result["components"] or unknown),
+            "imports": {tag: entry["import"] for tag, entry in result["components"].items()},
+            "unknown_components": unknown,
+        }
+
+    # カタログがない場合は v-で始まるタグを検出するだけ
+    vuetify_components = re.findall(r'<(v-[a-zA-Z-]+)', template)
     return {
         "components_used": list(set(vuetify_components)),
         "component_count": len(vuetify_components),
@@ -114,21 +245,23 @@ def detect_vuetify_components(template: str) -> Dict[str, Any]:
     }
 
 def evaluate_ui_design_quality(template: str, style: str) -> Dict[str, Any]:
-    """UI設計品質の評価"""
+    """UI設計品質の評価（スタイルの分析はすべて同じインデックスを参照する）"""
+    index = build_style_index(style)
     return {
         "design_consistency": check_design_consistency(template, style),
-        "color_scheme_analysis": analyze_color_scheme(style),
-        "typography_score": evaluate_typography(style),
-        "spacing_consistency": check_spacing_consistency(style),
-        "responsive_design": check_responsive_design(style)
+        "color_scheme_analysis": analyze_color_scheme(style, index),
+        "typography_score": evaluate_typography(style, index),
+        "spacing_consistency": check_spacing_consistency(style, index),
+        "responsive_design": check_responsive_design(style, index)
     }
 
 def analyze_performance_metrics(template: str, script: str) -> Dict[str, Any]:
     """パフォーマンス指標の分析"""
+    index = build_script_index(script)
     return {
         "dom_complexity": calculate_dom_complexity(template),
         "script_size": len(script),
-        "potential_bottlenecks": identify_performance_issues(script),
+        "potential_bottlenecks": identify_performance_issues(script, index),
         "optimization_suggestions": generate_performance_tips(template, script)
     }
 
@@ -151,17 +284,16 @@ def calculate_nesting_depth(template: str) -> int:
     return template.count('<div') + template.count('<v-')
 
 def count_reactive_variables(script: str) -> int:
-    """リアクティブ変数の数を数える"""
-    return len(re.findall(r'ref\(|reactive\(', script))
+    """リアクティブ変数の数を数える（コメント・文字列内と他の識別子は除く）"""
+    return len(build_script_index(script).calls_of(REACTIVE_APIS))
 
 def count_css_rules(style: str) -> int:
-    """CSSルールの数を数える"""
-    return len(re.findall(r'\{[^}]*\}', style))
+    """CSSルールの数を数える（SCSS のネストしたルールと宣言のないルールを含む）"""
+    return build_style_index(style).rule_count
 
 def extract_colors(style: str) -> List[str]:
-    """色情報を抽出"""
-    colors = re.findall(r'color:\s*([^;]+)', style)
-    return colors
+    """色情報を抽出（color 以外の background / border などを含む）"""
+    return [color["value"] for color in build_style_index(style).colors()]
 
 def calculate_complexity(template: str) -> int:
     """複雑度を計算"""
@@ -190,31 +322,117 @@ def check_design_consistency(template: str, style: str) -> Dict[str, Any]:
     """デザイン一貫性のチェック"""
     return {"score": 85, "issues": []}
 
-def analyze_color_scheme(style: str) -> Dict[str, Any]:
-    """カラースキームの分析"""
-    return {"primary_colors": ["#2E7D32"], "secondary_colors": [], "accessibility_ok": True}
+_NAMED_COLORS = {"white": "#ffffff", "black": "#000000"}
+
+def _hex_to_rgb(value: str) -> Optional[tuple]:
+    value = _NAMED_COLORS.get(value, value)
+    if not re.fullmatch(r'#(?:[0-9a-f]{3,4}|[0-9a-f]{6}|[0-9a-f]{8})', value):
+        return None
+    digits = value[1:]
+    if len(digits) in (3, 4):
+        digits = "".join(c * 2 for c in digits[:3])
+    return tuple(int(digits[i:i + 2], 16) for i in (0, 2, 4))
+
+def _contrast_ratio(foreground: tuple, background: tuple) -> float:
+    """WCAG 2.1 のコントラスト比"""
+    def luminance(rgb: tuple) -> float:
+        channels = [c / 255 for c in rgb]
+        channels = [c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4 for c in channels]
+        return 0.2126 * channels[0] + 0.7152 * channels[1] + 0.0722 * channels[2]
+    lighter, darker = sorted((luminance(foreground), luminance(background)), reverse=True)
+    return (lighter + 0.05) / (darker + 0.05)
+
+def analyze_color_scheme(style: str, index: Optional[StyleIndex] = None) -> Dict[str, Any]:
+    """カラースキームの分析（使用頻度順の色と、同じルール内の文字色・背景色のコントラスト）"""
+    index = index or build_style_index(style)
+    counts = Counter(c["value"] for c in index.colors() if c["value"] not in ("transparent", "currentcolor"))
+    ordered = [value for value, _ in counts.most_common()]
+
+    contrast_issues = []
+    for rule in index.rules:
+        values = {d["property"]: index.resolve_value(d["value"]).lower() for d in rule["declarations"]}
+        foreground = _hex_to_rgb(values.get("color", ""))
+        background = _hex_to_rgb(values.get("background-color", values.get("background", "")))
+        if foreground and background:
+            ratio = _contrast_ratio(foreground, background)
+            if ratio < 4.5:
+                contrast_issues.append({
+                    "selectors": rule["selectors"],
+                    "line": rule["line"],
+                    "ratio": round(ratio, 2)
+                })
+
+    return {
+        "primary_colors": ordered[:3],
+        "secondary_colors": ordered[3:],
+        "color_count": len(counts),
+        "contrast_issues": contrast_issues,
+        "accessibility_ok": not contrast_issues
+    }
 
-def evaluate_typography(style: str) -> int:
-    """タイポグラフィスコア"""
-    return 80
+def evaluate_typography(style: str, index: Optional[StyleIndex] = None) -> int:
+    """タイポグラフィスコア（フォントサイズの種類・単位・最小サイズ）"""
+    index = index or build_style_index(style)
+    if not index.declarations(TYPOGRAPHY_PROPERTIES):
+        return 80  # Vuetify のタイポグラフィをそのまま使用
+    sizes = index.lengths(("font-size",))
+    score = 100
+    if len({size["value"] for size in sizes}) > 4:
+        score -= 10
+    score -= min(20, 5 * sum(1 for size in sizes if size["unit"] == "px"))
+    score -= 10 * sum(1 for size in sizes if size["unit"] == "px" and size["number"] < 12)
+    return max(0, score)
 
-def check_spacing_consistency(style: str) -> Dict[str, Any]:
-    """スペーシング一貫性のチェック"""
-    return {"score": 90, "issues": []}
+def check_spacing_consistency(style: str, index: Optional[StyleIndex] = None) -> Dict[str, Any]:
+    """スペーシング一貫性のチェック（px 指定が 4px グリッドに沿っているか）"""
+    index = index or build_style_index(style)
+    lengths = index.lengths(SPACING_PROPERTIES)
+    off_grid = {}
+    for length in lengths:
+        if length["unit"] == "px" and length["number"] % 4:
+            off_grid.setdefault(length["value"], length)
+    issues = [
+        f"{length['property']}: {value}（{', '.join(length['selectors'])}、{length['line']}行目）は 4px グリッドに沿っていません"
+        for value, length in off_grid.items()
+    ]
+    return {
+        "score": max(0, 100 - 10 * len(off_grid)),
+        "issues": issues,
+        "values": sorted({length["value"] for length in lengths})
+    }
 
-def check_responsive_design(style: str) -> Dict[str, Any]:
-    """レスポンシブデザインのチェック"""
-    return {"has_media_queries": "@media" in style, "score": 85}
+def check_responsive_design(style: str, index: Optional[StyleIndex] = None) -> Dict[str, Any]:
+    """レスポンシブデザインのチェック（メディアクエリと、メディアクエリ外の大きな固定幅）"""
+    index = index or build_style_index(style)
+    media_queries = index.media_queries()
+    fixed_widths = [
+        {"selectors": d["selectors"], "property": d["property"], "value": d["value"], "line": d["line"]}
+        for d in index.declarations(("width", "min-width"))
+        if not d["media"] and any(
+            unit == "px" and number > 600 for _, number, unit in parse_lengths(index.resolve_value(d["value"]))
+        )
+    ]
+    return {
+        "has_media_queries": bool(media_queries),
+        "media_queries": media_queries,
+        "fixed_widths": fixed_widths,
+        "score": max(0, (85 if media_queries else 70) - 5 * len(fixed_widths))
+    }
 
 def calculate_dom_complexity(template: str) -> int:
     """DOM複雑度の計算"""
     return len(re.findall(r'<[^/]', template))
 
-def identify_performance_issues(script: str) -> List[str]:
+def identify_performance_issues(script: str, index: Optional[ScriptIndex] = None) -> List[str]:
     """パフォーマンス問題を特定"""
+    index = index or build_script_index(script)
     issues = []
-    if 'watch' in script:
-        issues.append("watch使用による潜在的なパフォーマンス問題")
+    watchers = index.calls_of(WATCH_APIS)
+    for watcher in watchers:
+        if watcher["options"].get("deep"):
+            issues.append(f"{watcher['line']}行目: deep: true の watch はオブジェクト全体を走査するため負荷が高くなります")
+    if len(watchers) + len(index.options.get("watch", [])) > 5:
+        issues.append("watch が多すぎます。computed で置き換えられないか検討してください")
     return issues
 
 def generate_performance_tips(template: str, script: str) -> List[str]:
@@ -1,13 +1,101 @@
 import os
 import json
 import re
-from typing import Dict, List, Any
+import shutil
+import tempfile
+from contextlib import contextmanager
+from functools import lru_cache, wraps
+from typing import Dict, List, Any, Optional
 from pathlib import Path
 
-def generate_vue_component(component_name: str, template: str, script: str, style: str) -> Dict[str, Any]:
-    """新しいVue.jsコンポーネントを生成"""
+from google.adk.tools import ToolContext
+
+from .backup_store import BackupStore
+from .overlay_fs import begin_overlay, end_overlay, get_active_overlay, overlay_scope, path_exists, read_text
+from .project_index import PROJECT_ROOT, get_project_index
+from .script_index import build_script_index
+from .template_registry import get_template_registry
+from .ui_analysis_tools import parse_sfc_blocks
+
+# modify_existing_component のバックアップ保存先
+_backup_store = BackupStore()
+
+def _new_file_mode() -> int:
+    """open() で新規作成した場合と同じパーミッション（mkstemp は 0600 で作成する）"""
+    umask = os.umask(0)
+    os.umask(umask)
+    return 0o666 & ~umask
+
+def write_files_atomically(files: Dict[str, str]) -> List[str]:
+    """複数ファイルを一括でアトミックに書き込む
+
+    全ファイルをまず同じディレクトリ内の一時ファイルに書き出し（fsync 済み）、
+    すべての書き出しが成功した後にまとめて `os.replace` でリネームする。
+    途中で失敗した場合は一時ファイルを削除し、既存ファイルには一切触れない。
+    リネームは連続して行われるため、Vite の監視による再ビルドも1回にまとまる。
+
+    Args:
+        files: {ファイルパス: 内容}
+
+    Returns:
+        書き込んだファイルパスのリスト
+    """
+    staged = []
     try:
-        component_content = f"""<template>
+        # ステージング: 対象と同じディレクトリに一時ファイルを作成
+        for file_path, content in files.items():
+            directory = os.path.dirname(file_path) or "."
+            os.makedirs(directory, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(
+                dir=directory, prefix=f".{os.path.basename(file_path)}.", suffix=".tmp"
+            )
+            staged.append((temp_path, file_path))
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(content)
+                f.flush()
+                os.fsync(f.fileno())
+    except BaseException:
+        for temp_path, _ in staged:
+            if os.path.exists(temp_path):
+                os.unlink(temp_path)
+        raise
+
+    # コミット: 一括リネーム
+    new_file_mode = _new_file_mode()
+    for temp_path, file_path in staged:
+        if os.path.exists(file_path):
+            shutil.copymode(file_path, temp_path)
+        else:
+            os.chmod(temp_path, new_file_mode)
+        os.replace(temp_path, file_path)
+        get_project_index().invalidate(file_path)
+
+    return list(files.keys())
+
+def _session_scoped(func):
+    """tool_context のセッションの仮想編集セッション（オーバーレイ）で実行する
+
+    ADK は tool_context 引数を宣言したツールに ToolContext を渡す。
+    tool_context なしで呼び出した場合はプロセス共通のスコープになる。
+    """
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        with overlay_scope(kwargs.get("tool_context")):
+            return func(*args, **kwargs)
+    return wrapper
+
+def _write_files(files: Dict[str, str]) -> List[str]:
+    """ファイルを書き込む（仮想編集セッション中はオーバーレイに保持）"""
+    overlay = get_active_overlay()
+    if overlay is None:
+        return write_files_atomically(files)
+    for file_path, content in files.items():
+        overlay.write(file_path, content)
+    return list(files.keys())
+
+def build_component_content(template: str, script: str, style: str) -> str:
+    """テンプレート・スクリプト・スタイルから .vue ファイルの内容を組み立てる"""
+    return f"""<template>
 {template}
 </template>
 
@@ -19,13 +107,22 @@ def generate_vue_component(component_name: str, template: str, script: str, styl
 {style}
 </style>
 """
+
+@_session_scoped
+def generate_vue_component(
+    component_name: str,
+    template: str,
+    script: str,
+    style: str,
+    tool_context: Optional[ToolContext] = None
+) -> Dict[str, Any]:
+    """新しいVue.jsコンポーネントを生成"""
+    try:
+        component_content = build_component_content(template, script, style)
         
         # src/components/に保存
         file_path = f"../src/components/{component_name}.vue"
-        os.makedirs(os.path.dirname(file_path), exist_ok=True)
-        
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(component_content)
+        _write_files({file_path: component_content})
         
         return {
             "status": "success",
@@ -36,117 +133,380 @@ def generate_vue_component(component_name: str, template: str, script: str, styl
     except Exception as e:
         return {"status": "error", "message": str(e)}
 
-def modify_existing_component(file_path: str, modifications: Dict[str, str]) -> Dict[str, Any]:
-    """既存のVue.jsコンポーネントを修正"""
+@_session_scoped
+def generate_vue_components(components: List[Dict[str, str]], tool_context: Optional[ToolContext] = None) -> Dict[str, Any]:
+    """複数のVue.jsコンポーネントを一括生成
+
+    Args:
+        components: [{"component_name", "template", "script", "style"}, ...]
+    """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        files = {
+            f"../src/components/{c['component_name']}.vue": build_component_content(
+                c.get("template", ""), c.get("script", ""), c.get("style", "")
+            )
+            for c in components
+        }
+        written = _write_files(files)
         
-        # バックアップ作成
-        backup_path = f"{file_path}.backup"
-        with open(backup_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        return {
+            "status": "success",
+            "file_paths": written,
+            "component_names": [c["component_name"] for c in components],
+            "message": f"{len(written)} 個のコンポーネントを生成しました"
+        }
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
+
+@_session_scoped
+def modify_existing_component(
+    file_path: str,
+    modifications: Dict[str, str],
+    tool_context: Optional[ToolContext] = None
+) -> Dict[str, Any]:
+    """既存のVue.jsコンポーネントを修正
+
+    修正前後の内容はバックアップストア（src/ の外）にリビジョンとして保存される。
+    仮想編集セッション中は修正をメモリに保持し、バックアップは確定時に作成する。
+    """
+    try:
+        content = read_text(file_path)
         
         # 修正を適用
         modified_content = apply_modifications(content, modifications)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            f.write(modified_content)
+        staged = get_active_overlay() is not None
+        backup_revision = None
+        if staged:
+            _write_files({file_path: modified_content})
+        else:
+            # バックアップ作成（同一内容は重複排除される）
+            backup_revision = _backup_store.save(file_path, content)["revision"]
+            write_files_atomically({file_path: modified_content})
+            _backup_store.save(file_path, modified_content)
         
         return {
             "status": "success",
             "file_path": file_path,
-            "backup_path": backup_path,
+            "backup_revision": backup_revision,
+            "staged": staged,
             "modifications_applied": list(modifications.keys()),
             "message": "コンポーネントを修正しました"
         }
     except Exception as e:
         return {"status": "error", "message": str(e)}
 
+def list_component_backups(file_path: str) -> Dict[str, Any]:
+    """コンポーネントのバックアップリビジョン一覧を取得"""
+    try:
+        return {
+            "status": "success",
+            "file_path": file_path,
+            "revisions": _backup_store.list_revisions(file_path)
+        }
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
+
+@_session_scoped
+def restore_component_backup(file_path: str, revision: int, tool_context: Optional[ToolContext] = None) -> Dict[str, Any]:
+    """コンポーネントを指定リビジョンの内容に戻す"""
+    try:
+        content = _backup_store.load(file_path, revision)
+        _write_files({file_path: content})
+        if get_active_overlay() is None:
+            # 復元後の状態も履歴に残す（内容が同じなら重複排除される）
+            _backup_store.save(file_path, content)
+        
+        return {
+            "status": "success",
+            "file_path": file_path,
+            "restored_revision": revision,
+            "message": f"リビジョン {revision} に復元しました"
+        }
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
+
+@_session_scoped
+def begin_virtual_edits(tool_context: Optional[ToolContext] = None) -> Dict[str, Any]:
+    """仮想編集セッションを開始
+
+    以降の generate_vue_component / modify_existing_component / update_app_vue_imports
+    などの書き込みはメモリ上に保持され、読み込みもそこから行われる。
+    commit_virtual_edits で一括書き込み、discard_virtual_edits で破棄する。
+    仮想編集セッションは ADK のセッションごとに独立している。
+    """
+    overlay = begin_overlay()
+    return {
+        "status": "success",
+        "pending_files": sorted(overlay.pending()),
+        "message": "仮想編集セッションを開始しました"
+    }
+
+@_session_scoped
+def commit_virtual_edits(tool_context: Optional[ToolContext] = None) -> Dict[str, Any]:
+    """仮想編集セッションの変更をディスクに一括で書き込む"""
+    overlay = get_active_overlay()
+    if overlay is None:
+        return {"status": "error", "message": "仮想編集セッションが開始されていません"}
+    
+    try:
+        files = overlay.pending()
+        # 既存ファイルは書き込み前の内容をバックアップ
+        existing = [p for p in files if os.path.exists(p)]
+        for file_path in existing:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                _backup_store.save(file_path, f.read())
+        
+        written = write_files_atomically(files)
+        for file_path in existing:
+            _backup_store.save(file_path, files[file_path])
+        
+        end_overlay()
+        return {
+            "status": "success",
+            "files_written": written,
+            "message": f"{len(written)} ファイルを書き込みました"
+        }
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
+
+@_session_scoped
+def discard_virtual_edits(tool_context: Optional[ToolContext] = None) -> Dict[str, Any]:
+    """仮想編集セッションの変更を破棄"""
+    overlay = end_overlay()
+    discarded = sorted(overlay.pending()) if overlay is not None else []
+    return {
+        "status": "success",
+        "files_discarded": discarded,
+        "message": f"{len(discarded)} ファイルの変更を破棄しました"
+    }
+
+@contextmanager
+def virtual_edits():
+    """仮想編集セッションのコンテキストマネージャ（正常終了で確定、例外で破棄）"""
+    overlay = begin_overlay()
+    try:
+        yield overlay
+    except BaseException:
+        discard_virtual_edits()
+        raise
+    result = commit_virtual_edits()
+    if result["status"] != "success":
+        raise RuntimeError(result["message"])
+
+# セクションが存在しない場合に追加するブロックの属性
+_SECTION_DEFAULT_ATTRS = {"template": "", "script": "setup", "style": "scoped"}
+
+def _find_section_block(blocks: List[Dict[str, Any]], section: str) -> Optional[Dict[str, Any]]:
+    """修正対象のブロックを選択（script は <script setup> を優先）"""
+    candidates = [b for b in blocks if b["type"] == section]
+    if section == "script":
+        setup_blocks = [b for b in candidates if re.search(r'\bsetup\b', b["attrs"])]
+        candidates = setup_blocks or candidates
+    return candidates[0] if candidates else None
+
 def apply_modifications(content: str, modifications: Dict[str, str]) -> str:
-    """修正を適用"""
-    modified_content = content
+    """修正を適用
+
+    SFC を1回だけ解析し、各セクションの内容部分をオフセット位置で差し替える。
+    開始タグの属性（lang="ts" など）は保持し、新しい内容はそのまま挿入する。
+    存在しないセクションは末尾に追加する。
+    """
+    blocks = parse_sfc_blocks(content)
     
+    splices = []  # (content_start, content_end, 新しい内容)
+    appended = []
     for section, new_content in modifications.items():
-        if section == "template":
-            # テンプレートセクションを置換
-            modified_content = re.sub(
-                r'<template[^>]*>(.*?)</template>',
-                f'<template>\n{new_content}\n</template>',
-                modified_content,
-                flags=re.DOTALL
-            )
-        elif section == "script":
-            # スクリプトセクションを置換
-            modified_content = re.sub(
-                r'<script[^>]*>(.*?)</script>',
-                f'<script setup>\n{new_content}\n</script>',
-                modified_content,
-                flags=re.DOTALL
-            )
-        elif section == "style":
-            # スタイルセクションを置換
-            modified_content = re.sub(
-                r'<style[^>]*>(.*?)</style>',
-                f'<style scoped>\n{new_content}\n</style>',
-                modified_content,
-                flags=re.DOTALL
-            )
+        if section not in _SECTION_DEFAULT_ATTRS:
+            continue
+        block = _find_section_block(blocks, section)
+        if block is None:
+            attrs = _SECTION_DEFAULT_ATTRS[section]
+            open_tag = f"<{section} {attrs}>" if attrs else f"<{section}>"
+            appended.append(f"\n{open_tag}\n{new_content}\n</{section}>\n")
+        else:
+            splices.append((block["content_start"], block["content_end"], f"\n{new_content}\n"))
+    
+    parts = []
+    pos = 0
+    for content_start, content_end, replacement in sorted(splices):
+        parts.append(content[pos:content_start])
+        parts.append(replacement)
+        pos = content_end
+    parts.append(content[pos:])
+    parts.extend(appended)
+    
+    return "".join(parts)
+
+# Vuetifyコンポーネントのマッピング
+#   from:   変換元のHTMLタグ
+#   to:     変換先のVuetifyタグ
+#   match:  変換条件となる属性（class はトークン単位で一致）
+#   drop:   変換時に取り除く属性（match に使った class トークンは自動で除去）
+#   rename: 属性名の変換（`:` / `v-bind:` 付きのバインディングにも適用）
+VUETIFY_TAG_MAPPINGS: Dict[str, Dict[str, Any]] = {
+    "button": {"from": "button", "to": "v-btn"},
+    "input": {"from": "input", "to": "v-text-field", "rename": {"value": "model-value"}},
+    "checkbox": {"from": "input", "to": "v-checkbox", "match": {"type": "checkbox"}, "drop": ["type"]},
+    "radio": {"from": "input", "to": "v-radio", "match": {"type": "radio"}, "drop": ["type"]},
+    "textarea": {"from": "textarea", "to": "v-textarea", "rename": {"value": "model-value"}},
+    "select": {"from": "select", "to": "v-select", "rename": {"value": "model-value"}},
+    "card": {"from": "div", "to": "v-card", "match": {"class": "card"}},
+    "form": {"from": "form", "to": "v-form"},
+    "image": {"from": "img", "to": "v-img"},
+    "divider": {"from": "hr", "to": "v-divider"},
+    "list": {"from": "ul", "to": "v-list"},
+    "list-item": {"from": "li", "to": "v-list-item"},
+    "table": {"from": "table", "to": "v-table"},
+}
+
+# 閉じタグを持たないHTML要素
+_VOID_ELEMENTS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+
+_TAG_TOKEN = re.compile(r'<!--.*?-->|<(/?)([A-Za-z][\w.:-]*)((?:[^>"\']|"[^"]*"|\'[^\']*\')*)>', re.DOTALL)
+_ATTR_TOKEN = re.compile(r'([^\s"\'=<>/]+)(?:(\s*=\s*)("[^"]*"|\'[^\']*\'|[^\s"\'=<>`]+))?')
+
+def _unquote(value: Optional[str]) -> str:
+    if value and value[0] in "\"'":
+        return value[1:-1]
+    return value or ""
+
+def _match_mapping(rule: Dict[str, Any], attrs: Dict[str, str]) -> bool:
+    """属性が変換条件を満たすか判定"""
+    for name, expected in rule.get("match", {}).items():
+        if name == "class":
+            if expected not in attrs.get("class", "").split():
+                return False
+        elif attrs.get(name) != expected:
+            return False
+    return True
+
+def _rewrite_attrs(raw_attrs: str, rule: Dict[str, Any]) -> str:
+    """属性文字列に drop / rename / class トークン除去を適用（それ以外の書式は保持）"""
+    drop = set(rule.get("drop", []))
+    rename = rule.get("rename", {})
+    class_token = rule.get("match", {}).get("class")
     
-    return modified_content
+    parts = []
+    pos = 0
+    for attr in _ATTR_TOKEN.finditer(raw_attrs):
+        name = attr.group(1)
+        prefix = ""
+        for binding in ("v-bind:", ":"):
+            if name.startswith(binding):
+                prefix, name = binding, name[len(binding):]
+                break
+        
+        if not prefix and (name in drop or (name == "class" and class_token)):
+            if name == "class" and name not in drop:
+                classes = [c for c in _unquote(attr.group(3)).split() if c != class_token]
+                if classes:
+                    parts.append(raw_attrs[pos:attr.start()])
+                    parts.append(f'class="{" ".join(classes)}"')
+                    pos = attr.end()
+                    continue
+            # 属性と直前の空白を取り除く
+            parts.append(raw_attrs[pos:attr.start()].rstrip())
+            pos = attr.end()
+        elif name in rename:
+            parts.append(raw_attrs[pos:attr.start()])
+            parts.append(prefix + rename[name] + raw_attrs[attr.end(1):attr.end()])
+            pos = attr.end()
+    parts.append(raw_attrs[pos:])
+    
+    return "".join(parts)
+
+@lru_cache(maxsize=64)
+def _compile_vuetify_rewriter(components: tuple) -> Dict[str, List[Dict[str, Any]]]:
+    """要求されたコンポーネントから 変換元タグ -> ルール一覧 の表を作成
+
+    条件付きのルール（match あり）を条件なしのルールより先に評価する。
+    """
+    rules: Dict[str, List[Dict[str, Any]]] = {}
+    for component in components:
+        if component in VUETIFY_TAG_MAPPINGS:
+            rule = VUETIFY_TAG_MAPPINGS[component]
+            rules.setdefault(rule["from"], []).append(rule)
+    for tag_rules in rules.values():
+        tag_rules.sort(key=lambda r: not r.get("match"))
+    return rules
 
 def integrate_vuetify_component(base_template: str, vuetify_components: List[str]) -> str:
-    """Vuetifyコンポーネントをテンプレートに統合"""
-    enhanced_template = base_template
+    """Vuetifyコンポーネントをテンプレートに統合
+
+    マッピング表をタグ単位のルール表にまとめ、テンプレートを1回だけ走査して
+    開始タグ・閉じタグ・自己終了タグと属性を同時に変換する。
+    """
+    rules = _compile_vuetify_rewriter(tuple(vuetify_components))
+    if not rules:
+        return base_template
     
-    # Vuetifyコンポーネントのマッピング
-    vuetify_mapping = {
-        "button": {"from": r'<button([^>]*)>', "to": r'<v-btn\1>'},
-        "input": {"from": r'<input([^>]*)>', "to": r'<v-text-field\1>'},
-        "card": {"from": r'<div class="card"([^>]*)>', "to": r'<v-card\1>'},
-        "form": {"from": r'<form([^>]*)>', "to": r'<v-form\1>'}
-    }
+    # 変換対象タグごとの開始タグのスタック（変換後のタグ名、未変換なら None）
+    open_stacks: Dict[str, List[Optional[str]]] = {}
+    parts = []
+    pos = 0
     
-    for component in vuetify_components:
-        if component in vuetify_mapping:
-            mapping = vuetify_mapping[component]
-            enhanced_template = re.sub(
-                mapping["from"],
-                mapping["to"],
-                enhanced_template
-            )
+    for token in _TAG_TOKEN.finditer(base_template):
+        tag = token.group(2)
+        if tag is None or tag.lower() not in rules:
+            continue
+        tag = tag.lower()
+        
+        if token.group(1):  # 閉じタグ
+            stack = open_stacks.get(tag)
+            target = stack.pop() if stack else None
+            if target:
+                parts.append(base_template[pos:token.start()])
+                parts.append(f"</{target}>")
+                pos = token.end()
+            continue
+        
+        raw_attrs = token.group(3)
+        self_closing = raw_attrs.rstrip().endswith("/")
+        if self_closing:
+            raw_attrs = raw_attrs.rstrip()[:-1]
+        attrs = {m.group(1): _unquote(m.group(3)) for m in _ATTR_TOKEN.finditer(raw_attrs)}
+        
+        rule = next((r for r in rules[tag] if _match_mapping(r, attrs)), None)
+        if not (self_closing or tag in _VOID_ELEMENTS):
+            open_stacks.setdefault(tag, []).append(rule["to"] if rule else None)
+        if rule is None:
+            continue
+        
+        new_attrs = _rewrite_attrs(raw_attrs, rule).rstrip()
+        closing = " />" if (self_closing or tag in _VOID_ELEMENTS) else ">"
+        parts.append(base_template[pos:token.start()])
+        parts.append(f"<{rule['to']}{new_attrs}{closing}")
+        pos = token.end()
     
-    return enhanced_template
+    parts.append(base_template[pos:])
+    return "".join(parts)
 
 def analyze_project_structure() -> Dict[str, Any]:
-    """プロジェクト構造を分析"""
+    """プロジェクト構造を分析
+
+    結果はプロジェクトインデックス（project_index）から取得し、
+    変更のあったファイルだけが再解析される。
+    """
     try:
+        index = get_project_index().structure()
+        
         structure = {
-            "vue_components": [],
-            "package_json": None,
-            "vite_config": None,
-            "dependencies": []
+            "vue_components": index["sfcs"],
+            "views": index["views"],
+            "pages": index["pages"],
+            "routes": index["routes"],
+            "assets": index["assets"],
+            "package_json": index["package_json"],
+            "vite_config": index["vite_config"],
+            "dependencies": index["dependencies"],
+            "dev_dependencies": index["dev_dependencies"]
         }
         
-        # src/components/のVueファイルを取得
-        components_dir = Path("../src/components")
-        if components_dir.exists():
-            structure["vue_components"] = [
-                f.name for f in components_dir.glob("*.vue")
-            ]
-        
-        # package.jsonを分析
-        package_json_path = Path("../package.json")
-        if package_json_path.exists():
-            with open(package_json_path, 'r') as f:
-                package_data = json.load(f)
-                structure["package_json"] = package_data
-                structure["dependencies"] = list(package_data.get("dependencies", {}).keys())
-        
         return {
             "status": "success",
             "structure": structure,
-            "vuetify_installed": "vuetify" in structure["dependencies"],
+            "vuetify_installed": "vuetify" in structure["dependencies"] + structure["dev_dependencies"],
             "project_type": "Vue 3 + Vite"
         }
     except Exception as e:
@@ -155,176 +515,15 @@ def analyze_project_structure() -> Dict[str, Any]:
 def generate_improved_signup_component(analysis_results: Dict[str, Any]) -> Dict[str, Any]:
     """SignUpコンポーネントの改善版を生成"""
     
-    # 分析結果に基づいて改善されたテンプレートを生成
-    improved_template = """  <v-container class="signup-container">
-    <v-row justify="center">
-      <v-col cols="12" md="6" lg="4">
-        <v-card class="signup-card" elevation="8">
-          <v-card-title class="signup-title">
-            <h2>アカウント作成</h2>
-          </v-card-title>
-          
-          <v-card-text>
-            <v-form ref="signupForm" v-model="isFormValid">
-              <v-text-field
-                v-model="email"
-                label="メールアドレス"
-                type="email"
-                :rules="emailRules"
-                variant="outlined"
-                prepend-inner-icon="mdi-email"
-                required
-              />
-              
-              <v-text-field
-                v-model="password"
-                label="パスワード"
-                :type="showPassword ? 'text' : 'password'"
-                :rules="passwordRules"
-                variant="outlined"
-                prepend-inner-icon="mdi-lock"
-                :append-inner-icon="showPassword ? 'mdi-eye' : 'mdi-eye-off'"
-                @click:append-inner="showPassword = !showPassword"
-                required
-              />
-              
-              <v-text-field
-                v-model="confirmPassword"
-                label="パスワード確認"
-                :type="showConfirmPassword ? 'text' : 'password'"
-                :rules="confirmPasswordRules"
-                variant="outlined"
-                prepend-inner-icon="mdi-lock-check"
-                :append-inner-icon="showConfirmPassword ? 'mdi-eye' : 'mdi-eye-off'"
-                @click:append-inner="showConfirmPassword = !showConfirmPassword"
-                required
-              />
-              
-              <v-btn
-                :disabled="!isFormValid || isLoading"
-                :loading="isLoading"
-                color="success"
-                size="large"
-                variant="elevated"
-                block
-                @click="handleSignup"
-                class="signup-button"
-              >
-                アカウント作成
-              </v-btn>
-            </v-form>
-          </v-card-text>
-        </v-card>
-      </v-col>
-    </v-row>
-  </v-container>"""
-    
-    improved_script = """import { ref, computed } from 'vue'
-
-const isFormValid = ref(false)
-const isLoading = ref(false)
-const showPassword = ref(false)
-const showConfirmPassword = ref(false)
-
-const email = ref('')
-const password = ref('')
-const confirmPassword = ref('')
-
-const emailRules = [
-  v => !!v || 'メールアドレスは必須です',
-  v => /.+@.+\..+/.test(v) || 'メールアドレスの形式が正しくありません'
-]
-
-const passwordRules = [
-  v => !!v || 'パスワードは必須です',
-  v => v.length >= 8 || 'パスワードは8文字以上で入力してください',
-  v => /[A-Z]/.test(v) || 'パスワードには大文字を含めてください',
-  v => /[0-9]/.test(v) || 'パスワードには数字を含めてください'
-]
-
-const confirmPasswordRules = [
-  v => !!v || 'パスワード確認は必須です',
-  v => v === password.value || 'パスワードが一致しません'
-]
-
-const handleSignup = async () => {
-  if (!isFormValid.value) return
-  
-  isLoading.value = true
-  
-  try {
-    // サインアップ処理をここに実装
-    console.log('サインアップ処理', {
-      email: email.value,
-      password: password.value
-    })
-    
-    // 成功時の処理
-    alert('アカウントが正常に作成されました')
-    
-  } catch (error) {
-    console.error('サインアップエラー:', error)
-    alert('エラーが発生しました。再度お試しください。')
-  } finally {
-    isLoading.value = false
-  }
-}"""
-    
-    improved_style = """.signup-container {
-  min-height: 100vh;
-  display: flex;
-  align-items: center;
-  background: linear-gradient(135deg, #e8f5e8, #f1f8e9);
-}
-
-.signup-card {
-  background: white;
-  border-radius: 16px;
-  box-shadow: 0 8px 32px rgba(46, 125, 50, 0.1);
-  transition: all 0.3s ease;
-}
-
-.signup-card:hover {
-  transform: translateY(-2px);
-  box-shadow: 0 12px 48px rgba(46, 125, 50, 0.15);
-}
-
-.signup-title {
-  text-align: center;
-  padding: 24px 24px 16px;
-  background: linear-gradient(45deg, #2e7d32, #388e3c);
-  color: white;
-  border-radius: 16px 16px 0 0;
-}
-
-.signup-title h2 {
-  margin: 0;
-  font-weight: 300;
-  font-size: 1.5rem;
-}
-
-.signup-button {
-  margin-top: 16px;
-  height: 48px;
-  font-weight: 600;
-  text-transform: none;
-  letter-spacing: 0.5px;
-}
-
-.v-text-field {
-  margin-bottom: 8px;
-}
-
-.v-card-text {
-  padding: 24px;
-}"""
+    # 分析結果に基づいて改善されたテンプレートを生成（component_templates/signup.vue）
+    improved = get_template_registry().render("signup")
     
     return {
         "status": "success",
         "improved_component": {
-            "template": improved_template,
-            "script": improved_script,
-            "style": improved_style,
+            "template": improved["template"],
+            "script": improved["script"],
+            "style": improved["style"],
             "filename": "ImprovedSignUp.vue"
         },
         "improvements": [
@@ -337,72 +536,130 @@ const handleSignup = async () => {
         ]
     }
 
-def update_app_vue_imports(new_components: List[str]) -> Dict[str, Any]:
-    """App.vueのimport文を更新"""
+def _line_end(script: str, offset: int) -> int:
+    end = script.find("\n", offset)
+    return len(script) if end < 0 else end
+
+def _parse_script_imports(script: str) -> Dict[str, Any]:
+    """script 内の import 文と defineAsyncComponent 宣言を解析（コメント・文字列内は除く）
+
+    end は文の行末の位置（新しい行の挿入位置として使用する）。
+    """
+    index = build_script_index(script)
+    imports = [
+        {
+            "default": i["default"],
+            "named": i["named"],
+            "source": i["source"],
+            "start": i["start"],
+            "end": _line_end(script, i["end"])
+        }
+        for i in index.imports
+    ]
+    async_components = [
+        {"name": call["assigned_to"], "start": call["start"], "end": _line_end(script, call["end"])}
+        for call in index.calls_of(("defineAsyncComponent",))
+        if call["assigned_to"] and call["depth"] == 0
+    ]
+    return {"imports": imports, "async_components": async_components}
+
+@_session_scoped
+def update_app_vue_imports(
+    new_components: List[str],
+    async_import: bool = False,
+    tool_context: Optional[ToolContext] = None
+) -> Dict[str, Any]:
+    """App.vueのimport文を更新
+
+    既存の import を解析して不足分だけを求め、重複を除いてソートした上で
+    1回の差し込みで追加する。内容が変わらない場合はファイルを書き込まない。
+
+    Args:
+        new_components: 追加するコンポーネント名（src/components/ 配下）
+        async_import: True の場合 defineAsyncComponent による遅延読み込みで登録
+    """
     try:
-        app_vue_path = "../src/App.vue"
+        app_vue_path = str(PROJECT_ROOT / "src" / "App.vue")
         
-        if not os.path.exists(app_vue_path):
+        if not path_exists(app_vue_path):
             return {"status": "error", "message": "App.vueファイルが見つかりません"}
         
-        with open(app_vue_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        content = read_text(app_vue_path)
+        
+        blocks = parse_sfc_blocks(content)
+        script_block = _find_section_block(blocks, "script")
+        if script_block is not None and not re.search(r'\bsetup\b', script_block["attrs"]):
+            script_block = None
+        script = content[script_block["content_start"]:script_block["content_end"]] if script_block else ""
+        
+        parsed = _parse_script_imports(script)
+        declared = {i["default"] for i in parsed["imports"] if i["default"]}
+        declared.update(n for i in parsed["imports"] for n in i["named"])
+        declared.update(a["name"] for a in parsed["async_components"])
         
-        # 新しいimport文を追加
-        for component in new_components:
-            import_line = f"import {component} from './components/{component}.vue'"
-            if import_line not in content:
-                # script setup セクションに追加
-                script_match = re.search(r'(<script setup>)(.*?)(</script>)', content, re.DOTALL)
-                if script_match:
-                    before = script_match.group(1)
-                    current_content = script_match.group(2)
-                    after = script_match.group(3)
-                    
-                    new_content = f"{before}\n{import_line}{current_content}{after}"
-                    content = content.replace(script_match.group(0), new_content)
+        missing = sorted(set(new_components) - declared)
         
-        # ファイルを更新
-        with open(app_vue_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        new_lines = []
+        if async_import and missing and "defineAsyncComponent" not in declared:
+            new_lines.append("import { defineAsyncComponent } from 'vue'")
+        for component in missing:
+            if async_import:
+                new_lines.append(
+                    f"const {component} = defineAsyncComponent(() => import('./components/{component}.vue'))"
+                )
+            else:
+                new_lines.append(f"import {component} from './components/{component}.vue'")
+        
+        if new_lines:
+            # 既存の import / 非同期コンポーネント宣言の直後（なければ script の先頭）に挿入
+            anchors = [i["end"] for i in parsed["imports"]] + [a["end"] for a in parsed["async_components"]]
+            insert_text = "\n".join(new_lines)
+            if script_block is None:
+                content = f"<script setup>\n{insert_text}\n</script>\n\n{content}"
+            else:
+                offset = script_block["content_start"] + max(anchors, default=0)
+                content = content[:offset] + "\n" + insert_text + content[offset:]
+            
+            _write_files({app_vue_path: content})
         
         return {
             "status": "success",
-            "message": "App.vueを更新しました",
-            "components_added": new_components
+            "message": "App.vueを更新しました" if new_lines else "App.vueは最新です",
+            "components_added": missing,
+            "async_import": async_import,
+            "file_changed": bool(new_lines)
         }
     except Exception as e:
         return {"status": "error", "message": str(e)}
 
 def create_component_from_template(template_name: str, customizations: Dict[str, Any]) -> Dict[str, Any]:
-    """テンプレートからコンポーネントを作成"""
+    """テンプレートからコンポーネントを作成
+
+    テンプレートは component_templates/{template_name}.vue から読み込まれる。
+    customizations の template / script / style キーはセクション全体を置き換え、
+    それ以外のキーはテンプレート内のプレースホルダー（{% name %}）を置換する。
+    """
+    registry = get_template_registry()
     
-    templates = {
-        "form": {
-            "template": "<v-form><v-text-field label='入力してください' /></v-form>",
-            "script": "import { ref } from 'vue'\nconst formData = ref('')",
-            "style": ".v-form { padding: 16px; }"
-        },
-        "card": {
-            "template": "<v-card><v-card-title>タイトル</v-card-title></v-card>",
-            "script": "// カード用のスクリプト",
-            "style": ".v-card { margin: 16px; }"
+    try:
+        customized_template = registry.render(template_name, customizations)
+    except KeyError:
+        return {
+            "status": "error",
+            "message": f"テンプレート '{template_name}' が見つかりません",
+            "available_templates": registry.names()
         }
-    }
-    
-    if template_name not in templates:
-        return {"status": "error", "message": f"テンプレート '{template_name}' が見つかりません"}
-    
-    base_template = templates[template_name]
-    
-    # カスタマイゼーションを適用
-    customized_template = base_template.copy()
-    for key, value in customizations.items():
-        if key in customized_template:
-            customized_template[key] = value
     
     return {
         "status": "success",
         "component": customized_template,
         "message": f"テンプレート '{template_name}' からコンポーネントを作成しました"
-    } 
\ No newline at end of file
+    }
+
+def list_component_templates() -> Dict[str, Any]:
+    """利用可能なコンポーネントテンプレートとプレースホルダーの一覧を取得"""
+    registry = get_template_registry()
+    return {
+        "status": "success",
+        "templates": {name: registry.placeholders(name) for name in registry.names()}
+    }
@@ -0,0 +1,426 @@
+"""
+Vuetify コンポーネントカタログ
+
+`node_modules/vuetify/dist/json` の tags.json / attributes.json / web-types.json /
+importMap.json を初回使用時にコンポーネント → props・イベント・スロット・import パスの
+コンパクトなインデックスに変換し、pickle で保存する（既定では
+`adk-agents/.cache/vuetify_catalog.pickle`）。Vuetify のバージョンかメタデータの
+mtime / size が変わった場合だけ再構築する。
+
+テンプレートの検証は要素・属性ごとの辞書 / 集合の参照で行い、未定義の props は
+1文字削除のバリアント（SymSpell 方式）の参照で typo の候補を求める。
+"""
+
+import json
+import os
+import pickle
+import re
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, FrozenSet, Iterable, List, Optional, Tuple, Union
+
+from .project_index import PROJECT_ROOT
+from .ui_analysis_tools import parse_sfc_blocks
+from .vue_integration_tools import _ATTR_TOKEN, _TAG_TOKEN
+
+# キャッシュの形式（変更した場合は上げる）
+CATALOG_FORMAT = 1
+
+METADATA_FILES = ("tags.json", "attributes.json", "web-types.json", "importMap.json")
+
+# Vuetify のコンポーネントでもフォールスルーされる HTML の属性（入力系は内部の <input> に渡される）
+GLOBAL_ATTRIBUTES = frozenset({
+    "class", "style", "id", "key", "ref", "is", "slot", "role", "title", "tabindex", "lang", "dir", "hidden",
+    "type", "name", "required", "autocomplete", "autofocus", "min", "max", "step", "pattern", "minlength",
+    "maxlength", "size", "accept", "multiple",
+    "draggable", "contenteditable", "spellcheck", "translate", "inert", "accesskey", "autocapitalize",
+    "enterkeyhint", "inputmode", "part", "nonce", "alt", "src", "for", "form", "target", "rel", "download",
+})
+# v-bind / v-on は引数なし（v-bind="props" のようなオブジェクト展開）でもここに来る
+VUE_DIRECTIVES = frozenset({
+    "v-if", "v-else", "v-else-if", "v-for", "v-show", "v-html", "v-text", "v-once", "v-memo", "v-cloak", "v-pre",
+    "v-bind", "v-on",
+})
+# 閉じタグのない HTML 要素
+VOID_ELEMENTS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "param", "source", "track", "wbr",
+})
+# ネイティブの DOM イベント（ルート要素にフォールスルーされる）
+DOM_EVENTS = frozenset({
+    "click", "dblclick", "mousedown", "mouseup", "mouseenter", "mouseleave", "mouseover", "mouseout", "mousemove",
+    "contextmenu", "keydown", "keyup", "keypress", "focus", "blur", "focusin", "focusout", "input", "change",
+    "submit", "reset", "scroll", "wheel", "touchstart", "touchend", "touchmove", "touchcancel", "pointerdown",
+    "pointerup", "pointermove", "pointerenter", "pointerleave", "pointercancel", "dragstart", "drag", "dragend",
+    "dragenter", "dragleave", "dragover", "drop", "load", "error", "animationend", "transitionend", "paste",
+    "copy", "cut", "compositionstart", "compositionend", "select", "invalid",
+})
+
+
+def kebab_case(name: str) -> str:
+    """VBtn / modelValue → v-btn / model-value"""
+    return re.sub(r'(?<=[a-z0-9])([A-Z])|(?<=[A-Z])([A-Z])(?=[a-z])', r'-\1\2', name).lower()
+
+
+def _deletes(word: str) -> Iterable[str]:
+    """1文字削除したバリアント"""
+    return (word[:i] + word[i + 1:] for i in range(len(word)))
+
+
+def _edit_distance(a: str, b: str) -> int:
+    """Damerau-Levenshtein 距離（隣接文字の入れ替えを1とする）"""
+    previous2, previous = None, list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i] + [0] * len(b)
+        for j, cb in enumerate(b, 1):
+            current[j] = min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb))
+            if previous2 is not None and i > 1 and j > 1 and ca == b[j - 2] and a[i - 2] == cb:
+                current[j] = min(current[j], previous2[j - 2] + 1)
+        previous2, previous = previous, current
+    return previous[-1]
+
+
+def _variant_index(words: Iterable[str]) -> Dict[str, Tuple[str, ...]]:
+    """バリアント（単語自身と1文字削除）→ 単語"""
+    index: Dict[str, set] = {}
+    for word in words:
+        for variant in (word, *_deletes(word)):
+            index.setdefault(variant, set()).add(word)
+    return {variant: tuple(sorted(found)) for variant, found in index.items()}
+
+
+def _lookup_variants(index: Dict[str, Tuple[str, ...]], word: str, allowed: Optional[FrozenSet[str]] = None) -> List[str]:
+    """typo の候補（編集距離の近い順）"""
+    candidates = set()
+    for variant in (word, *_deletes(word)):
+        candidates.update(index.get(variant, ()))
+    if allowed is not None:
+        candidates &= allowed
+    candidates.discard(word)
+    ranked = sorted((_edit_distance(word, c), c) for c in candidates)
+    return [c for distance, c in ranked if distance <= 2]
+
+
+def compile_catalog(json_dir: Union[str, Path]) -> Dict[str, Any]:
+    """Vuetify のメタデータからカタログを作成"""
+    json_dir = Path(json_dir)
+    load = lambda name: json.loads((json_dir / name).read_text(encoding="utf-8"))
+    tags, attributes, web_types, import_map = (load(name) for name in METADATA_FILES)
+
+    components: Dict[str, Dict[str, Any]] = {}
+    for tag in web_types["contributions"]["html"]["tags"]:
+        name = tag["name"]
+        props = {kebab_case(attr["name"]): attr.get("value", {}).get("type", "") for attr in tag.get("attributes", [])}
+        for prop in tags.get(name, {}).get("attributes", []):
+            props.setdefault(prop, attributes.get(f"{name}/{prop}", {}).get("type", "").strip())
+        slots, slot_prefixes = set(), set()
+        for slot in tag.get("slots", []):
+            dynamic = re.fullmatch(r'\[`([\w.-]*)\$\{string\}`\]', slot["name"])
+            (slot_prefixes.add(dynamic.group(1)) if dynamic else slots.add(slot["name"]))
+        source = import_map["components"].get(name, {}).get("from")
+        model = tag.get("vue-model")
+        components[kebab_case(name)] = {
+            "name": name,
+            "props": {prop: value_type.strip() for prop, value_type in props.items()},
+            "events": frozenset(event["name"] for event in tag.get("events", [])),
+            "slots": frozenset(slots),
+            "slot_prefixes": tuple(sorted(slot_prefixes)),
+            "import": f"vuetify/{source}" if source else "vuetify/components",
+            "model": kebab_case(model["prop"]) if model else None,
+            "doc_url": tag.get("doc-url"),
+        }
+
+    directives = {}
+    for attr in web_types["contributions"]["html"].get("attributes", []):
+        if attr["name"].startswith("v-"):
+            symbol = attr.get("source", {}).get("symbol", "")
+            directives[attr["name"]] = {"import": "vuetify/directives", "symbol": symbol.replace("-", "").title() if symbol.islower() else symbol}
+
+    all_props = {prop for component in components.values() for prop in component["props"]}
+    all_events = {event for component in components.values() for event in component["events"]}
+    return {
+        "format": CATALOG_FORMAT,
+        "version": web_types.get("version"),
+        "components": components,
+        "directives": directives,
+        "prop_variants": _variant_index(all_props),
+        "event_variants": _variant_index(all_events | DOM_EVENTS),
+        "component_variants": _variant_index(components),
+    }
+
+
+class VuetifyCatalog:
+    """Vuetify のコンポーネントカタログ（props・イベント・スロット・import パス）"""
+
+    def __init__(
+        self,
+        root: Union[str, Path] = PROJECT_ROOT,
+        cache_path: Optional[Union[str, Path]] = None,
+    ):
+        self.json_dir = Path(root) / "node_modules" / "vuetify" / "dist" / "json"
+        self.cache_path = Path(cache_path) if cache_path else Path(__file__).resolve().parents[2] / ".cache" / "vuetify_catalog.pickle"
+        self._data: Optional[Dict[str, Any]] = None
+        self._prop_sets: Dict[str, FrozenSet[str]] = {}
+
+    # ------------------------------
+    # Load / compile
+    # ------------------------------
+    def _signature(self) -> List[Any]:
+        signature: List[Any] = [CATALOG_FORMAT]
+        for name in METADATA_FILES:
+            stat = (self.json_dir / name).stat()
+            signature.append([name, stat.st_mtime_ns, stat.st_size])
+        return signature
+
+    def _load(self) -> Dict[str, Any]:
+        if self._data is not None:
+            return self._data
+        signature = self._signature()  # メタデータがない場合は FileNotFoundError
+        try:
+            with open(self.cache_path, "rb") as f:
+                cached = pickle.load(f)
+            if cached.get("signature") == signature:
+                self._data = cached["catalog"]
+                return self._data
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, KeyError, TypeError):
+            pass
+
+        self._data = compile_catalog(self.json_dir)
+        self._save_cache(signature)
+        return self._data
+
+    def _save_cache(self, signature: List[Any]) -> None:
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            fd, temp_path = tempfile.mkstemp(dir=self.cache_path.parent, prefix=f".{self.cache_path.name}.")
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump({"signature": signature, "catalog": self._data}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, self.cache_path)
+        except OSError:
+            # キャッシュの保存失敗はカタログの利用に影響しない
+            pass
+
+    @property
+    def available(self) -> bool:
+        """Vuetify のメタデータがあるか"""
+        return all((self.json_dir / name).exists() for name in METADATA_FILES)
+
+    @property
+    def version(self) -> Optional[str]:
+        return self._load()["version"]
+
+    # ------------------------------
+    # Lookup
+    # ------------------------------
+    @staticmethod
+    def normalize_tag(tag: str) -> str:
+        return tag.lower() if "-" in tag else kebab_case(tag)
+
+    def component(self, tag: str) -> Optional[Dict[str, Any]]:
+        """コンポーネントの情報（v-btn / VBtn のどちらでもよい）"""
+        return self._load()["components"].get(self.normalize_tag(tag))
+
+    def components(self) -> List[str]:
+        return list(self._load()["components"])
+
+    def is_vuetify_tag(self, tag: str) -> bool:
+        return self.normalize_tag(tag).startswith("v-")
+
+    def _props(self, tag: str, component: Dict[str, Any]) -> FrozenSet[str]:
+        props = self._prop_sets.get(tag)
+        if props is None:
+            props = self._prop_sets[tag] = frozenset(component["props"])
+        return props
+
+    def suggest_prop(self, tag: str, prop: str) -> List[str]:
+        component = self.component(tag)
+        if component is None:
+            return []
+        return _lookup_variants(self._load()["prop_variants"], prop, self._props(self.normalize_tag(tag), component))
+
+    def suggest_event(self, tag: str, event: str) -> List[str]:
+        component = self.component(tag)
+        if component is None:
+            return []
+        return _lookup_variants(self._load()["event_variants"], event, component["events"] | DOM_EVENTS)
+
+    def suggest_component(self, tag: str) -> List[str]:
+        return _lookup_variants(self._load()["component_variants"], self.normalize_tag(tag))
+
+    def has_slot(self, component: Dict[str, Any], slot: str) -> bool:
+        return slot in component["slots"] or any(slot.startswith(prefix) for prefix in component["slot_prefixes"])
+
+    # ------------------------------
+    # Validation
+    # ------------------------------
+    def _check_attribute(self, tag: str, component: Dict[str, Any], name: str) -> Optional[Dict[str, Any]]:
+        """1つの属性を検証し、問題があれば返す"""
+        if name.startswith(("@", "v-on:")):
+            event = name[1:] if name.startswith("@") else name[len("v-on:"):]
+            event = event.split(".")[0]
+            if event.startswith("[") or event in component["events"] or event in DOM_EVENTS:
+                return None
+            camel_event = re.sub(r'-(\w)', lambda m: m.group(1).upper(), event)
+            if camel_event in component["events"]:
+                return None
+            suggestions = self.suggest_event(tag, event)
+            if not suggestions:
+                return None  # カスタムイベントはルート要素にフォールスルーされる
+            return {"rule": "vuetify.unknown-event", "severity": "medium", "attribute": name, "suggestions": suggestions,
+                    "message": f"<{tag}> に '{event}' イベントはありません。'{suggestions[0]}' の誤りではありませんか"}
+
+        if name.startswith(("#", "v-slot")):
+            return self._check_slot(tag, component, name)
+
+        if name.startswith("v-model"):
+            prop = kebab_case(name.split(":", 1)[1].split(".")[0]) if ":" in name else component["model"]
+            if prop and prop in component["props"]:
+                return None
+            return {"rule": "vuetify.invalid-v-model", "severity": "high", "attribute": name, "suggestions": [],
+                    "message": f"<{tag}> は {name} に対応していません"}
+
+        if name.startswith("v-") and not name.startswith("v-bind:"):
+            directive = name.split(":")[0].split(".")[0]
+            known = VUE_DIRECTIVES | self._load()["directives"].keys()
+            if directive in known:
+                return None
+            # アプリ側で登録したカスタムディレクティブの可能性があるので low とする
+            suggestions = [d for distance, d in sorted((_edit_distance(directive, d), d) for d in known) if distance <= 2]
+            return {"rule": "vuetify.unknown-directive", "severity": "low", "attribute": name, "suggestions": suggestions,
+                    "message": f"'{directive}' は Vue / Vuetify のディレクティブではありません"
+                               + (f"。'{suggestions[0]}' の誤りではありませんか" if suggestions else "（カスタムディレクティブの場合は登録を確認してください）")}
+
+        prop = name[len("v-bind:"):] if name.startswith("v-bind:") else name[1:] if name.startswith((":", ".")) else name
+        prop = prop.split(".")[0]
+        if not prop or prop.startswith("["):
+            return None
+        prop = kebab_case(prop)
+        if prop in component["props"] or prop in GLOBAL_ATTRIBUTES or prop.startswith(("aria-", "data-")):
+            return None
+        suggestions = self.suggest_prop(tag, prop)
+        if suggestions:
+            return {"rule": "vuetify.unknown-prop", "severity": "medium", "attribute": name, "suggestions": suggestions,
+                    "message": f"<{tag}> に '{prop}' プロパティはありません。'{suggestions[0]}' の誤りではありませんか"}
+        return {"rule": "vuetify.unknown-attribute", "severity": "low", "attribute": name, "suggestions": [],
+                "message": f"<{tag}> の '{prop}' は Vuetify のプロパティではありません（ルート要素の属性として渡されます）"}
+
+    def _check_slot(self, tag: str, component: Dict[str, Any], name: str) -> Optional[Dict[str, Any]]:
+        """#slot / v-slot:slot（component のスロット）を検証"""
+        slot = name[1:] if name.startswith("#") else name[len("v-slot:"):] if name.startswith("v-slot:") else "default"
+        if slot.startswith("[") or self.has_slot(component, slot):
+            return None
+        suggestions = [s for distance, s in sorted((_edit_distance(slot, s), s) for s in component["slots"]) if distance <= 2]
+        return {"rule": "vuetify.unknown-slot", "severity": "medium", "attribute": name, "suggestions": suggestions,
+                "message": f"<{tag}> に '{slot}' スロットはありません"
+                           + (f"。'{suggestions[0]}' の誤りではありませんか" if suggestions else "")}
+
+    def validate_template(self, template: str, start_line: int = 1) -> Dict[str, Any]:
+        """テンプレート内の Vuetify コンポーネントの使用を検証
+
+        Returns:
+            {"components": {tag: {"count", "import"}}, "issues": [{"rule", "severity", "line", "tag", "attribute", "suggestions", "message"}]}
+        """
+        used: Dict[str, Dict[str, Any]] = {}
+        issues = []
+        line, scanned = start_line, 0
+        # 開いている要素 [(タグ名, Vuetify コンポーネントの情報 or None)]（<template #slot> の親を求める）
+        open_elements: List[Tuple[str, Optional[Dict[str, Any]]]] = []
+        for token in _TAG_TOKEN.finditer(template):
+            tag = token.group(2)
+            if tag is None:
+                continue
+            line += template.count("\n", scanned, token.start())
+            scanned = token.start()
+            name = self.normalize_tag(tag) if self.is_vuetify_tag(tag) else tag.lower()
+
+            if token.group(1):  # 閉じタグ
+                for depth in range(len(open_elements) - 1, -1, -1):
+                    if open_elements[depth][0] == name:
+                        del open_elements[depth:]
+                        break
+                continue
+
+            attrs = token.group(3)
+            self_closing = attrs.rstrip().endswith("/")
+            attrs = attrs.rstrip().rstrip("/")
+
+            if name == "template" and open_elements and open_elements[-1][1] is not None:
+                # <template #slot> / <template v-slot:slot> は親のコンポーネントのスロット
+                parent_tag, parent = open_elements[-1]
+                for attr in _ATTR_TOKEN.finditer(attrs):
+                    if attr.group(1).startswith(("#", "v-slot")):
+                        issue = self._check_slot(parent_tag, parent, attr.group(1))
+                        if issue:
+                            issues.append({**issue, "line": line + attrs.count("\n", 0, attr.start()), "tag": parent_tag})
+
+            component = None
+            if self.is_vuetify_tag(tag):
+                component = self.component(name)
+                if component is None:
+                    suggestions = self.suggest_component(name)
+                    issues.append({
+                        "rule": "vuetify.unknown-component", "severity": "high", "line": line, "tag": tag, "attribute": None,
+                        "suggestions": suggestions,
+                        "message": f"<{tag}> は Vuetify のコンポーネントではありません"
+                                   + (f"。<{suggestions[0]}> の誤りではありませんか" if suggestions else ""),
+                    })
+                else:
+                    entry = used.setdefault(name, {"count": 0, "import": component["import"]})
+                    entry["count"] += 1
+                    for attr in _ATTR_TOKEN.finditer(attrs):
+                        issue = self._check_attribute(name, component, attr.group(1))
+                        if issue:
+                            issues.append({**issue, "line": line + attrs.count("\n", 0, attr.start()), "tag": name})
+
+            if not self_closing and name not in VOID_ELEMENTS:
+                open_elements.append((name, component))
+        return {"components": used, "issues": issues}
+
+    def validate_sfc(self, content: str) -> Dict[str, Any]:
+        """SFC の <template> を検証（行番号は SFC 内の位置）"""
+        template = next((block for block in parse_sfc_blocks(content) if block["type"] == "template"), None)
+        if template is None:
+            return {"components": {}, "issues": []}
+        return self.validate_template(
+            content[template["content_start"]:template["content_end"]],
+            start_line=content.count("\n", 0, template["content_start"]) + 1,
+        )
+
+
+_vuetify_catalog: Optional[VuetifyCatalog] = None
+
+
+def get_vuetify_catalog() -> VuetifyCatalog:
+    """プロセス共有の VuetifyCatalog を取得"""
+    global _vuetify_catalog
+    if _vuetify_catalog is None:
+        _vuetify_catalog = VuetifyCatalog()
+    return _vuetify_catalog
+
+
+def validate_vuetify_usage(component_code: str) -> Dict[str, Any]:
+    """Vue コンポーネントの Vuetify の使い方を検証する（未定義のコンポーネント・props の typo・イベント・スロット・v-model）
+
+    Args:
+        component_code: Vue.js コンポーネント（SFC）のコード、または <template> の中身
+
+    Returns:
+        {"status", "vuetify_version", "components": {タグ: {"count", "import"}}, "issues": [...], "issue_count"}
+    """
+    try:
+        catalog = get_vuetify_catalog()
+        if not catalog.available:
+            return {"status": "error", "message": "node_modules/vuetify/dist/json が見つかりません（npm install を実行してください）"}
+        # 先頭のタグが <template> / <script> / <style> なら SFC（<template #slot> を含むテンプレートと区別する）
+        if re.match(r'\s*(?:<!--.*?-->\s*)*<(?:template|script|style)\b', component_code, re.DOTALL):
+            result = catalog.validate_sfc(component_code)
+        else:
+            result = catalog.validate_template(component_code)
+        return {
+            "status": "success",
+            "vuetify_version": catalog.version,
+            "components": result["components"],
+            "issues": result["issues"],
+            "issue_count": len(result["issues"]),
+        }
+    except Exception as e:
+        return {"status": "error", "message": str(e)}
@@ -0,0 +1,267 @@
+"""
+エージェント / LLM / ツールのレイテンシトレース
+
+ADK のコールバック（before/after_agent・model・tool）でスパンを記録し、
+agent → tool → sub-agent の入れ子構造（AgentTool 経由のサブエージェントを含む）を
+親子関係として JSONL ファイルに出力する。
+
+環境変数:
+    UI_TRACE         "1" で有効化
+    UI_TRACE_FILE    出力先（既定: adk-agents/.cache/traces.jsonl）
+    UI_TRACE_FORMAT  "jsonl"（1行1スパン、既定）または "otlp"（OTLP/JSON のファイル形式）
+
+集計は `tools/trace_report.py` で行う。
+"""
+
+import contextvars
+import json
+import os
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+ENV_ENABLED = "UI_TRACE"
+ENV_FILE = "UI_TRACE_FILE"
+ENV_FORMAT = "UI_TRACE_FORMAT"
+
+DEFAULT_TRACE_FILE = Path(__file__).resolve().parents[1] / ".cache" / "traces.jsonl"
+
+# 現在のスパン (trace_id, span_id)
+_current_span: contextvars.ContextVar[Optional[Tuple[str, str]]] = contextvars.ContextVar(
+    "ui_trace_current_span", default=None
+)
+
+
+def _json_size(value: Any) -> int:
+    """値を JSON にした場合のバイト数（変換できない値は str で近似）"""
+    try:
+        if hasattr(value, "model_dump_json"):
+            return len(value.model_dump_json(exclude_none=True).encode("utf-8"))
+        if isinstance(value, (list, tuple)) and value and hasattr(value[0], "model_dump_json"):
+            return sum(_json_size(item) for item in value)
+        return len(json.dumps(value, ensure_ascii=False, default=str).encode("utf-8"))
+    except (TypeError, ValueError):
+        return len(str(value).encode("utf-8"))
+
+
+# ------------------------------
+# Exporters
+# ------------------------------
+class JsonlSpanExporter:
+    """1行1スパンの JSONL で出力"""
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+
+    def _line(self, span: Dict[str, Any]) -> str:
+        return json.dumps(span, ensure_ascii=False)
+
+    def export(self, span: Dict[str, Any]) -> None:
+        line = self._line(span) + "\n"
+        with self._lock:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(line)
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class OtlpFileSpanExporter(JsonlSpanExporter):
+    """OpenTelemetry のファイルエクスポーターと同じ OTLP/JSON 形式（1行1 ExportTraceServiceRequest）"""
+
+    def _line(self, span: Dict[str, Any]) -> str:
+        start_ns = int(span["start_time"] * 1e9)
+        attributes = {"kind": span["kind"], "session_id": span.get("session_id"), **span["attributes"]}
+        otlp_span = {
+            "traceId": span["trace_id"],
+            "spanId": span["span_id"],
+            "name": span["name"],
+            "kind": 1,
+            "startTimeUnixNano": str(start_ns),
+            "endTimeUnixNano": str(start_ns + int(span["duration_ms"] * 1e6)),
+            "attributes": [
+                {"key": key, "value": _otlp_value(value)}
+                for key, value in attributes.items() if value is not None
+            ],
+        }
+        if span["parent_id"]:
+            otlp_span["parentSpanId"] = span["parent_id"]
+        return json.dumps({
+            "resourceSpans": [{
+                "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": "ui_design_coordinator"}}]},
+                "scopeSpans": [{"scope": {"name": "ui_design_coordinator.tracing"}, "spans": [otlp_span]}],
+            }]
+        }, ensure_ascii=False)
+
+
+# ------------------------------
+# Tracer
+# ------------------------------
+class Tracer:
+    """ADK コールバックからスパンを記録するトレーサー"""
+
+    def __init__(self, exporter: Optional[JsonlSpanExporter] = None):
+        self.exporter = exporter
+        self._open: Dict[Any, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+
+    @classmethod
+    def from_env(cls) -> "Tracer":
+        if os.environ.get(ENV_ENABLED, "").lower() not in ("1", "true", "yes"):
+            return cls()
+        path = os.environ.get(ENV_FILE) or str(DEFAULT_TRACE_FILE)
+        exporter_cls = OtlpFileSpanExporter if os.environ.get(ENV_FORMAT, "").lower() == "otlp" else JsonlSpanExporter
+        return cls(exporter_cls(path))
+
+    def start_span(self, key: Any, name: str, kind: str, session_id: Optional[str] = None, **attributes: Any) -> None:
+        parent = _current_span.get()
+        span = {
+            "trace_id": parent[0] if parent else uuid.uuid4().hex,
+            "span_id": uuid.uuid4().hex[:16],
+            "parent_id": parent[1] if parent else None,
+            "name": name,
+            "kind": kind,
+            "session_id": session_id,
+            "start_time": time.time(),
+            "attributes": attributes,
+            "_start": time.perf_counter(),
+            "_parent": parent,
+        }
+        with self._lock:
+            stale = self._open.pop(key, None)
+            self._open[key] = span
+        if stale is not None:
+            # 対応する after コールバックが呼ばれなかったスパン（LLM エラーなど）
+            self._finish(stale, {"status": "incomplete"})
+        _current_span.set((span["trace_id"], span["span_id"]))
+
+    def end_span(self, key: Any, **attributes: Any) -> None:
+        with self._lock:
+            span = self._open.pop(key, None)
+        if span is None:
+            return
+        _current_span.set(span["_parent"])
+        self._finish(span, attributes)
+
+    def _finish(self, span: Dict[str, Any], attributes: Dict[str, Any]) -> None:
+        span["duration_ms"] = round((time.perf_counter() - span.pop("_start")) * 1000, 3)
+        span.pop("_parent")
+        span["attributes"].update(attributes)
+        self.exporter.export(span)
+
+    # ------------------------------
+    # ADK callbacks
+    # ------------------------------
+    def before_agent(self, callback_context) -> None:
+        self.start_span(
+            ("agent", callback_context.invocation_id, callback_context.agent_name),
+            f"agent:{callback_context.agent_name}",
+            "agent",
+            session_id=callback_context.session.id,
+        )
+        return None
+
+    def after_agent(self, callback_context) -> None:
+        self.end_span(("agent", callback_context.invocation_id, callback_context.agent_name))
+        return None
+
+    def before_model(self, callback_context, llm_request) -> None:
+        self.start_span(
+            ("model", callback_context.invocation_id, callback_context.agent_name),
+            f"llm:{llm_request.model or 'unknown'}",
+            "llm",
+            session_id=callback_context.session.id,
+            request_bytes=_json_size(llm_request.contents),
+            request_contents=len(llm_request.contents),
+        )
+        return None
+
+    def after_model(self, callback_context, llm_response) -> None:
+        # ストリーミングの途中経過は最後のレスポンスでまとめて記録する
+        if getattr(llm_response, "partial", False):
+            return None
+        usage = getattr(llm_response, "usage_metadata", None)
+        self.end_span(
+            ("model", callback_context.invocation_id, callback_context.agent_name),
+            response_bytes=_json_size(llm_response.content) if llm_response.content else 0,
+            prompt_tokens=getattr(usage, "prompt_token_count", None),
+            output_tokens=getattr(usage, "candidates_token_count", None),
+            error=llm_response.error_code,
+        )
+        return None
+
+    def before_tool(self, tool, args, tool_context) -> None:
+        from google.adk.tools.agent_tool import AgentTool
+
+        self.start_span(
+            ("tool", tool_context.invocation_id, tool_context.function_call_id or tool.name),
+            f"tool:{tool.name}",
+            "agent_tool" if isinstance(tool, AgentTool) else "tool",
+            session_id=tool_context.session.id,
+            args_bytes=_json_size(args),
+        )
+        return None
+
+    def after_tool(self, tool, args, tool_context, tool_response) -> None:
+        status = tool_response.get("status") if isinstance(tool_response, dict) else None
+        self.end_span(
+            ("tool", tool_context.invocation_id, tool_context.function_call_id or tool.name),
+            result_bytes=_json_size(tool_response),
+            status=status,
+        )
+        return None
+
+
+_tracer: Optional[Tracer] = None
+
+
+def get_tracer() -> Tracer:
+    """プロセス共有の Tracer を取得（環境変数 UI_TRACE で有効化）"""
+    global _tracer
+    if _tracer is None:
+        _tracer = Tracer.from_env()
+    return _tracer
+
+
+_CALLBACK_FIELDS = (
+    ("before_agent_callback", "before_agent"),
+    ("after_agent_callback", "after_agent"),
+    ("before_model_callback", "before_model"),
+    ("after_model_callback", "after_model"),
+    ("before_tool_callback", "before_tool"),
+    ("after_tool_callback", "after_tool"),
+)
+
+
+def instrument_agent(agent):
+    """エージェントにトレース用のコールバックを追加（トレース無効時は何もしない）
+
+    既存のコールバックより先に実行されるよう先頭に追加する
+    （トレースのコールバックは常に None を返すため、既存の動作は変わらない）。
+    """
+    tracer = get_tracer()
+    if not tracer.enabled:
+        return agent
+
+    for field, method in _CALLBACK_FIELDS:
+        callback = getattr(tracer, method)
+        existing = getattr(agent, field)
+        callbacks = existing if isinstance(existing, list) else [existing] if existing else []
+        if callback not in callbacks:
+            setattr(agent, field, [callback, *callbacks])
+    return agent